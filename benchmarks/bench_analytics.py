@@ -0,0 +1,149 @@
+"""
+Benchmark: the analytics dispatcher (analytics._Dispatcher) against local
+stand-in HTTP servers, no network access needed.
+
+  keep-alive : a server that answers every event, closing the connection
+               once midway. Reports submit() cost per event, the time
+               flush() takes to deliver the queue, and the connections used.
+  stalled    : a server that accepts connections and never answers, for
+               longer than the flush timeout. Checks that flush() returns
+               within its timeout, that the worker stays registered
+               meanwhile (so submit() does not start a second one), and that
+               a later flush() stops it.
+
+Run from the repository root with any Python:
+
+    python benchmarks/bench_analytics.py
+    python benchmarks/bench_analytics.py --events 5000 --flush-timeout 0.5 --socket-timeout 0.2
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src import analytics  # noqa: E402
+
+HEADERS = {'Content-Type': 'application/json', 'User-Agent': 'bench_analytics'}
+
+
+class KeepAliveServer(ThreadingHTTPServer):
+    """Records every event; drops the keep-alive connection after close_after events."""
+
+    daemon_threads = True
+
+    def __init__(self, close_after):
+        super().__init__(('127.0.0.1', 0), _EventHandler)
+        self.close_after = close_after
+        self.events = []
+        self.connections = 0
+        self.lock = threading.Lock()
+
+    @property
+    def endpoint(self):
+        return f'http://127.0.0.1:{self.server_port}/api/event'
+
+
+class _EventHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    wbufsize = -1
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        with self.server.lock:
+            self.server.events.append(json.loads(body))
+            close = len(self.server.events) == self.server.close_after
+        self.send_response(202)
+        self.send_header('Content-Length', '2')
+        if close:
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+
+def workers():
+    return sum(1 for thread in threading.enumerate() if thread.name == 'gv-pce-analytics')
+
+
+def keep_alive(events):
+    server = KeepAliveServer(close_after=events // 2)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    dispatcher = analytics._Dispatcher(server.endpoint, maxsize=events)
+
+    t0 = time.perf_counter()
+    for i in range(events):
+        dispatcher.submit({'name': 'bench', 'i': i}, HEADERS)
+    submit = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    dispatcher.flush(60.0)
+    flush = time.perf_counter() - t0
+    server.shutdown()
+
+    in_order = [event['i'] for event in server.events] == list(range(events))
+    print(f"keep-alive: {events} events, submit {submit / events * 1e6:.1f} us/event, "
+          f"flush {flush:.3f}s, received {len(server.events)} (in order: {in_order}), "
+          f"{server.connections} connections")
+    return len(server.events) == events and in_order
+
+
+def stalled(flush_timeout, socket_timeout):
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(16)
+    endpoint = f'http://127.0.0.1:{listener.getsockname()[1]}/api/event'
+    dispatcher = analytics._Dispatcher(endpoint, timeout=socket_timeout)
+
+    # Each event waits for two timed-out attempts: enough events to outlast the flush
+    stalled_events = int(flush_timeout / (2 * socket_timeout)) + 2
+    for i in range(stalled_events):
+        dispatcher.submit({'name': 'bench', 'i': i}, HEADERS)
+    t0 = time.perf_counter()
+    dispatcher.flush(flush_timeout)
+    flush = time.perf_counter() - t0
+    registered = dispatcher._thread is not None
+
+    # The worker is still waiting on the server: a new event must not start a second one
+    dispatcher.submit({'name': 'bench', 'i': stalled_events}, HEADERS)
+    peak = workers()
+    dispatcher.flush((stalled_events + 1) * 2 * socket_timeout + 5.0)
+    stopped = dispatcher._thread is None and workers() == 0
+    listener.close()
+
+    bounded = flush <= flush_timeout + 0.1
+    print(f"stalled: flush returned after {flush:.3f}s (timeout {flush_timeout}s), "
+          f"worker still registered: {registered}, at most {peak} worker(s), "
+          f"stopped by the next flush: {stopped}")
+    return bounded and registered and peak <= 1 and stopped
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--events', type=int, default=1000, help="events sent to the keep-alive server")
+    parser.add_argument('--flush-timeout', type=float, default=analytics._FLUSH_TIMEOUT,
+                        help="timeout of the flush() facing the stalled server")
+    parser.add_argument('--socket-timeout', type=float, default=0.5,
+                        help="request timeout of the dispatcher facing the stalled server")
+    args = parser.parse_args()
+
+    ok = keep_alive(args.events)
+    ok = stalled(args.flush_timeout, args.socket_timeout) and ok
+    if not ok:
+        print("error: unexpected dispatcher behaviour")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
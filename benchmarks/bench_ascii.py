@@ -0,0 +1,59 @@
+"""
+Benchmark: ASCII PLY encoding, np.savetxt vs the vectorized AsciiEncoder.
+
+Run from the repository root inside Blender's Python:
+    blender -b --factory-startup --python benchmarks/bench_ascii.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.formats.ascii import AsciiEncoder  # noqa: E402
+
+POINT_COUNTS = (10_000, 100_000, 1_000_000)
+
+# x y z nx ny nz red green blue intensity label
+FMT = ' '.join(['%.6f'] * 6 + ['%d'] * 3 + ['%.6f', '%d'])
+
+
+def make_columns(count):
+    rng = np.random.default_rng(0)
+    floats = [rng.normal(size=count).astype(np.float32) * 100 for _ in range(6)]
+    colors = [rng.integers(0, 256, count, dtype=np.uint8) for _ in range(3)]
+    return floats + colors + [rng.random(count, dtype=np.float32),
+                              rng.integers(0, 1000, count, dtype=np.int32)]
+
+
+def savetxt(f, columns):
+    np.savetxt(f, np.column_stack(columns), fmt=FMT)
+
+
+def encoder(f, columns):
+    AsciiEncoder(FMT).write(f, columns)
+
+
+class _CountingSink:
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, data):
+        self.bytes += len(data.encode() if isinstance(data, str) else data)
+
+
+def main():
+    print(f"{'points':>10} {'variant':>8} {'time [s]':>10} {'Mpts/s':>8} {'MB/s':>8}")
+    for count in POINT_COUNTS:
+        columns = make_columns(count)
+        for name, fn in (('savetxt', savetxt), ('encoder', encoder)):
+            sink = _CountingSink()
+            t0 = time.perf_counter()
+            fn(sink, columns)
+            elapsed = time.perf_counter() - t0
+            print(f"{count:>10} {name:>8} {elapsed:>10.3f} "
+                  f"{count / elapsed / 1e6:>8.2f} {sink.bytes / elapsed / 2**20:>8.1f}")
+
+
+main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: PlayCanvas compressed PLY encoding throughput and output size.
+
+Run from the repository root inside Blender's Python:
+    blender -b --factory-startup --python benchmarks/bench_compressed.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.formats.compressed import _CHUNK_DTYPE, _VERTEX_DTYPE, _SplatArrays  # noqa: E402
+
+SPLAT_COUNTS = (100_000, 1_000_000, 5_000_000)
+F_REST_COUNT = 45
+
+# Standard 3DGS PLY: x y z nx ny nz f_dc_0..2 f_rest_* opacity scale_0..2 rot_0..3
+STANDARD_BYTES_PER_SPLAT = 4 * (6 + 3 + F_REST_COUNT + 1 + 3 + 4)
+
+
+class _Buffers:
+    """Minimal stand-in for AttributeBuffers holding synthetic splat data."""
+
+    def __init__(self, count):
+        rng = np.random.default_rng(0)
+        self.count = count
+        self.matrix_world = np.eye(4)
+        self._buffers = {'position': rng.normal(size=(count, 3)).astype(np.float32) * 10}
+        for name, scale in [('opacity', 2.0)] + [(f'f_dc_{i}', 1.0) for i in range(3)] \
+                + [(f'scale_{i}', 1.0) for i in range(3)] + [(f'rot_{i}', 1.0) for i in range(4)]:
+            self._buffers[name] = rng.normal(size=count).astype(np.float32) * scale
+        self._sh = rng.normal(size=(F_REST_COUNT, count)).astype(np.float32) * 0.2
+
+    def get(self, name):
+        return self._buffers[name]
+
+    def float(self, name, default=0.0):
+        return self._buffers[name]
+
+    def float_block(self, names):
+        return self._sh[:len(names)]
+
+
+def main():
+    print(f"{'splats':>10} {'time [s]':>10} {'Msplats/s':>10} {'size [MB]':>10} "
+          f"{'3DGS [MB]':>10} {'ratio':>6}")
+    for count in SPLAT_COUNTS:
+        buffers = _Buffers(count)
+        t0 = time.perf_counter()
+        splats = _SplatArrays(count, F_REST_COUNT)
+        splats.add(buffers, 0, apply_transforms=False)
+        chunks = splats.encode()
+        elapsed = time.perf_counter() - t0
+
+        size = (len(chunks) * _CHUNK_DTYPE.itemsize
+                + count * (_VERTEX_DTYPE.itemsize + F_REST_COUNT))
+        standard = count * STANDARD_BYTES_PER_SPLAT
+        print(f"{count:>10} {elapsed:>10.3f} {count / elapsed / 1e6:>10.2f} "
+              f"{size / 2**20:>10.1f} {standard / 2**20:>10.1f} {standard / size:>6.2f}")
+
+
+main()
@@ -0,0 +1,233 @@
+"""
+Benchmark: end-to-end export throughput of export_ply (binary and ASCII),
+export_splat_ply and export_splat_bin on synthetic point clouds and splats.
+
+The export core does not need Blender: objects are stand-ins exposing
+Blender's attribute API (see standin.py), so the exporters run their real
+foreach_get / transform / pack / write path. Run from the repository root
+with any Python that has NumPy:
+
+    python benchmarks/bench_exporters.py
+    python benchmarks/bench_exporters.py --sizes 10K,1M --cases ply-binary --json before.json
+    python benchmarks/bench_exporters.py --json after.json --compare before.json
+
+Every (case, mix, size) runs in its own process so that peak RSS belongs to
+that export alone; it includes the synthetic input, reported separately as
+input MB. Output files are really written (to --tmpdir) and deleted.
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from src.formats import export_ply, export_splat_bin, export_splat_ply  # noqa: E402
+from standin import PLY_MIXES, SPLAT_MIXES, make_object  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+POINT_COUNTS = (10_000, 100_000, 1_000_000, 10_000_000, 50_000_000)
+
+# name → (exporter, extra keyword arguments, file extension, mixes, default mixes)
+CASES = {
+    'ply-binary': (export_ply, {}, '.ply', PLY_MIXES, ('xyz', 'scan', 'full')),
+    'ply-ascii': (export_ply, {'use_ascii': True}, '.ply', PLY_MIXES, ('xyz', 'scan')),
+    'splat-ply': (export_splat_ply, {}, '.ply', SPLAT_MIXES, ('sh0', 'sh3')),
+    'splat-bin': (export_splat_bin, {}, '.splat', SPLAT_MIXES, ('sh0',)),
+}
+
+# Object-to-world transform used with --transforms
+MATRIX_WORLD = np.array([
+    [0.0, -2.0, 0.0, 1.0],
+    [2.0, 0.0, 0.0, -3.0],
+    [0.0, 0.0, 2.0, 0.5],
+    [0.0, 0.0, 0.0, 1.0],
+])
+
+
+def parse_count(text):
+    text = text.strip().upper()
+    scale = {'K': 1_000, 'M': 1_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip('KM')) * scale)
+
+
+def peak_rss():
+    """Peak resident set size of this process in bytes, or None where unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def addon_version():
+    with open(os.path.join(ROOT, 'src', 'blender_manifest.toml'), encoding='utf-8') as f:
+        match = re.search(r'^version\s*=\s*"([^"]+)"', f.read(), re.MULTILINE)
+    return match.group(1) if match else None
+
+
+def git_revision():
+    try:
+        out = subprocess.run(['git', 'describe', '--always', '--dirty'], cwd=ROOT,
+                             capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+# ---------------------------------------------------------------------------
+# One measurement (child process)
+# ---------------------------------------------------------------------------
+
+def run_case(spec):
+    exporter, kwargs, ext, mixes, _ = CASES[spec['case']]
+    count, objects = spec['points'], spec['objects']
+    matrix_world = MATRIX_WORLD if spec['transforms'] else None
+    per_object = [count // objects + (i < count % objects) for i in range(objects)]
+    scene = [make_object(mixes[spec['mix']], n, seed=i, name=f'PointCloud.{i:03d}', matrix_world=matrix_world)
+             for i, n in enumerate(per_object)]
+
+    result = dict(spec, input_bytes=sum(obj.nbytes for obj in scene), baseline_rss=peak_rss())
+    fd, filepath = tempfile.mkstemp(suffix=ext, dir=spec['tmpdir'])
+    os.close(fd)
+    times = []
+    try:
+        for _ in range(spec['repeat']):
+            t0 = time.perf_counter()
+            success, message = exporter(scene, filepath, apply_transforms=spec['transforms'],
+                                        threads=spec['threads'], **kwargs)
+            times.append(time.perf_counter() - t0)
+            if not success:
+                result['error'] = message
+                break
+        result['file_bytes'] = os.path.getsize(filepath)
+    finally:
+        os.remove(filepath)
+
+    seconds = min(times)
+    result.update(
+        seconds=seconds,
+        points_per_sec=count / seconds,
+        bytes_per_sec=result['file_bytes'] / seconds,
+        peak_rss=peak_rss(),
+    )
+    return result
+
+
+def run_child(spec):
+    """Runs one measurement in a fresh interpreter and returns its result."""
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', json.dumps(spec)],
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        return dict(spec, error=(proc.stderr.strip().splitlines() or ['exit %d' % proc.returncode])[-1])
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def _mb(value):
+    return f"{value / 2**20:.1f}" if value is not None else '-'
+
+
+def print_header():
+    print(f"{'case':>10} {'mix':>5} {'points':>10} {'time [s]':>9} {'Mpts/s':>8} {'MB/s':>8} "
+          f"{'file [MB]':>10} {'input [MB]':>10} {'peak RSS [MB]':>13}")
+
+
+def print_row(r, baseline=None):
+    if 'error' in r:
+        print(f"{r['case']:>10} {r['mix']:>5} {r['points']:>10}  error: {r['error']}")
+        return
+    line = (f"{r['case']:>10} {r['mix']:>5} {r['points']:>10} {r['seconds']:>9.3f} "
+            f"{r['points_per_sec'] / 1e6:>8.2f} {r['bytes_per_sec'] / 2**20:>8.1f} "
+            f"{_mb(r['file_bytes']):>10} {_mb(r['input_bytes']):>10} {_mb(r['peak_rss']):>13}")
+    if baseline is not None:
+        line += f"  x{r['points_per_sec'] / baseline['points_per_sec']:.2f} vs baseline"
+    print(line, flush=True)
+
+
+def load_baseline(path):
+    with open(path, encoding='utf-8') as f:
+        report = json.load(f)
+    return {
+        (r['case'], r['mix'], r['points'], r['objects'], r['transforms'], r['threads']): r
+        for r in report['results'] if 'error' not in r
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default=','.join(str(n) for n in POINT_COUNTS),
+                        help="comma-separated point counts, K/M suffixes allowed (default: 10K..50M)")
+    parser.add_argument('--cases', default=','.join(CASES), help=f"subset of {', '.join(CASES)}")
+    parser.add_argument('--mixes', default=None,
+                        help=f"attribute mixes (point clouds: {', '.join(PLY_MIXES)}; "
+                             f"splats: {', '.join(SPLAT_MIXES)}); default: per case")
+    parser.add_argument('--objects', type=int, default=1, help="split the points over this many objects")
+    parser.add_argument('--threads', type=int, default=1, help="exporter worker threads")
+    parser.add_argument('--transforms', action='store_true', help="apply a non-identity world matrix")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per measurement, the fastest is kept")
+    parser.add_argument('--tmpdir', default=tempfile.gettempdir(), help="where output files are written")
+    parser.add_argument('--json', help="write machine-readable results to this file")
+    parser.add_argument('--compare', help="results file of an earlier run to compare points/sec against")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_case(json.loads(args.child))))
+        return
+
+    sizes = [parse_count(s) for s in args.sizes.split(',') if s.strip()]
+    cases = [c.strip() for c in args.cases.split(',') if c.strip()]
+    for case in cases:
+        if case not in CASES:
+            parser.error(f"unknown case '{case}'")
+    requested_mixes = [m.strip() for m in args.mixes.split(',')] if args.mixes else None
+    baseline = load_baseline(args.compare) if args.compare else {}
+
+    results = []
+    print_header()
+    for case in cases:
+        _, _, _, mixes, default_mixes = CASES[case]
+        case_mixes = [m for m in requested_mixes if m in mixes] if requested_mixes else default_mixes
+        for mix in case_mixes:
+            for count in sizes:
+                spec = dict(case=case, mix=mix, points=count, objects=args.objects,
+                            transforms=args.transforms, threads=args.threads,
+                            repeat=args.repeat, tmpdir=args.tmpdir)
+                result = run_child(spec)
+                key = (case, mix, count, args.objects, args.transforms, args.threads)
+                print_row(result, baseline.get(key) if 'error' not in result else None)
+                results.append(result)
+
+    if args.json:
+        report = {
+            'version': addon_version(),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            'cpu_count': os.cpu_count(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'results': results,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: binary PLY record packing, legacy (np.zeros + tobytes) vs RecordWriter.
+
+Run from the repository root with any Python that has NumPy (no bpy needed):
+
+    python benchmarks/bench_records.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.formats.records import RecordWriter  # noqa: E402
+
+POINT_COUNTS = (100_000, 1_000_000, 5_000_000)
+OBJECTS = 4
+FIELDS = [(n, 'f4') for n in ('x', 'y', 'z', 'nx', 'ny', 'nz', 'intensity')] + \
+         [(n, 'u1') for n in ('red', 'green', 'blue')]
+
+
+def make_columns(count):
+    rng = np.random.default_rng(0)
+    return {
+        name: (rng.random(count, dtype=np.float32) if t == 'f4'
+               else rng.integers(0, 256, count, dtype=np.uint8))
+        for name, t in FIELDS
+    }
+
+
+def legacy(f, columns, count):
+    for _ in range(OBJECTS):
+        structured = np.zeros(count, dtype=FIELDS)
+        for name, col in columns.items():
+            structured[name] = col
+        f.write(structured.tobytes())
+
+
+def packed(f, columns, count):
+    writer = RecordWriter(f, FIELDS)
+    for _ in range(OBJECTS):
+        records = writer.records(count)
+        for name, col in columns.items():
+            records[name] = col
+        writer.write(records)
+
+
+def measure(fn, columns, count):
+    # Written to the null device so that disk throughput does not mask packing cost.
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    with open(os.devnull, 'wb') as f:
+        fn(f, columns, count)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    print(f"{'points':>10} {'variant':>8} {'time [s]':>10} {'peak [MB]':>10}")
+    for count in POINT_COUNTS:
+        columns = make_columns(count)
+        for name, fn in (('legacy', legacy), ('packed', packed)):
+            elapsed, peak = measure(fn, columns, count)
+            print(f"{count:>10} {name:>8} {elapsed:>10.3f} {peak / 2**20:>10.1f}")
+
+
+main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: spatial reordering cost and its effect on the compression ratio.
+
+Run from the repository root inside Blender's Python:
+    blender -b --factory-startup --python benchmarks/bench_reorder.py
+"""
+import os
+import sys
+import time
+import zlib
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.formats.reorder import REORDER_MODES, spatial_order  # noqa: E402
+
+POINT_COUNTS = (100_000, 1_000_000, 5_000_000)
+FIELDS = [('x', 'f4'), ('y', 'f4'), ('z', 'f4'), ('red', 'u1'), ('green', 'u1'), ('blue', 'u1')]
+
+
+def make_cloud(count):
+    """A scanned-surface stand-in: a noisy sphere colored by position, in random order."""
+    rng = np.random.default_rng(0)
+    direction = rng.normal(size=(count, 3))
+    direction /= np.linalg.norm(direction, axis=1, keepdims=True)
+    position = (direction * (10 + rng.normal(scale=0.05, size=(count, 1)))).astype(np.float32)
+    color = ((direction * 0.5 + 0.5) * 255).astype(np.uint8)
+    return position, color
+
+
+def pack(position, color):
+    records = np.empty(len(position), dtype=FIELDS)
+    for i, axis in enumerate('xyz'):
+        records[axis] = position[:, i]
+    for i, channel in enumerate(('red', 'green', 'blue')):
+        records[channel] = color[:, i]
+    return records.tobytes()
+
+
+def main():
+    print(f"{'points':>10} {'mode':>8} {'sort [s]':>9} {'gather [s]':>11} {'gzip ratio':>11}")
+    for count in POINT_COUNTS:
+        position, color = make_cloud(count)
+        for mode in REORDER_MODES:
+            t0 = time.perf_counter()
+            order = spatial_order(position, mode)
+            t1 = time.perf_counter()
+            if order is not None:
+                ordered = (np.take(position, order, axis=0), np.take(color, order, axis=0))
+            else:
+                ordered = (position, color)
+            t2 = time.perf_counter()
+
+            data = pack(*ordered)
+            ratio = len(data) / len(zlib.compress(data, 6))
+            print(f"{count:>10} {mode:>8} {t1 - t0:>9.3f} {t2 - t1:>11.3f} {ratio:>11.3f}")
+
+
+main()
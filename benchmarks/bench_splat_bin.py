@@ -0,0 +1,108 @@
+"""
+Benchmark: the fused .splat encoder (splat._SplatBinEncoder) against the
+previous encoder, which built each chunk from full-size NumPy temporaries.
+
+Both pack the same synthetic splats into one RecordWriter chunk (the whole
+object, as with chunk_size=0), and their records are checked to be
+identical. Reported per encoder: best time over --repeat runs and the peak
+of memory allocated while encoding (tracemalloc, which NumPy reports to),
+next to the size of the records themselves. Run from the repository root
+with any Python that has NumPy:
+
+    python benchmarks/bench_splat_bin.py
+    python benchmarks/bench_splat_bin.py --sizes 1M,10M --transforms
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_exporters import MATRIX_WORLD, parse_count  # noqa: E402
+from src.formats.attributes import AttributeBuffers  # noqa: E402
+from src.formats.records import RecordWriter, iter_chunks  # noqa: E402
+from src.formats.splat import (  # noqa: E402
+    _SH_C0, _SPLAT_BIN_ATTRS, _SPLAT_BIN_DTYPE, _extract_splat_bin_data, _transformed_positions,
+    _transformed_splats,
+)
+from standin import SPLAT_MIXES, make_object  # noqa: E402
+
+
+def previous_splat_bin_data(buffers, apply_transforms, writer, chunk_size=0):
+    """The encoder replaced by _SplatBinEncoder, kept as the baseline."""
+    scale_cols = [buffers.float(f'scale_{i}', 0.0) for i in range(3)]
+    dc_cols = [buffers.float(f'f_dc_{i}') for i in range(3)]
+    opacity_col = buffers.float('opacity', 0.0)
+    rot_cols = [buffers.float(f'rot_{i}', 0.0) for i in range(4)]
+
+    for start, stop in iter_chunks(buffers.count, chunk_size):
+        pos = _transformed_positions(buffers, apply_transforms, start, stop)
+        log_scales, rot = _transformed_splats(buffers, apply_transforms, scale_cols, rot_cols, start, stop)
+        scales = np.exp(log_scales)
+        dc = np.stack([col[start:stop] for col in dc_cols], axis=1)
+        rgb = np.clip((0.5 + _SH_C0 * dc) * 255.0, 0, 255).astype(np.uint8)
+        opacity = opacity_col[start:stop]
+        alpha = np.clip((1.0 / (1.0 + np.exp(-opacity))) * 255.0, 0, 255).astype(np.uint8)
+        norms = np.linalg.norm(rot, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        rot_norm = rot / norms
+        rot_u8 = np.clip((0.5 + rot_norm * 0.5) * 255.0, 0, 255).astype(np.uint8)
+
+        structured = writer.records(stop - start)
+        for i, axis in enumerate('xyz'):
+            structured[axis] = pos[:, i]
+            structured['s' + axis] = scales[:, i]
+        for i, channel in enumerate('rgb'):
+            structured[channel] = rgb[:, i]
+        structured['a'] = alpha
+        for i in range(4):
+            structured[f'q{i}'] = rot_u8[:, i]
+        yield structured
+
+
+ENCODERS = {'previous': previous_splat_bin_data, 'fused': _extract_splat_bin_data}
+
+
+def measure(encode, buffers, apply_transforms):
+    """Returns (seconds, peak traced bytes, records) of one encode into a fresh writer."""
+    writer = RecordWriter(None, _SPLAT_BIN_DTYPE)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    for records in encode(buffers, apply_transforms, writer):
+        pass
+    seconds = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak, records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='100K,1M,10M', help="comma-separated splat counts, K/M suffixes allowed")
+    parser.add_argument('--transforms', action='store_true', help="apply a non-identity world matrix")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per measurement, the fastest is kept")
+    args = parser.parse_args()
+    matrix_world = MATRIX_WORLD if args.transforms else None
+
+    print(f"{'splats':>10} {'encoder':>9} {'time [s]':>9} {'Msplats/s':>10} "
+          f"{'peak [MB]':>10} {'records [MB]':>13}")
+    for count in (parse_count(s) for s in args.sizes.split(',') if s.strip()):
+        buffers = AttributeBuffers(make_object(SPLAT_MIXES['sh0'], count, matrix_world=matrix_world))
+        buffers.prefetch(_SPLAT_BIN_ATTRS)
+        outputs = {}
+        for name, encode in ENCODERS.items():
+            runs = [measure(encode, buffers, args.transforms) for _ in range(args.repeat)]
+            seconds = min(run[0] for run in runs)
+            peak = max(run[1] for run in runs)
+            outputs[name] = runs[-1][2]
+            print(f"{count:>10} {name:>9} {seconds:>9.3f} {count / seconds / 1e6:>10.2f} "
+                  f"{peak / 2**20:>10.1f} {outputs[name].nbytes / 2**20:>13.1f}", flush=True)
+        if outputs['previous'].tobytes() != outputs['fused'].tobytes():
+            print(f"{count:>10}  error: the encoders' records differ")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""
+Lightweight stand-ins for the Blender PointCloud objects the exporters read,
+and generators of synthetic point clouds and splats to fill them.
+
+Only the surface BlenderPointCloud touches is modelled: obj.matrix_world,
+obj.data.attributes (get() and iteration) and, per attribute, name,
+data_type, domain, len(data) and data.foreach_get(prop, buffer). Like
+Blender, foreach_get copies into the caller's buffer, so the exporters pay
+the same fetch cost they would inside Blender.
+"""
+import numpy as np
+
+# Blender data_type → foreach_get property
+_PROPS = {
+    'FLOAT': 'value', 'INT': 'value', 'INT8': 'value', 'BOOLEAN': 'value', 'QUATERNION': 'value',
+    'FLOAT_VECTOR': 'vector', 'FLOAT2': 'vector',
+    'FLOAT_COLOR': 'color', 'BYTE_COLOR': 'color',
+}
+
+
+class AttributeData:
+    """attr.data: the per-point items of one attribute, read in bulk with foreach_get."""
+
+    def __init__(self, prop, array):
+        self._prop = prop
+        self._len = len(array)
+        self._flat = array.reshape(-1)
+
+    def __len__(self):
+        return self._len
+
+    def foreach_get(self, prop, buffer):
+        if prop != self._prop:
+            raise AttributeError(f"foreach_get('{prop}'): attribute items have no such property")
+        if buffer.size != self._flat.size:
+            raise RuntimeError(f"foreach_get: buffer of {buffer.size} items, expected {self._flat.size}")
+        buffer[...] = self._flat
+
+
+class Attribute:
+    def __init__(self, name, data_type, array, domain='POINT'):
+        self.name = name
+        self.data_type = data_type
+        self.domain = domain
+        self.data = AttributeData(_PROPS[data_type], array)
+
+
+class Attributes:
+    """obj.data.attributes: iterates over Attribute objects, get() looks one up by name."""
+
+    def __init__(self, attributes):
+        self._attributes = {attr.name: attr for attr in attributes}
+
+    def __iter__(self):
+        return iter(self._attributes.values())
+
+    def __len__(self):
+        return len(self._attributes)
+
+    def __contains__(self, name):
+        return name in self._attributes
+
+    def __getitem__(self, name):
+        return self._attributes[name]
+
+    def get(self, name, default=None):
+        return self._attributes.get(name, default)
+
+
+class PointCloudData:
+    def __init__(self, attributes):
+        self.attributes = Attributes(attributes)
+
+
+class PointCloudObject:
+    type = 'POINTCLOUD'
+
+    def __init__(self, name, attributes, matrix_world=None):
+        self.name = name
+        self.data = PointCloudData(attributes)
+        self.matrix_world = np.eye(4) if matrix_world is None else np.asarray(matrix_world)
+
+    @property
+    def nbytes(self):
+        """Bytes of synthetic attribute data held by the object."""
+        return sum(attr.data._flat.nbytes for attr in self.data.attributes)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+#
+# A mix is a list of (name, data_type, generator); each generator takes
+# (rng, count) and returns the attribute laid out as foreach_get fills it.
+# ---------------------------------------------------------------------------
+
+def _floats(*shape_tail, scale=1.0):
+    def generate(rng, count):
+        return rng.standard_normal((count, *shape_tail), dtype=np.float32) * np.float32(scale)
+    return generate
+
+
+def _unit(components):
+    def generate(rng, count):
+        v = rng.standard_normal((count, components), dtype=np.float32)
+        v /= np.linalg.norm(v, axis=1, keepdims=True) + np.float32(1e-12)
+        return v
+    return generate
+
+
+def _colors(rng, count):
+    return rng.random((count, 4), dtype=np.float32)
+
+
+def _ints(dtype, low, high):
+    def generate(rng, count):
+        return rng.integers(low, high, count, dtype=dtype)
+    return generate
+
+
+def _bools(rng, count):
+    return rng.random(count, dtype=np.float32) < 0.5
+
+
+_SCAN = [
+    ('position', 'FLOAT_VECTOR', _floats(3, scale=10.0)),
+    ('normal', 'FLOAT_VECTOR', _unit(3)),
+    ('color', 'BYTE_COLOR', _colors),
+    ('intensity', 'FLOAT', _floats()),
+    ('classification', 'INT8', _ints(np.int8, 0, 20)),
+]
+
+_SPLAT = (
+    [('position', 'FLOAT_VECTOR', _floats(3, scale=10.0))]
+    + [(f'f_dc_{i}', 'FLOAT', _floats()) for i in range(3)]
+    + [('opacity', 'FLOAT', _floats(scale=2.0))]
+    + [(f'scale_{i}', 'FLOAT', _floats(scale=0.5)) for i in range(3)]
+    + [(f'rot_{i}', 'FLOAT', _floats()) for i in range(4)]
+)
+
+# Point clouds as exported with export_ply
+PLY_MIXES = {
+    'xyz': _SCAN[:1],
+    'scan': _SCAN,
+    'full': _SCAN + [
+        ('velocity', 'FLOAT_VECTOR', _floats(3)),
+        ('uv', 'FLOAT2', _floats(2)),
+        ('tint', 'FLOAT_COLOR', _colors),
+        ('orientation', 'QUATERNION', _unit(4)),
+        ('point_id', 'INT', _ints(np.int32, 0, 1 << 30)),
+        ('selected', 'BOOLEAN', _bools),
+    ],
+}
+
+# Gaussian splats, without and with degree-3 spherical harmonics
+SPLAT_MIXES = {
+    'sh0': _SPLAT,
+    'sh3': _SPLAT + [(f'f_rest_{i}', 'FLOAT', _floats(scale=0.2)) for i in range(45)],
+}
+
+
+def make_object(mix, count, seed=0, name='PointCloud', matrix_world=None):
+    """Returns a PointCloudObject holding count synthetic points of the given mix."""
+    rng = np.random.default_rng(seed)
+    attributes = [Attribute(attr_name, data_type, generate(rng, count))
+                  for attr_name, data_type, generate in mix]
+    return PointCloudObject(name, attributes, matrix_world)
@@ -1,5 +1,14 @@
-import bpy
-from . import analytics, formats, ui, operators
+try:
+    import bpy
+except ImportError:
+    # Imported outside Blender: only the bpy-independent export core in
+    # .formats is usable, and nothing is registered.
+    bpy = None
+
+from . import analytics, formats
+
+if bpy is not None:
+    from . import ui, operators, utils
 
 bl_info = {
     "name": "@GV - PointCloud & Splat Exporter (.ply)",
@@ -13,24 +22,47 @@ bl_info = {
     "category": "Import-Export",
 }
 
-_MENU_FUNCS = [
-    ui.menu_func_export,
-    ui.menu_func_export_splat,
-    ui.menu_func_export_splat_bin,
-]
+
+def _menu_funcs():
+    return [
+        ui.menu_func_export,
+        ui.menu_func_export_splat,
+        ui.menu_func_export_splat_bin,
+        ui.menu_func_export_splat_compressed,
+        ui.menu_func_export_splat_spz,
+        ui.menu_func_export_octree,
+    ]
+
+
+def _handlers():
+    handlers = bpy.app.handlers
+    return [
+        (handlers.depsgraph_update_post, utils.on_depsgraph_update),
+        (handlers.load_post, utils.clear_classification_cache),
+        (handlers.undo_post, utils.clear_classification_cache),
+        (handlers.redo_post, utils.clear_classification_cache),
+    ]
 
 
 def register():
-    for cls in ui.classes + operators.classes + formats.classes:
+    for cls in ui.classes + operators.classes:
         bpy.utils.register_class(cls)
-    for fn in _MENU_FUNCS:
+    for fn in _menu_funcs():
         bpy.types.TOPBAR_MT_file_export.append(fn)
+    for handler_list, fn in _handlers():
+        handler_list.append(bpy.app.handlers.persistent(fn))
     analytics.track("addon_register")
 
 
 def unregister():
     analytics.track("addon_unregister")
-    for fn in reversed(_MENU_FUNCS):
+    for handler_list, fn in _handlers():
+        if fn in handler_list:
+            handler_list.remove(fn)
+    utils.clear_classification_cache()
+    for fn in reversed(_menu_funcs()):
         bpy.types.TOPBAR_MT_file_export.remove(fn)
-    for cls in reversed(formats.classes + operators.classes + ui.classes):
+    for cls in reversed(operators.classes + ui.classes):
         bpy.utils.unregister_class(cls)
+    formats.export_cache.clear()
+    analytics.flush()
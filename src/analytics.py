@@ -1,23 +1,31 @@
 import functools
 import hashlib
+import http.client
 import json
 import platform
+import queue
+import socket
 import subprocess
 import sys
+import threading
+import time
+from urllib.parse import urlsplit
 
 _DOMAIN   = "app.analytics"
 _ENDPOINT = "https://pl.vialing.it/api/event"
 _APP_URL  = "https://" + _DOMAIN + "/blender/gv_point_cloud_exporter"
 
-# Subprocess minimale: riceve {"url", "payload", "headers"} come argomento JSON,
-# fa la richiesta HTTP e termina. Nessuna logica aggiuntiva.
-_SUBPROCESS_SCRIPT = (
-    "import sys,json,urllib.request;"
-    "a=json.loads(sys.argv[1]);"
-    "req=urllib.request.Request(a['url'],data=json.dumps(a['payload']).encode(),"
-    "headers=a['headers'],method='POST');"
-    "urllib.request.urlopen(req,timeout=5)"
-)
+# Eventi in attesa al massimo: oltre questo limite i nuovi eventi vengono scartati
+_QUEUE_SIZE = 256
+# Eventi inviati di seguito sulla stessa connessione a ogni risveglio del worker
+_BATCH_SIZE = 32
+# Timeout (secondi) di connessione e risposta di ogni richiesta
+_TIMEOUT = 5.0
+# Attesa massima per lo svuotamento della coda all'unregister
+_FLUSH_TIMEOUT = 2.0
+
+# Segnale di arresto per il worker
+_STOP = object()
 
 _hwid_cache: str | None = None
 
@@ -69,16 +77,135 @@ def _get_hwid() -> str:
     return _hwid_cache
 
 
-def _spawn(payload: dict, headers: dict) -> None:
-    arg = json.dumps({"url": _ENDPOINT, "payload": payload, "headers": headers})
-    kw = {
-        "stdout": subprocess.DEVNULL,
-        "stderr": subprocess.DEVNULL,
-        "close_fds": True,
-    }
-    if sys.platform == "win32":
-        kw["creationflags"] = subprocess.CREATE_NO_WINDOW
-    subprocess.Popen([sys.executable, "-c", _SUBPROCESS_SCRIPT, arg], **kw)
+class _Dispatcher:
+    """
+    Invia gli eventi a un endpoint HTTP(S) da un unico thread in background.
+
+    submit() accoda l'evento in una coda limitata e ritorna subito: a coda
+    piena l'evento viene scartato, senza mai bloccare Blender. Il worker,
+    avviato al primo evento, preleva gli eventi a lotti e li invia uno dopo
+    l'altro (Plausible accetta un evento per richiesta) sulla stessa
+    connessione keep-alive, che viene riaperta solo se cade. L'endpoint è un
+    parametro, così il dispatcher si può provare contro un server HTTP locale
+    (benchmarks/bench_analytics.py).
+
+    Il riferimento al worker vale finché il worker è vivo: è il worker stesso
+    ad azzerarlo, sotto il lock e solo a coda vuota, quando si ferma. Così
+    submit() non avvia mai un secondo worker accanto a uno che sta ancora
+    inviando, e un evento accodato dopo il segnale di arresto non resta
+    orfano.
+    """
+
+    def __init__(self, endpoint: str, timeout: float = _TIMEOUT, maxsize: int = _QUEUE_SIZE):
+        url = urlsplit(endpoint)
+        self._connection_class = (
+            http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = url.netloc
+        self._path = url.path or "/"
+        self._timeout = timeout
+        self._queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._conn = None
+        self.sent = 0
+        self.dropped = 0
+
+    def submit(self, payload: dict, headers: dict) -> None:
+        """Accoda un evento; non blocca mai."""
+        # put_nowait sotto il lock: il worker non può fermarsi tra il controllo e l'accodamento
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="gv-pce-analytics", daemon=True)
+                self._thread.start()
+            try:
+                self._queue.put_nowait((payload, headers))
+            except queue.Full:
+                self.dropped += 1
+
+    def flush(self, timeout: float = _FLUSH_TIMEOUT) -> None:
+        """
+        Invia gli eventi ancora in coda e ferma il worker, bloccando al massimo
+        `timeout` secondi in tutto. Se il worker non si ferma in tempo resta
+        registrato e si ferma da solo dopo aver svuotato la coda; un evento
+        successivo avvia un nuovo worker solo a worker fermo.
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            thread = self._thread
+        if thread is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Full:
+            return
+        thread.join(max(0.0, deadline - time.monotonic()))
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < _BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            for item in batch:
+                if item is _STOP:
+                    stop = True
+                    continue
+                try:
+                    self._send(*item)
+                except Exception:
+                    # Es. proprietà non serializzabili: si scarta l'evento, non il worker
+                    self.dropped += 1
+            if stop:
+                # La connessione si chiude prima di liberare il posto a un nuovo worker
+                self._close()
+                with self._lock:
+                    # Eventi accodati dopo l'arresto: si continua a inviarli
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+
+    def _send(self, payload: dict, headers: dict) -> None:
+        body = json.dumps(payload).encode()
+        # Un secondo tentativo su una connessione nuova copre il keep-alive
+        # chiuso dal server tra un lotto e l'altro
+        for _ in range(2):
+            try:
+                if self._conn is None:
+                    self._connect()
+                self._conn.request("POST", self._path, body=body, headers=headers)
+                # La risposta va letta per intero prima di riusare la connessione
+                self._conn.getresponse().read()
+                self.sent += 1
+                return
+            except (OSError, http.client.HTTPException):
+                self._close()
+
+    def _connect(self) -> None:
+        self._conn = self._connection_class(self._host, timeout=self._timeout)
+        self._conn.connect()
+        # http.client scrive header e corpo separatamente: senza TCP_NODELAY
+        # ogni richiesta sulla connessione riusata attende l'ACK ritardato
+        self._conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_dispatcher = _Dispatcher(_ENDPOINT)
+
+
+def flush(timeout: float = _FLUSH_TIMEOUT) -> None:
+    """Invia gli eventi in sospeso e ferma il worker (da chiamare all'unregister)."""
+    try:
+        _dispatcher.flush(timeout)
+    except Exception:
+        pass
 
 
 def track(event_name: str, params: dict = None) -> None:
@@ -110,7 +237,7 @@ def track(event_name: str, params: dict = None) -> None:
     }
 
     try:
-        _spawn(payload, headers)
+        _dispatcher.submit(payload, headers)
     except Exception:
         pass  # non bloccare mai l'addon per un errore di analytics
 
@@ -1,6 +1,9 @@
-from .ply import export_ply, PLYFileHandler
-from .splat import export_splat_ply, SplatFileHandler, export_splat_bin, SplatBinFileHandler
-
-classes = [
-    *(cls for cls in [PLYFileHandler, SplatFileHandler, SplatBinFileHandler] if cls is not None)
-]
+from .ply import export_ply
+from .splat import export_splat_ply, export_splat_bin
+from .compressed import export_splat_compressed
+from .spz import export_splat_spz
+from .octree import export_ply_octree
+from .sequence import export_ply_sequence
+from .cache import export_cache
+from .profile import ExportProfile, profile_filepath
+from .sources import ArrayPointCloud, BlenderPointCloud, point_source
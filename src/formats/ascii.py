@@ -0,0 +1,171 @@
+import numpy as np
+from .profile import NULL_PROFILE
+
+# Rows encoded per block: large enough to amortise NumPy call overhead,
+# small enough to keep the character matrix at a few tens of MB.
+_BLOCK_ROWS = 1 << 16
+
+_FRACTION_DIGITS = 6
+_FRACTION_SCALE = 10 ** _FRACTION_DIGITS
+
+# Largest scaled magnitude that is still exactly representable as an integer in float64
+_MAX_EXACT = float(2 ** 53)
+
+_MINUS, _DOT, _SPACE, _NEWLINE = (ord(c) for c in '-. \n')
+
+# Filler byte for unused character cells; removed before writing
+_PAD = 0
+
+# ASCII digit pairs '00'..'99' packed as uint16 (memory order preserved),
+# so that two digits are emitted per division with a single gather
+_DIGIT_PAIRS = np.array([[ord(a), ord(b)] for a in '0123456789' for b in '0123456789'],
+                        dtype=np.uint8).view(np.uint16).ravel()
+
+_POWERS_OF_TEN = 10 ** np.arange(19, dtype=np.int64)
+
+
+def _put_digits(out, values, pad_leading=True):
+    """
+    Write the decimal digits of non-negative int64 values right-aligned into
+    the (n, width) uint8 view `out`. Leading cells become the filler byte,
+    or '0' if pad_leading is False.
+    """
+    width = out.shape[1]
+    pairs = (width + 1) // 2
+    v = values.astype(np.int32) if width <= 9 else values.copy()
+    buf = np.empty((len(values), pairs), dtype=np.uint16)
+    for k in range(pairs - 1, -1, -1):
+        v, pair = np.divmod(v, 100)
+        buf[:, k] = _DIGIT_PAIRS[pair]
+    out[...] = buf.view(np.uint8)[:, 2 * pairs - width:]
+
+    if pad_leading:
+        for k in range(width - 1):
+            out[:, k] *= values >= _POWERS_OF_TEN[width - 1 - k]
+
+
+def _prepare_int(col):
+    """Split a '%d' column into (negative, magnitude, fraction=None, fallback)."""
+    v = np.asarray(col)
+    if v.dtype.kind == 'f':
+        fallback = ~np.isfinite(v)
+        v = np.trunc(np.where(fallback, 0, v))
+    else:
+        fallback = None
+    v = v.astype(np.int64)
+    return v < 0, np.abs(v), None, fallback
+
+
+def _prepare_float(col):
+    """
+    Split a '%.6f' column into (negative, integer part, 6-digit fraction, fallback).
+
+    Values are scaled by 10^6 and rounded half-to-even, which matches printf
+    exactly whenever the scaled value is exact (always the case for float32
+    input). For wider input, values too close to a rounding tie are flagged
+    for fallback, as are non-finite values and magnitudes beyond 2^53 / 10^6.
+    """
+    v = np.asarray(col)
+    exact = v.dtype == np.float32
+    v = v.astype(np.float64)
+    scaled = np.abs(v) * _FRACTION_SCALE
+    with np.errstate(invalid='ignore'):
+        fallback = ~(scaled < _MAX_EXACT)
+        if not exact:
+            tie_distance = np.abs(scaled - np.floor(scaled) - 0.5)
+            fallback |= tie_distance <= np.spacing(scaled)
+    if fallback.any():
+        scaled[fallback] = 0.0
+    else:
+        fallback = None
+    integer, fraction = np.divmod(np.rint(scaled).astype(np.int64), _FRACTION_SCALE)
+    return np.signbit(v), integer, fraction, fallback
+
+
+_PREPARE = {'%.6f': _prepare_float, '%d': _prepare_int}
+
+
+class AsciiEncoder:
+    """
+    Vectorized encoder for ASCII PLY vertex rows.
+
+    Formats whole blocks of rows at once from a printf-style format string
+    (as built by _get_fmt_string / passed to np.savetxt). '%.6f' and '%d'
+    fields are converted with integer arithmetic into a character matrix;
+    the rare values that cannot be converted exactly (non-finite, huge, or
+    rounding ties in float64 input) fall back to Python formatting for their
+    row. Output is byte-identical to np.savetxt with the same format.
+    """
+
+    def __init__(self, fmt, block_rows=_BLOCK_ROWS):
+        self.fmts = fmt.split(' ')
+        self.block_rows = block_rows
+
+    def _format_row(self, columns, row):
+        return ' '.join(
+            fmt % col[row].item() for fmt, col in zip(self.fmts, columns)
+        ) + '\n'
+
+    def encode(self, columns):
+        """Encode one block of rows (a list of equal-length 1-D columns) to bytes."""
+        count = len(columns[0])
+        if any(fmt not in _PREPARE for fmt in self.fmts):
+            return ''.join(self._format_row(columns, r) for r in range(count)).encode()
+
+        fields = [_PREPARE[fmt](col) for fmt, col in zip(self.fmts, columns)]
+
+        # Field layout: [sign][integer digits]['.' fraction][separator]
+        widths = []
+        for negative, integer, fraction, _ in fields:
+            digits = len(str(int(integer.max()))) if count else 1
+            widths.append(1 + digits + (0 if fraction is None else 1 + _FRACTION_DIGITS) + 1)
+
+        matrix = np.empty((count, sum(widths)), dtype=np.uint8)
+        fallback_rows = None
+        col = 0
+        for (negative, integer, fraction, fallback), width in zip(fields, widths):
+            # Built in a narrow scratch matrix, then copied into place in one pass
+            field = np.empty((count, width), dtype=np.uint8)
+            field[:, 0] = negative
+            field[:, 0] *= _MINUS
+            digits_end = width - 1 if fraction is None else width - 2 - _FRACTION_DIGITS
+            _put_digits(field[:, 1:digits_end], integer)
+            if fraction is not None:
+                field[:, digits_end] = _DOT
+                _put_digits(field[:, digits_end + 1:width - 1], fraction, pad_leading=False)
+            field[:, width - 1] = _SPACE
+            matrix[:, col:col + width] = field
+            if fallback is not None:
+                fallback_rows = fallback if fallback_rows is None else fallback_rows | fallback
+            col += width
+        matrix[:, -1] = _NEWLINE
+
+        keep = matrix != _PAD
+        data = matrix[keep].tobytes()
+        if fallback_rows is None:
+            return data
+
+        # Splice Python-formatted rows in place of the ones flagged for fallback
+        lengths = keep.sum(axis=1)
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+        out, pos = [], 0
+        for row in np.flatnonzero(fallback_rows):
+            out.append(data[pos:starts[row]])
+            out.append(self._format_row(columns, row).encode())
+            pos = ends[row]
+        out.append(data[pos:])
+        return b''.join(out)
+
+    def write(self, f, columns, profile=NULL_PROFILE, label=None):
+        """
+        Encode all rows of the given columns and write them to a binary file in
+        blocks, timing encoding as the 'pack' stage of profile.
+        """
+        count = len(columns[0])
+        for start in range(0, count, self.block_rows):
+            stop = min(start + self.block_rows, count)
+            with profile.stage('pack', label):
+                data = self.encode([col[start:stop] for col in columns])
+            with profile.stage('write', label, len(data)):
+                f.write(data)
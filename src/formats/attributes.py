@@ -0,0 +1,208 @@
+import numpy as np
+from .profile import NULL_PROFILE
+from .reorder import spatial_order
+from .sources import point_source
+from .transform import Transform
+from .voxel import VoxelGroups
+
+
+class AttributeBuffers:
+    """
+    Per-object attribute fetch layer.
+
+    `obj` is anything sources.point_source accepts: a Blender PointCloud
+    object, a mapping of attribute name → NumPy array or a point source.
+    Every attribute is read from the source at most once, on first access,
+    and kept as a typed buffer for the lifetime of this object. Exporters
+    take their per-component columns as views into these buffers.
+
+    The object's world matrix and its Transform are captured up front, so that
+    once the needed attributes are prefetched the buffers can be consumed from
+    a worker thread without touching bpy.
+
+    Point-set stages (reorder, downsample) are recorded as remaps applied to
+    every buffer, whether already fetched or fetched later; `count` is the
+    number of points after them. A remap is called as remap(buf, axis, name),
+    with the tuple of row names for float blocks.
+
+    Fetches and point-set stages are timed into `profile` (an ExportProfile)
+    under the source's name; exporters use the same profile and `label` for
+    the stages they run on these buffers.
+
+    `scratch` (a dict, or None) recycles fetch arrays across AttributeBuffers
+    of the same object: every fetched array is recorded in it, and a later
+    AttributeBuffers given the same dict reads into those arrays when their
+    shape still matches. The caller must be done with the earlier buffers.
+    """
+
+    def __init__(self, obj, profile=None, scratch=None):
+        self.source = point_source(obj)
+        self.profile = profile or NULL_PROFILE
+        self.label = self.source.name
+        self.count = self.source.count
+        self.matrix_world = self.source.matrix_world
+        self.transform = Transform(self.matrix_world)
+        self._source_count = self.count
+        self._buffers = {}
+        self._blocks = {}
+        self._remaps = []
+        self._scratch = scratch
+
+    def __contains__(self, name):
+        return name in self.source.schema
+
+    def get(self, name):
+        """Returns the whole buffer for an attribute, or None if it is missing/unsupported."""
+        if name in self._buffers:
+            return self._buffers[name]
+        with self.profile.stage('fetch', self.label) as stage:
+            if self._scratch is None:
+                buf = self.source.read(name)
+            else:
+                buf = self._scratch[name] = self.source.read(name, self._scratch.get(name))
+            if buf is not None:
+                stage.nbytes = buf.nbytes
+                for remap in self._remaps:
+                    buf = remap(buf, 0, name)
+        self._buffers[name] = buf
+        return buf
+
+    def prefetch(self, names):
+        """Reads the given attributes now (on the calling thread)."""
+        for name in names:
+            self.get(name)
+
+    def _remap(self, remap):
+        """Applies remap(buf, axis, name) to every fetched buffer and to all later fetches."""
+        self._remaps.append(remap)
+        self._buffers = {
+            name: None if buf is None else remap(buf, 0, name)
+            for name, buf in self._buffers.items()
+        }
+        self._blocks = {key: remap(block, 1, key) for key, block in self._blocks.items()}
+
+    def _positions(self, apply_transforms):
+        pos = self.get('position')
+        if apply_transforms:
+            pos = self.transform.points(pos)
+        return pos
+
+    def reorder(self, mode):
+        """
+        Sorts the points along a space-filling curve ('MORTON' or 'HILBERT',
+        see reorder.spatial_order); 'NONE' keeps Blender's order.
+
+        The permutation is computed once from the positions and applied with a
+        single gather to every buffer, so exporters consume the reordered
+        columns unchanged.
+        """
+        if mode == 'NONE' or self.count <= 1:
+            return
+        with self.profile.stage('reorder', self.label):
+            order = spatial_order(self.get('position'), mode)
+            self._remap(lambda buf, axis, name: np.take(buf, order, axis=axis))
+
+    def downsample(self, voxel_size, mode='FIRST', apply_transforms=False):
+        """
+        Reduces the points to one per occupied voxel of size voxel_size
+        (see voxel.VoxelGroups for the FIRST / MEAN / RANDOM modes). The grid
+        is in world space if apply_transforms is set, else in object space.
+        voxel_size <= 0 keeps every point.
+
+        MEAN averages normals, QUATERNION attributes and the splat rotation
+        (rot_0..rot_3) as directions; see _voxel_kinds.
+        """
+        if voxel_size <= 0 or self.count == 0:
+            return
+        with self.profile.stage('downsample', self.label):
+            groups = VoxelGroups(self._positions(apply_transforms), voxel_size, mode)
+            kinds = self._voxel_kinds(groups) if mode == 'MEAN' else {}
+
+            def reduce(buf, axis, name):
+                if not isinstance(name, tuple):
+                    return groups.reduce(buf, axis, kinds.get(name))
+                if not kinds.keys() & set(name):
+                    return groups.reduce(buf, axis)
+                # Float block: reduce row by row, each with its attribute's kind
+                return np.stack([groups.reduce(row, 0, kinds.get(row_name)) for row, row_name in zip(buf, name)])
+
+            self._remap(reduce)
+            self.count = len(groups)
+
+    def _voxel_kinds(self, groups):
+        """Maps the names of direction attributes to their VoxelGroups.reduce kind."""
+        schema = self.source.schema
+        kinds = {name: 'quaternion' for name, data_type in schema.items() if data_type == 'QUATERNION'}
+        if schema.get('normal') == 'FLOAT_VECTOR':
+            kinds['normal'] = 'normal'
+        rot_names = [f'rot_{i}' for i in range(4)]
+        if all(schema.get(name) == 'FLOAT' for name in rot_names):
+            groups.align_rotations(np.stack([self.get(name) for name in rot_names], axis=1))
+            kinds.update(dict.fromkeys(rot_names, 'rotation'))
+        return kinds
+
+    def float(self, name, default=0.0):
+        """
+        Returns a FLOAT attribute buffer, or a constant read-only column of
+        `default` (no per-point allocation) if the attribute is missing.
+        """
+        buf = self.get(name)
+        if buf is not None and buf.ndim == 1 and buf.dtype == np.float32:
+            return buf
+        return np.broadcast_to(np.float32(default), (self.count,))
+
+    def float_block(self, names):
+        """
+        Reads several FLOAT attributes into one preallocated (len(names), count)
+        float32 block, fetching each attribute straight into its own contiguous
+        row. Missing or non-FLOAT attributes are filled with zeros. The block is
+        cached, so it is only read once per set of names.
+        """
+        key = tuple(names)
+        block = self._blocks.get(key)
+        if block is not None:
+            return block
+        with self.profile.stage('fetch', self.label) as stage:
+            block = None if self._scratch is None else self._scratch.get(key)
+            if block is None or block.shape != (len(key), self._source_count):
+                block = np.empty((len(key), self._source_count), dtype=np.float32)
+                if self._scratch is not None:
+                    self._scratch[key] = block
+            stage.nbytes = block.nbytes
+            for row, name in zip(block, key):
+                if not self.source.read_float_into(name, row):
+                    row.fill(0.0)
+            for remap in self._remaps:
+                block = remap(block, 1, key)
+        self._blocks[key] = block
+        return block
+
+    def column(self, name, sub_index=0):
+        """Returns a 1-D view of one component of an attribute, or None if it is missing."""
+        buf = self.get(name)
+        if buf is None:
+            return None
+        return buf if buf.ndim == 1 else buf[:, sub_index]
+
+
+def prepare_buffers(objects, voxel_size=0.0, voxel_mode='FIRST', apply_transforms=False, profile=None):
+    """
+    Returns (one AttributeBuffers per object, total point count): the count an
+    export writes in its header before the first object.
+
+    With voxel_size > 0 every object is downsampled here, so its positions
+    are fetched and grouped into voxels once, for both the count and the
+    export; until written, each object keeps only its downsampled positions.
+    Exporters should walk the list with release_each().
+    """
+    all_buffers = [AttributeBuffers(obj, profile) for obj in objects]
+    for buffers in all_buffers:
+        buffers.downsample(voxel_size, voxel_mode, apply_transforms)
+    return all_buffers, sum(buffers.count for buffers in all_buffers)
+
+
+def release_each(items):
+    """Yields the items of a list in order, dropping the list's reference to each as it goes."""
+    for i in range(len(items)):
+        item, items[i] = items[i], None
+        yield item
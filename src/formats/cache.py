@@ -0,0 +1,189 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from .profile import NULL_PROFILE
+
+# Default bound on the encoded bytes kept across exports
+_DEFAULT_MAX_BYTES = 1 << 30
+
+
+class ExportCache:
+    """
+    Size-bounded LRU of encoded per-object record blocks, kept across exports.
+
+    Each block is the packed records one object contributed to a binary
+    export, stored under a key made of the export settings and a content
+    fingerprint of the object (see CacheSession). Blocks are evicted least
+    recently used first once their total size exceeds max_bytes. Stores may
+    come from worker threads, so every access is locked.
+    """
+
+    def __init__(self, max_bytes=_DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._blocks = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._blocks)
+
+    @property
+    def size(self):
+        """Total bytes of the cached blocks."""
+        return self._size
+
+    def _evict(self):
+        while self._size > self.max_bytes and self._blocks:
+            _, block = self._blocks.popitem(last=False)
+            self._size -= block.nbytes
+
+    def resize(self, max_bytes):
+        """Changes the size bound, evicting blocks if the cache no longer fits."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def get(self, key):
+        """Returns the block stored under key (marking it recently used), or None."""
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is not None:
+                self._blocks.move_to_end(key)
+            return block
+
+    def put(self, key, block):
+        """Stores a block; blocks larger than the whole cache are not kept."""
+        if block.nbytes > self.max_bytes:
+            return
+        block.flags.writeable = False
+        with self._lock:
+            old = self._blocks.pop(key, None)
+            if old is not None:
+                self._size -= old.nbytes
+            self._blocks[key] = block
+            self._size += block.nbytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._blocks.clear()
+            self._size = 0
+
+
+# Shared by the Exporters Panel operators for the lifetime of the add-on
+export_cache = ExportCache()
+
+
+def fingerprint(buffers, names, block_names=(), apply_transforms=False):
+    """
+    Returns a 128-bit BLAKE2b digest of an object's exported attributes,
+    after voxel downsampling (exporters run prepare_buffers first) but before
+    any reorder, plus its world matrix if transforms are baked into the
+    output. voxel_size and voxel_mode are part of the session settings.
+
+    names are hashed from the individual attribute buffers, block_names from
+    the float_block of those attributes; both are fetched once and then
+    reused by the encoder on a miss.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.int64(buffers.count).tobytes())
+    if apply_transforms:
+        h.update(np.ascontiguousarray(buffers.matrix_world, dtype=np.float64).tobytes())
+    for name in names:
+        buf = buffers.get(name)
+        h.update(name.encode() + b'\0')
+        if buf is not None:
+            h.update(buf.dtype.str.encode())
+            h.update(np.ascontiguousarray(buf).view(np.uint8))
+    if block_names:
+        h.update('\0'.join(block_names).encode())
+        h.update(np.ascontiguousarray(buffers.float_block(block_names)).view(np.uint8))
+    return h.digest()
+
+
+class _CapturingWriter:
+    """RecordWriter interface that forwards to another writer and keeps a copy of every record written."""
+
+    def __init__(self, writer):
+        self._writer = writer
+        self.parts = []
+
+    def records(self, count):
+        return self._writer.records(count)
+
+    def write(self, records):
+        self.parts.append(records.copy())
+        self._writer.write(records)
+
+    def block(self):
+        if len(self.parts) == 1:
+            return self.parts[0]
+        return np.concatenate(self.parts)
+
+
+def _pack_and_store(writer, cache, key, pack, *args):
+    capture = _CapturingWriter(writer)
+    pack(capture, *args)
+    if capture.parts:
+        cache.put(key, capture.block())
+
+
+def _write_block(writer, block, profile, label):
+    with profile.stage('write', label, block.nbytes):
+        records = writer.records(len(block))
+        records[...] = block
+        writer.write(records)
+
+
+class CacheSession:
+    """
+    One export's use of an ExportCache.
+
+    lookup() fingerprints an object and returns its cached block if the
+    object is unchanged; write_block() writes such a block through the record
+    writer, and submit() packs a changed object as writer.submit would while
+    storing its records for the next export. With cache=None every object is
+    a miss, nothing is fingerprinted and submit() is a plain writer.submit.
+
+    settings must hold everything besides the object that affects the packed
+    bytes (format, property layout, transforms, point-set stages...).
+    """
+
+    def __init__(self, cache, settings):
+        self.cache = cache
+        self.settings = settings
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, buffers, names, block_names=(), apply_transforms=False):
+        """Returns (key, cached block or None) for one object."""
+        if self.cache is None:
+            return None, None
+        with buffers.profile.stage('fingerprint', buffers.label):
+            key = (self.settings, fingerprint(buffers, names, block_names, apply_transforms))
+        block = self.cache.get(key)
+        if block is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return key, block
+
+    @staticmethod
+    def write_block(writer, block, profile=None, label=None):
+        """Writes a cached block in place of re-packing its object."""
+        writer.submit(len(block), _write_block, block, profile or NULL_PROFILE, label)
+
+    def submit(self, writer, key, count, pack, *args):
+        """Schedules pack(writer, *args), storing the packed records under key."""
+        if self.cache is None or key is None:
+            writer.submit(count, pack, *args)
+        else:
+            writer.submit(count, _pack_and_store, self.cache, key, pack, *args)
+
+    def report(self):
+        """Returns the hit/miss summary appended to the export message ('' without a cache)."""
+        if self.cache is None:
+            return ""
+        return f" Cache: {self.hits} reused, {self.misses} re-encoded."
@@ -0,0 +1,288 @@
+import numpy as np
+from .. import analytics
+from .attributes import prepare_buffers, release_each
+from .profile import NULL_PROFILE
+from .records import iter_chunks
+from .sources import point_source
+from .splat import (
+    _SH_C0, _count_f_rest, _f_rest_names, _transformed_positions, _transformed_sh, _transformed_splats,
+)
+
+# ---------------------------------------------------------------------------
+# PlayCanvas compressed PLY (.compressed.ply)
+#
+# Splats are grouped in chunks of 256 consecutive splats. Each chunk stores
+# min/max bounds for position, log-scale and base color; each splat stores
+# its position, scale and color normalized to its chunk's bounds, plus its
+# rotation, packed into four 32-bit words. Higher-order SH coefficients are
+# stored as one byte each in a separate element.
+# ---------------------------------------------------------------------------
+
+_SPLATS_PER_CHUNK = 256
+
+# Chunks quantized per block: bounds the float64 temporaries of the encoder
+_BLOCK_CHUNKS = 4096
+
+_CHUNK_PROPS = [
+    'min_x', 'min_y', 'min_z', 'max_x', 'max_y', 'max_z',
+    'min_scale_x', 'min_scale_y', 'min_scale_z', 'max_scale_x', 'max_scale_y', 'max_scale_z',
+    'min_r', 'min_g', 'min_b', 'max_r', 'max_g', 'max_b',
+]
+
+_CHUNK_DTYPE = np.dtype([(name, '<f4') for name in _CHUNK_PROPS])
+
+_VERTEX_DTYPE = np.dtype([
+    ('packed_position', '<u4'),
+    ('packed_rotation', '<u4'),
+    ('packed_scale', '<u4'),
+    ('packed_color', '<u4'),
+])
+
+# Log-scale bounds are clamped to this range (trained scales can reach ±inf)
+_SCALE_LIMIT = 20.0
+
+
+def _pack_unorm(value, bits):
+    """Quantizes values in [0, 1] to unsigned integers of the given bit width."""
+    top = (1 << bits) - 1
+    return np.clip(np.floor(value * top + 0.5), 0, top).astype(np.uint32)
+
+
+def _pack_111011(values):
+    """Packs (N, 3) values in [0, 1] into 11-10-11 bit words."""
+    return (
+        (_pack_unorm(values[:, 0], 11) << 21)
+        | (_pack_unorm(values[:, 1], 10) << 11)
+        | _pack_unorm(values[:, 2], 11)
+    )
+
+
+def _normalize(values, lo, hi):
+    """
+    Maps values to [0, 1] relative to per-splat bounds: 0 at or below lo,
+    1 at or above hi, and 0 when the range is degenerate (< 1e-5).
+    """
+    span = hi - lo
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = (values - lo) / span
+    result[span < 1e-5] = 0.0
+    result[values >= hi] = 1.0
+    result[values <= lo] = 0.0
+    return result
+
+
+def _pack_rotation(rot):
+    """
+    Packs (N, 4) quaternions in (x, y, z, w) order into 2+10+10+10 bit words
+    using the smallest-three encoding: the index of the largest component,
+    then the other three (sign-flipped so the largest is positive) scaled
+    from [-1/sqrt(2), 1/sqrt(2)] to [0, 1].
+    """
+    q = rot.astype(np.float64)
+    length = np.linalg.norm(q, axis=1, keepdims=True)
+    degenerate = length[:, 0] == 0
+    q /= np.where(length == 0, 1.0, length)
+    q[degenerate] = (0.0, 0.0, 0.0, 1.0)
+
+    largest = np.argmax(np.abs(q), axis=1)
+    rows = np.arange(len(q))
+    q[q[rows, largest] < 0] *= -1.0
+
+    keep = np.ones(q.shape, dtype=bool)
+    keep[rows, largest] = False
+    others = q[keep].reshape(-1, 3) * (np.sqrt(2) * 0.5) + 0.5
+
+    packed = largest.astype(np.uint32) << 30
+    for i in range(3):
+        packed |= _pack_unorm(others[:, i], 10) << (20 - 10 * i)
+    return packed
+
+
+def _quantize_sh(values):
+    """Quantizes SH coefficients to bytes: trunc((v / 8 + 0.5) * 256), clamped to [0, 255]."""
+    scaled = np.trunc((values.astype(np.float64) / 8.0 + 0.5) * 256.0)
+    return np.clip(scaled, 0, 255).astype(np.uint8)
+
+
+def _chunk_bounds(values, starts):
+    """Per-chunk (min, max) of (N, k) values; `starts` are the chunk start indices."""
+    return np.minimum.reduceat(values, starts, axis=0), np.maximum.reduceat(values, starts, axis=0)
+
+
+def _encode_chunks(position, scale, color, alpha, chunks, vertices):
+    """
+    Quantizes one run of whole chunks (the last one may be partial).
+
+    position, scale and color are (N, 3) float32 (color is the base RGB,
+    SH_C0 * f_dc + 0.5), alpha the (N,) packed 8-bit opacity. Chunk bounds are
+    stored into `chunks` and the packed words into `vertices`.
+    """
+    count = len(position)
+    starts = np.arange(0, count, _SPLATS_PER_CHUNK)
+    chunk_of = np.arange(count) // _SPLATS_PER_CHUNK
+
+    def quantize(values, lo, hi, fields):
+        for i, (lo_name, hi_name) in enumerate(fields):
+            chunks[lo_name] = lo[:, i]
+            chunks[hi_name] = hi[:, i]
+        lo = lo.astype(np.float64)[chunk_of]
+        hi = hi.astype(np.float64)[chunk_of]
+        return _normalize(values.astype(np.float64), lo, hi)
+
+    lo, hi = _chunk_bounds(position, starts)
+    vertices['packed_position'] = _pack_111011(quantize(
+        position, lo, hi, [('min_x', 'max_x'), ('min_y', 'max_y'), ('min_z', 'max_z')]))
+
+    lo, hi = _chunk_bounds(scale, starts)
+    lo = np.clip(lo, -_SCALE_LIMIT, _SCALE_LIMIT)
+    hi = np.clip(hi, -_SCALE_LIMIT, _SCALE_LIMIT)
+    vertices['packed_scale'] = _pack_111011(quantize(
+        scale, lo, hi, [(f'min_scale_{a}', f'max_scale_{a}') for a in 'xyz']))
+
+    lo, hi = _chunk_bounds(color, starts)
+    rgb = quantize(color, lo, hi, [(f'min_{c}', f'max_{c}') for c in 'rgb'])
+    vertices['packed_color'] = (
+        (_pack_unorm(rgb[:, 0], 8) << 24)
+        | (_pack_unorm(rgb[:, 1], 8) << 16)
+        | (_pack_unorm(rgb[:, 2], 8) << 8)
+        | alpha
+    )
+
+
+class _SplatArrays:
+    """
+    All splats of an export concatenated in object order.
+
+    The compressed layout assigns splat i to chunk i // 256 across the whole
+    file, so chunks span object boundaries and bounds can only be computed on
+    the concatenated data. Per-splat quantities that do not depend on chunk
+    bounds (rotation, opacity, SH) are packed while gathering; only position,
+    log-scale and base color are kept as float32 for the chunk pass.
+    """
+
+    def __init__(self, count, f_rest_count):
+        self.count = count
+        self.position = np.empty((count, 3), dtype=np.float32)
+        self.scale = np.empty((count, 3), dtype=np.float32)
+        self.color = np.empty((count, 3), dtype=np.float32)
+        self.alpha = np.empty(count, dtype=np.uint32)
+        self.vertices = np.empty(count, dtype=_VERTEX_DTYPE)
+        self.sh = np.empty((count, f_rest_count), dtype=np.uint8)
+
+    def add(self, buffers, offset, apply_transforms):
+        """Stores one object's splats at [offset, offset + buffers.count)."""
+        scale_cols = [buffers.float(f'scale_{i}', 0.0) for i in range(3)]
+        dc_cols = [buffers.float(f'f_dc_{i}') for i in range(3)]
+        opacity_col = buffers.float('opacity', 0.0)
+        rot_cols = [buffers.float(f'rot_{i}', 0.0) for i in range(4)]
+        sh = buffers.float_block(_f_rest_names(self.sh.shape[1]))
+
+        block = _BLOCK_CHUNKS * _SPLATS_PER_CHUNK
+        for start, stop in iter_chunks(buffers.count, block):
+            out = slice(offset + start, offset + stop)
+
+            _transformed_positions(buffers, apply_transforms, start, stop, out=self.position[out])
+            self.scale[out], rot = _transformed_splats(buffers, apply_transforms, scale_cols, rot_cols,
+                                                       start, stop)
+
+            for i in range(3):
+                self.color[out, i] = dc_cols[i][start:stop].astype(np.float64) * _SH_C0 + 0.5
+
+            opacity = opacity_col[start:stop].astype(np.float64)
+            self.alpha[out] = _pack_unorm(1.0 / (1.0 + np.exp(-opacity)), 8)
+
+            # Quaternion stored as (w, x, y, z) in rot_0..rot_3, packed as (x, y, z, w)
+            self.vertices['packed_rotation'][out] = _pack_rotation(rot[:, [1, 2, 3, 0]])
+
+            self.sh[out] = _quantize_sh(_transformed_sh(buffers, apply_transforms, sh, start, stop).T)
+
+    def encode(self):
+        """Computes the chunk table and packs position, scale and color words."""
+        chunk_count = -(-self.count // _SPLATS_PER_CHUNK)
+        chunks = np.empty(chunk_count, dtype=_CHUNK_DTYPE)
+        block = _BLOCK_CHUNKS * _SPLATS_PER_CHUNK
+        for start, stop in iter_chunks(self.count, block):
+            first = start // _SPLATS_PER_CHUNK
+            _encode_chunks(
+                self.position[start:stop], self.scale[start:stop],
+                self.color[start:stop], self.alpha[start:stop],
+                chunks[first:first + -(-(stop - start) // _SPLATS_PER_CHUNK)],
+                self.vertices[start:stop],
+            )
+        return chunks
+
+
+@analytics.track_event(
+    "export_splat_compressed",
+    lambda objects, filepath, *_, **__: {
+        "object_count": len(objects),
+    }
+)
+def export_splat_compressed(objects, filepath, apply_transforms=False, voxel_size=0.0, voxel_mode='FIRST',
+                            profile=None):
+    """
+    Export Gaussian Splat objects to the PlayCanvas compressed PLY layout.
+
+    Splats are written in object order and grouped in chunks of 256. Each
+    splat takes 16 bytes plus one byte per higher-order SH coefficient:
+      position, scale : 11-10-11 bits, normalized to the chunk bounds
+      color           : 8-8-8-8 bits, SH_C0 * f_dc + 0.5 normalized to the
+                        chunk bounds, alpha = sigmoid(opacity)
+      rotation        : smallest-three, 2+10+10+10 bits
+      f_rest          : trunc((v / 8 + 0.5) * 256), clamped to [0, 255]
+    apply_transforms bakes the object's transform into positions, rotations,
+    scales and SH coefficients, as for the other splat formats.
+
+    voxel_size > 0 keeps one splat per occupied voxel ('FIRST' or 'RANDOM'
+    representative), or averages every stored property per voxel ('MEAN',
+    with rotations sign-aligned and renormalized).
+
+    profile (an ExportProfile) times every export stage; see export_ply.
+    """
+    if not objects:
+        return False, "No objects to export"
+
+    profile = profile or NULL_PROFILE
+    objects = [point_source(obj) for obj in objects]
+    f_rest_count = _count_f_rest(objects[0].schema)
+
+    try:
+        all_buffers, total_vertices = prepare_buffers(objects, voxel_size, voxel_mode, apply_transforms, profile)
+        splats = _SplatArrays(total_vertices, f_rest_count)
+        offset = 0
+        for buffers in release_each(all_buffers):
+            if buffers.count == 0:
+                continue
+            with profile.stage('pack', buffers.label):
+                splats.add(buffers, offset, apply_transforms)
+            offset += buffers.count
+        with profile.stage('pack'):
+            chunks = splats.encode()
+
+        with open(filepath, 'wb') as f, profile.stage('write') as stage:
+            # --- Header ---
+            f.write(b"ply\n")
+            f.write(b"format binary_little_endian 1.0\n")
+            f.write(f"element chunk {len(chunks)}\n".encode())
+            for name in _CHUNK_PROPS:
+                f.write(f"property float {name}\n".encode())
+            f.write(f"element vertex {total_vertices}\n".encode())
+            for name in _VERTEX_DTYPE.names:
+                f.write(f"property uint {name}\n".encode())
+            if f_rest_count:
+                f.write(f"element sh {total_vertices}\n".encode())
+                for i in range(f_rest_count):
+                    f.write(f"property uchar f_rest_{i}\n".encode())
+            f.write(b"end_header\n")
+
+            # --- Data ---
+            f.write(chunks.view(np.uint8))
+            f.write(splats.vertices.view(np.uint8))
+            if f_rest_count:
+                f.write(splats.sh.reshape(-1))
+            stage.nbytes = f.tell()
+
+        return True, f"Exported {total_vertices} splats." + profile.report()
+
+    except Exception as e:
+        return False, str(e)
@@ -0,0 +1,326 @@
+import json
+import os
+import re
+import shutil
+
+import numpy as np
+from .. import analytics
+from .attributes import AttributeBuffers
+from .ply import (
+    _build_ply_properties, _extract_ply_columns, _ply_header, _ply_record_dtype, _store_columns,
+)
+from .profile import NULL_PROFILE
+from .records import iter_chunks
+from .reorder import _interleave
+from .sources import point_source
+
+# ---------------------------------------------------------------------------
+# Octree LOD tiles: a JSON index plus one binary PLY tile per octree node
+#
+# Every point is assigned a random level of detail, with the probability of
+# level L proportional to 8^L, and stored in the node of that level whose
+# cell contains it. Each level is then a uniform random subsample whose
+# density doubles per level, and a viewer refines by loading child nodes.
+# Node names follow the Potree convention: 'r' for the root, then one digit
+# per level giving the child index (x << 2 | y << 1 | z).
+# ---------------------------------------------------------------------------
+
+# Deepest supported level: cell coordinates are interleaved as 21-bit Morton codes
+_MAX_DEPTH = 20
+
+_DEFAULT_BATCH_SIZE = 1_000_000
+
+# Fixed seed: re-exporting the same data produces the same tiles
+_LOD_SEED = 0
+
+# Temporary node files of _OctreeBuilder ('<node key>.tmp')
+_TEMP_NAME = re.compile(r'\d+\.tmp')
+
+
+def _octree_depth(total_points, node_points):
+    """Smallest depth at which a uniform cloud averages at most node_points per node."""
+    depth = 0
+    while depth < _MAX_DEPTH and total_points * 7 > node_points * (8 ** (depth + 1) - 1):
+        depth += 1
+    return depth
+
+
+def _level_offsets(depth):
+    """Key offset of each level, so that (offset + Morton code) is unique across levels."""
+    return np.array([(8 ** level - 1) // 7 for level in range(depth + 1)], dtype=np.uint64)
+
+
+def _node_name(level, code):
+    return 'r' + (format(code, 'o').zfill(level) if level else '')
+
+
+class _OctreeBuilder:
+    """
+    Out-of-core octree construction.
+
+    Points arrive in batches of packed PLY records. Each batch is bucketed by
+    node with a single argsort and appended to one temporary file per node,
+    so the memory of bucketing and tile construction depends on the batch
+    size, not on the point count. The tiles are finalized with a header once
+    all counts are known.
+    """
+
+    def __init__(self, tiles_dir, ply_properties, lo, size, depth):
+        self.tiles_dir = tiles_dir
+        self.ply_properties = ply_properties
+        self.lo = lo
+        self.size = size
+        self.depth = depth
+        self.offsets = _level_offsets(depth)
+        # Cumulative level probabilities, P(level L) ∝ 8^L
+        weights = 8.0 ** np.arange(depth + 1)
+        self.cumulative = np.cumsum(weights) / weights.sum()
+        self.rng = np.random.default_rng(_LOD_SEED)
+        self.nodes = {}  # key → [level, code, point count]
+
+    def _temp_path(self, key):
+        return os.path.join(self.tiles_dir, f"{key}.tmp")
+
+    def add(self, records):
+        """Buckets one batch of packed records into their nodes."""
+        count = len(records)
+        cells = 1 << self.depth
+        pos = np.stack([records['x'], records['y'], records['z']], axis=1).astype(np.float64)
+        grid = np.clip(np.floor((pos - self.lo) / self.size * cells), 0, cells - 1).astype(np.uint64)
+        codes = _interleave(grid[:, 0], grid[:, 1], grid[:, 2])
+
+        levels = np.searchsorted(self.cumulative, self.rng.random(count), side='right')
+        levels = np.minimum(levels, self.depth)
+        # The cell of a coarser level is the Morton prefix of the deepest cell
+        shifts = (3 * (self.depth - levels)).astype(np.uint64)
+        keys = self.offsets[levels] + (codes >> shifts)
+
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        records = records[order]
+        bounds = np.flatnonzero(np.diff(keys)) + 1
+        starts = np.concatenate(([0], bounds))
+        stops = np.concatenate((bounds, [count]))
+
+        for start, stop in zip(starts, stops):
+            key = int(keys[start])
+            node = self.nodes.get(key)
+            if node is None:
+                level = int(levels[order[start]])
+                node = self.nodes[key] = [level, key - int(self.offsets[level]), 0]
+            with open(self._temp_path(key), 'ab' if node[2] else 'wb') as f:
+                f.write(records[start:stop].view(np.uint8))
+            node[2] += int(stop - start)
+
+    def _cell_bounds(self, level, code):
+        cell = self.size / (1 << level)
+        index = [0, 0, 0]
+        for bit in range(level):
+            for axis in range(3):
+                index[axis] |= ((code >> (3 * bit + 2 - axis)) & 1) << bit
+        cell_lo = self.lo + cell * np.array(index)
+        return {"min": cell_lo.tolist(), "max": (cell_lo + cell).tolist()}
+
+    def finish(self, tiles_name):
+        """
+        Writes every non-empty node as a PLY tile and returns the node list
+        for the index. Ancestors of non-empty nodes are listed even when empty
+        so the hierarchy is complete.
+        """
+        entries = {}
+        for key, (level, code, count) in self.nodes.items():
+            name = _node_name(level, code)
+            path = os.path.join(self.tiles_dir, f"{name}.ply")
+            with open(path, 'wb') as f:
+                f.write(_ply_header(self.ply_properties, count))
+                with open(self._temp_path(key), 'rb') as tmp:
+                    shutil.copyfileobj(tmp, f)
+            os.remove(self._temp_path(key))
+            entries[name] = {
+                "name": name,
+                "level": level,
+                "points": count,
+                "bounds": self._cell_bounds(level, code),
+                "file": f"{tiles_name}/{name}.ply",
+            }
+
+        for name in list(entries):
+            while len(name) > 1:
+                parent = name[:-1]
+                if parent not in entries:
+                    level = len(parent) - 1
+                    code = int(parent[1:], 8) if level else 0
+                    entries[parent] = {
+                        "name": parent,
+                        "level": level,
+                        "points": 0,
+                        "bounds": self._cell_bounds(level, code),
+                        "file": None,
+                    }
+                name = parent
+
+        for entry in entries.values():
+            entry["children"] = [
+                child for child in (f"{entry['name']}{i}" for i in range(8)) if child in entries
+            ]
+        return sorted(entries.values(), key=lambda e: (e["level"], e["name"]))
+
+    def discard(self):
+        for key in self.nodes:
+            if os.path.exists(self._temp_path(key)):
+                os.remove(self._temp_path(key))
+
+
+def _prepare_tiles_dir(tiles_dir, index_path):
+    """
+    Creates tiles_dir, or removes what an earlier export left in it: the
+    tiles listed by its index at index_path and the builder's temporary
+    files. Other files are kept. A non-empty folder without a readable index
+    is not reused, since its files may not be tiles.
+    """
+    if not os.path.isdir(tiles_dir):
+        os.makedirs(tiles_dir)
+        return
+    names = os.listdir(tiles_dir)
+    if not names:
+        return
+    try:
+        with open(index_path, 'r') as f:
+            nodes = json.load(f)["nodes"]
+        listed = {os.path.basename(node["file"]) for node in nodes if node["file"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        raise ValueError(
+            f"Folder '{tiles_dir}' is not empty and has no octree index at '{index_path}'; "
+            f"choose another file name or empty the folder"
+        ) from None
+    for name in names:
+        if name in listed or _TEMP_NAME.fullmatch(name):
+            os.remove(os.path.join(tiles_dir, name))
+
+
+def _position_bounds(buffers, apply_transforms, batch_size):
+    """(min, max) of one object's written float32 positions, computed in batches."""
+    lo = np.full(3, np.inf)
+    hi = np.full(3, -np.inf)
+    pos_all = buffers.get('position')
+    for start, stop in iter_chunks(buffers.count, batch_size):
+        pos = pos_all[start:stop]
+        if apply_transforms:
+            with buffers.profile.stage('transform', buffers.label):
+                pos = buffers.transform.points(pos)
+        lo = np.minimum(lo, pos.min(axis=0))
+        hi = np.maximum(hi, pos.max(axis=0))
+    return lo, hi
+
+
+def _bucket_object(builder, buffers, ply_properties, apply_transforms, batch_size, records):
+    """Packs one object into `records` batch by batch and buckets it; returns the (grown) batch array."""
+    profile = buffers.profile
+    chunks = _extract_ply_columns(buffers, ply_properties, apply_transforms, batch_size)
+    for count, data_columns in chunks:
+        with profile.stage('pack', buffers.label):
+            if len(records) < count:
+                records = np.empty(count, dtype=records.dtype)
+            _store_columns(records[:count], ply_properties, data_columns)
+        with profile.stage('write', buffers.label, records[:count].nbytes):
+            builder.add(records[:count])
+    return records
+
+
+@analytics.track_event(
+    "export_ply_octree",
+    lambda objects, filepath, *_, **__: {
+        "object_count": len(objects),
+    }
+)
+def export_ply_octree(objects, filepath, apply_transforms=False, node_points=100_000,
+                      batch_size=_DEFAULT_BATCH_SIZE, profile=None):
+    """
+    Export PointCloud objects as an octree of binary PLY tiles for streaming.
+
+    filepath is the JSON index; tiles are written to a '<name>_tiles' folder
+    next to it, one PLY per node, with the same attribute mapping as
+    export_ply. Each node holds a random subsample of the points in its cell
+    (random LOD), so loading the nodes of levels 0..L gives a uniform preview
+    of the whole cloud at level L's density. The depth is chosen so that, for
+    a uniform cloud, nodes average at most node_points points.
+
+    Re-exporting to the same filepath removes the tiles listed by the
+    previous index first, leaving other files in the folder untouched. An
+    existing non-empty folder without that index is reported as an error
+    rather than cleared.
+
+    A first pass computes the bounds, then points are packed and bucketed
+    into per-node temporary files in batches of batch_size points, so the
+    octree itself is built out-of-core. Attributes are still read whole, one
+    object at a time: each object's buffers are released before the next
+    object is read, and positions are read once per pass rather than kept
+    for every object in between.
+
+    profile (an ExportProfile) times every export stage; see export_ply.
+    Bucketing and the tile files are timed as 'write'.
+    """
+    if not objects:
+        return False, "No objects to export"
+
+    profile = profile or NULL_PROFILE
+    objects = [point_source(obj) for obj in objects]
+    ply_properties, error = _build_ply_properties(objects[0].schema)
+    if error:
+        return False, error
+
+    total_vertices = sum(obj.count for obj in objects)
+    if total_vertices == 0:
+        return False, "No points to export"
+
+    tiles_name = os.path.splitext(os.path.basename(filepath))[0] + "_tiles"
+    tiles_dir = os.path.join(os.path.dirname(filepath), tiles_name)
+    dtype = _ply_record_dtype(ply_properties)
+    builder = None
+
+    try:
+        _prepare_tiles_dir(tiles_dir, filepath)
+
+        # --- Pass 1: bounds of the written (float32) positions ---
+        lo = np.full(3, np.inf)
+        hi = np.full(3, -np.inf)
+        for obj in objects:
+            obj_lo, obj_hi = _position_bounds(AttributeBuffers(obj, profile), apply_transforms, batch_size)
+            lo = np.minimum(lo, obj_lo)
+            hi = np.maximum(hi, obj_hi)
+        size = float((hi - lo).max()) or 1.0
+
+        # --- Pass 2: bucket points into nodes ---
+        depth = _octree_depth(total_vertices, node_points)
+        builder = _OctreeBuilder(tiles_dir, ply_properties, lo, size, depth)
+        records = np.empty(0, dtype=dtype)
+        for obj in objects:
+            records = _bucket_object(
+                builder, AttributeBuffers(obj, profile), ply_properties, apply_transforms, batch_size, records,
+            )
+
+        with profile.stage('write'):
+            nodes = builder.finish(tiles_name)
+        index = {
+            "version": "1.0",
+            "format": "ply",
+            "points": total_vertices,
+            "depth": depth,
+            "bounds": {"min": lo.tolist(), "max": (lo + size).tolist()},
+            "tight_bounds": {"min": lo.tolist(), "max": hi.tolist()},
+            "attributes": [
+                {"name": prop_name, "type": prop_type}
+                for prop_name, prop_type, _, _, _ in ply_properties
+            ],
+            "nodes": nodes,
+        }
+        with open(filepath, 'w') as f:
+            f.write(json.dumps(index, indent=1))
+
+        tiles = sum(1 for node in nodes if node["file"])
+        return True, f"Exported {total_vertices} points in {tiles} tiles." + profile.report()
+
+    except Exception as e:
+        if builder is not None:
+            builder.discard()
+        return False, str(e)
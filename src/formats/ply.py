@@ -1,13 +1,24 @@
 import numpy as np
 from .. import analytics
+from .ascii import AsciiEncoder
+from .attributes import AttributeBuffers, prepare_buffers, release_each
+from .cache import CacheSession
+from .profile import NULL_PROFILE
+from .records import iter_chunks, record_writer
+from .sources import point_source
 
 # Attributes handled with special PLY naming / transform logic
 _SPECIAL_ATTRS = frozenset({'position', 'normal'})
 
+# Largest stored value of each scaled integer type
+_UINT16_MAX = 65535
+_INT8_MAX = 127
 
-def _build_ply_properties(attributes):
+
+def _build_ply_properties(schema, quantize='NONE'):
     """
-    Build the ply_properties list from a Blender point cloud's attribute collection.
+    Build the ply_properties list from a point source's schema
+    (attribute name → Blender data_type, see sources.py).
 
     Returns (props, error_message).  Each entry in props is a 5-tuple:
         (ply_name, ply_type, components, blender_attr_name, sub_index)
@@ -17,123 +28,139 @@ def _build_ply_properties(attributes):
       normal         → nx, ny, nz         (float, handled with transform)
       color / Color  → red, green, blue   (uchar, canonical PLY color names)
       FLOAT          → <name>             (float)
-      INT / INT8     → <name>             (int)
+      INT            → <name>             (int)
+      INT8           → <name>             (char)
       BOOLEAN        → <name>             (uchar 0/1)
       FLOAT_VECTOR   → <name>_x/y/z      (float × 3)
       FLOAT2         → <name>_u/v        (float × 2)
       FLOAT_COLOR    → <name>_r/g/b/a    (float × 4)
       BYTE_COLOR     → <name>_r/g/b/a    (uchar × 4)
       QUATERNION     → <name>_w/x/y/z    (float × 4)
+
+    Every type maps to the narrowest PLY type that holds it losslessly, which
+    is also the dtype AttributeBuffers reads it into.
+
+    quantize 'HALF' or 'USHORT' selects a lossy profile: positions become
+    ushort (scale/offset, see _quantization_ranges), normals char scaled to
+    [-127, 127], colors gain an alpha channel and FLOAT_COLOR components
+    become uchar, and every other float property becomes half or ushort.
     """
     props = []
     handled = set()
 
+    quantized = quantize != 'NONE'
+    position_type = 'ushort' if quantized else 'float'
+    normal_type = 'char' if quantized else 'float'
+    float_type = {'HALF': 'half', 'USHORT': 'ushort'}.get(quantize, 'float')
+    color_type = 'uchar' if quantized else 'float'
+
     # --- Position (mandatory) ---
-    if 'position' not in attributes:
+    if 'position' not in schema:
         return None, "Point Cloud has no 'position' attribute."
     props += [
-        ('x', 'float', 3, 'position', 0),
-        ('y', 'float', 3, 'position', 1),
-        ('z', 'float', 3, 'position', 2),
+        ('x', position_type, 3, 'position', 0),
+        ('y', position_type, 3, 'position', 1),
+        ('z', position_type, 3, 'position', 2),
     ]
     handled.add('position')
 
     # --- Normal (optional, canonical PLY names) ---
-    if 'normal' in attributes:
+    if 'normal' in schema:
         props += [
-            ('nx', 'float', 3, 'normal', 0),
-            ('ny', 'float', 3, 'normal', 1),
-            ('nz', 'float', 3, 'normal', 2),
+            ('nx', normal_type, 3, 'normal', 0),
+            ('ny', normal_type, 3, 'normal', 1),
+            ('nz', normal_type, 3, 'normal', 2),
         ]
         handled.add('normal')
 
     # --- Color (optional, canonical PLY names red/green/blue) ---
-    color_attr = attributes.get('color') or attributes.get('Color')
-    if color_attr:
+    color_name = next((name for name in ('color', 'Color') if name in schema), None)
+    if color_name:
         props += [
-            ('red',   'uchar', 4, color_attr.name, 0),
-            ('green', 'uchar', 4, color_attr.name, 1),
-            ('blue',  'uchar', 4, color_attr.name, 2),
+            ('red',   'uchar', 4, color_name, 0),
+            ('green', 'uchar', 4, color_name, 1),
+            ('blue',  'uchar', 4, color_name, 2),
         ]
-        handled.add(color_attr.name)
+        if quantized:
+            props.append(('alpha', 'uchar', 4, color_name, 3))
+        handled.add(color_name)
 
     # --- All remaining POINT-domain attributes ---
-    for attr in attributes:
-        if attr.name in handled or attr.domain != 'POINT':
+    for name, dt in schema.items():
+        if name in handled:
             continue
-        name = attr.name
-        dt = attr.data_type
 
         if dt == 'FLOAT':
-            props.append((name, 'float', 1, name, 0))
-        elif dt in ('INT', 'INT8'):
+            props.append((name, float_type, 1, name, 0))
+        elif dt == 'INT':
             props.append((name, 'int', 1, name, 0))
+        elif dt == 'INT8':
+            props.append((name, 'char', 1, name, 0))
         elif dt == 'BOOLEAN':
             props.append((name, 'uchar', 1, name, 0))
         elif dt == 'FLOAT_VECTOR':
             for i, s in enumerate(('_x', '_y', '_z')):
-                props.append((name + s, 'float', 3, name, i))
+                props.append((name + s, float_type, 3, name, i))
         elif dt == 'FLOAT2':
             for i, s in enumerate(('_u', '_v')):
-                props.append((name + s, 'float', 2, name, i))
+                props.append((name + s, float_type, 2, name, i))
         elif dt == 'FLOAT_COLOR':
             for i, s in enumerate(('_r', '_g', '_b', '_a')):
-                props.append((name + s, 'float', 4, name, i))
+                props.append((name + s, color_type, 4, name, i))
         elif dt == 'BYTE_COLOR':
             for i, s in enumerate(('_r', '_g', '_b', '_a')):
                 props.append((name + s, 'uchar', 4, name, i))
         elif dt == 'QUATERNION':
             for i, s in enumerate(('_w', '_x', '_y', '_z')):
-                props.append((name + s, 'float', 4, name, i))
+                props.append((name + s, float_type, 4, name, i))
         # STRING and unknown types: skip silently
 
     return props, None
 
 
-def _read_column(attr, count, sub_index, ply_type):
-    """Read a single PLY component from a Blender attribute as a numpy 1-D array."""
-    dt = attr.data_type
-
-    if dt == 'FLOAT':
-        col = np.empty(count, dtype=np.float32)
-        attr.data.foreach_get('value', col)
-        return col
-
-    elif dt in ('INT', 'INT8'):
-        col = np.empty(count, dtype=np.int32)
-        attr.data.foreach_get('value', col)
-        return col
-
-    elif dt == 'BOOLEAN':
-        col = np.empty(count, dtype=np.bool_)
-        attr.data.foreach_get('value', col)
-        return col.astype(np.uint8)
-
-    elif dt == 'FLOAT_VECTOR':
-        arr = np.empty(count * 3, dtype=np.float32)
-        attr.data.foreach_get('vector', arr)
-        return arr[sub_index::3]
-
-    elif dt == 'FLOAT2':
-        arr = np.empty(count * 2, dtype=np.float32)
-        attr.data.foreach_get('vector', arr)
-        return arr[sub_index::2]
-
-    elif dt in ('FLOAT_COLOR', 'BYTE_COLOR'):
-        arr = np.empty(count * 4, dtype=np.float32)
-        attr.data.foreach_get('color', arr)
-        col = arr[sub_index::4]
-        if ply_type == 'uchar':
-            return (col * 255.0).astype(np.uint8)
+def _quantize_column(col, ply_type, scale_offset=None):
+    """
+    Quantizes a float column for a lossy PLY type: char is scaled from [-1, 1]
+    to [-127, 127], ushort stores round((value - offset) / scale) and half is
+    a plain float16 cast. Integer columns and other types are returned unchanged.
+    """
+    if col.dtype.kind != 'f':
         return col
-
-    elif dt == 'QUATERNION':
-        arr = np.empty(count * 4, dtype=np.float32)
-        attr.data.foreach_get('value', arr)
-        return arr[sub_index::4]
-
+    if ply_type == 'char':
+        q = np.rint(col * np.float32(_INT8_MAX))
+        return np.clip(q, -_INT8_MAX, _INT8_MAX, out=q).astype(np.int8)
+    if ply_type == 'ushort':
+        scale, offset = scale_offset
+        q = np.rint((col - offset) / scale)
+        return np.clip(q, 0, _UINT16_MAX, out=q).astype(np.uint16)
+    if ply_type == 'half':
+        return col.astype(np.float16)
+    return col
+
+
+def _convert_column(col, ply_type, scale_offset=None):
+    """Convert a buffer view to the dtype written for its PLY property."""
+    if col.dtype == np.bool_:
+        # Same itemsize: reinterpret as 0/1 bytes without a copy
+        return col.view(np.uint8)
+    if ply_type == 'uchar' and col.dtype == np.float32:
+        return (col * 255.0).astype(np.uint8)
+    if ply_type == 'half':
+        # Printed at float32 precision so the text holds the stored half value
+        return col.astype(np.float16).astype(np.float32)
+    return _quantize_column(col, ply_type, scale_offset)
+
+
+def _store_column(out, col, ply_type, scale_offset=None):
+    """Store a buffer view into a record field, converting in place where needed."""
+    if col is None:
+        out[...] = 0
+    elif ply_type == 'uchar' and col.dtype == np.float32:
+        np.multiply(col, 255.0, out=out, casting='unsafe')
+    elif ply_type in ('char', 'ushort') and col.dtype.kind == 'f':
+        out[...] = _quantize_column(col, ply_type, scale_offset)
     else:
-        return np.zeros(count, dtype=np.float32)
+        out[...] = col
 
 
 def _get_fmt_string(properties):
@@ -141,7 +168,9 @@ def _get_fmt_string(properties):
     for _, prop_type, _, _, _ in properties:
         if prop_type == 'float':
             fmts.append('%.6f')
-        elif prop_type in ('uchar', 'int'):
+        elif prop_type == 'half':
+            fmts.append('%.6f')
+        elif prop_type in ('uchar', 'int', 'char', 'ushort'):
             fmts.append('%d')
         else:
             fmts.append('%s')
@@ -149,114 +178,241 @@ def _get_fmt_string(properties):
 
 
 def _ply_type_to_numpy(ply_type):
-    return {'float': 'f4', 'uchar': 'u1', 'int': 'i4'}.get(ply_type, 'f4')
+    return {
+        'float': '<f4', 'half': '<f2', 'uchar': 'u1', 'char': 'i1', 'ushort': '<u2', 'int': '<i4',
+    }.get(ply_type, '<f4')
+
+
+def _ply_header(ply_properties, vertex_count, use_ascii=False, quantization=None):
+    """
+    Returns the encoded PLY header for a single vertex element.
+
+    quantization maps ushort property names to their (scale, offset); each is
+    recorded as a 'comment quantize <name> <scale> <offset>' line, meaning
+    value = stored * scale + offset.
+    """
+    lines = [
+        "ply",
+        f"format {'ascii' if use_ascii else 'binary_little_endian'} 1.0",
+    ]
+    lines += [
+        f"comment quantize {name} {scale!r} {offset!r}"
+        for name, (scale, offset) in (quantization or {}).items()
+    ]
+    lines.append(f"element vertex {vertex_count}")
+    lines += [f"property {prop_type} {prop_name}" for prop_name, prop_type, _, _, _ in ply_properties]
+    lines.append("end_header")
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def _ply_record_dtype(ply_properties):
+    """Returns the structured dtype of one binary PLY vertex record."""
+    return np.dtype([
+        (prop_name, _ply_type_to_numpy(prop_type))
+        for prop_name, prop_type, _, _, _ in ply_properties
+    ])
+
+
+def _extract_ply_columns(buffers, ply_properties, apply_transforms, chunk_size=0):
+    """
+    Yields, for each chunk of points of a single object, the list of 1-D columns
+    matching ply_properties (None for attributes missing on this object).
+
+    Attributes are fetched once per object; transformed positions/normals and
+    any other temporaries are only computed (in float32) for the current chunk.
+    """
+    pos = buffers.get('position') if apply_transforms else None
+    nrm = buffers.get('normal') if apply_transforms else None
+
+    for start, stop in iter_chunks(buffers.count, chunk_size):
+        transformed_cache = {}
+
+        if apply_transforms:
+            with buffers.profile.stage('transform', buffers.label):
+                transformed_cache['position'] = buffers.transform.points(pos[start:stop])
+                if nrm is not None:
+                    transformed_cache['normal'] = buffers.transform.normals(nrm[start:stop])
+
+        data_columns = []
+        for _, _, _, attr_name, sub_index in ply_properties:
+            if attr_name in transformed_cache:
+                data_columns.append(transformed_cache[attr_name][:, sub_index])
+            else:
+                col = buffers.column(attr_name, sub_index)
+                data_columns.append(None if col is None else col[start:stop])
+
+        yield stop - start, data_columns
+
+
+def _quantization_ranges(all_buffers, ply_properties, apply_transforms, chunk_size=0):
+    """
+    Returns {ply_name: (scale, offset)} for every ushort property, mapping the
+    property's [min, max] over all objects' AttributeBuffers onto [0, 65535].
+
+    This is a prepass over the exported columns (transformed positions
+    included). export_ply passes fresh buffers, so the quantized attributes
+    are read from Blender twice; downsampling is not applied to them since
+    voxel representatives and means stay within the original range.
+    """
+    ranged = [prop for prop in ply_properties if prop[1] == 'ushort']
+    if not ranged:
+        return {}
+
+    lo = np.full(len(ranged), np.inf)
+    hi = np.full(len(ranged), -np.inf)
+    for buffers in all_buffers:
+        for count, data_columns in _extract_ply_columns(buffers, ranged, apply_transforms, chunk_size):
+            if count == 0:
+                continue
+            for i, col in enumerate(data_columns):
+                if col is not None:
+                    lo[i] = min(lo[i], float(col.min()))
+                    hi[i] = max(hi[i], float(col.max()))
+
+    ranges = {}
+    for (prop_name, _, _, _, _), low, high in zip(ranged, lo.tolist(), hi.tolist()):
+        if not low <= high:
+            low = high = 0.0
+        scale = (high - low) / _UINT16_MAX if high > low else 1.0
+        ranges[prop_name] = (scale, low)
+    return ranges
+
+
+def _ascii_columns(ply_properties, count, data_columns, quantization):
+    """Converts one chunk of columns from _extract_ply_columns for the AsciiEncoder."""
+    return [
+        np.zeros(count, dtype=np.uint8) if col is None
+        else _convert_column(col, prop_type, quantization.get(prop_name))
+        for (prop_name, prop_type, _, _, _), col in zip(ply_properties, data_columns)
+    ]
+
+
+def _store_columns(records, ply_properties, data_columns, quantization=None):
+    """Packs one chunk of columns from _extract_ply_columns into binary PLY records."""
+    quantization = quantization or {}
+    for (prop_name, prop_type, _, _, _), col in zip(ply_properties, data_columns):
+        _store_column(records[prop_name], col, prop_type, quantization.get(prop_name))
+
+
+def _write_ply_object(writer, buffers, ply_properties, apply_transforms, chunk_size,
+                      quantization=None):
+    """Packs a single object into binary PLY records and writes them."""
+    profile, label = buffers.profile, buffers.label
+    chunks = _extract_ply_columns(buffers, ply_properties, apply_transforms, chunk_size)
+    for count, data_columns in chunks:
+        with profile.stage('pack', label):
+            records = writer.records(count)
+            _store_columns(records, ply_properties, data_columns, quantization)
+        with profile.stage('write', label, records.nbytes):
+            writer.write(records)
 
 
 @analytics.track_event(
     "export_ply",
-    lambda objects, filepath, use_ascii=False, apply_transforms=False: {
+    lambda objects, filepath, use_ascii=False, *_, **__: {
         "format": "ascii" if use_ascii else "binary",
         "object_count": len(objects),
     }
 )
-def export_ply(objects, filepath, use_ascii=False, apply_transforms=False):
+def export_ply(objects, filepath, use_ascii=False, apply_transforms=False, chunk_size=0,
+               threads=1, use_mmap=False, reorder='NONE', voxel_size=0.0, voxel_mode='FIRST',
+               quantize='NONE', cache=None, profile=None):
     """
     Export a list of evaluated PointCloud objects to a PLY file.
     All POINT-domain attributes are preserved; unrecognised types are skipped.
+
+    objects may also be ArrayPointClouds or {name: array} mappings (see
+    sources.point_source), so the export runs without Blender.
+
+    chunk_size > 0 streams each object in ranges of that many points, so that
+    working memory beyond the fetched attributes depends on the chunk size
+    rather than on the point count. The output is identical either way.
+
+    threads > 1 packs and writes objects concurrently on a thread pool (binary
+    output only). Attributes are still fetched from Blender on the calling
+    thread; the output is identical to the serial export.
+
+    use_mmap sizes the output file up front and maps it, so that binary records
+    are packed directly into the file's pages instead of a scratch buffer.
+
+    reorder ('NONE', 'MORTON' or 'HILBERT') sorts each object's points along a
+    space-filling curve before writing, which improves locality for viewers
+    and the compression ratio of the file.
+
+    voxel_size > 0 downsamples each object to one point per occupied voxel,
+    keeping the first or a random point of each voxel (voxel_mode 'FIRST' /
+    'RANDOM') or averaging its float attributes ('MEAN'; normals and
+    quaternions are renormalized). The voxel grid is in world space when
+    apply_transforms is set.
+
+    quantize 'HALF' or 'USHORT' writes lossy property types instead of float
+    (see _build_ply_properties); the scale and offset of every ushort property
+    are stored as header comments.
+
+    cache (an ExportCache) reuses the packed records of objects whose
+    attributes, transform and export settings are unchanged since they were
+    last exported, and re-packs only the others (binary output only). The
+    hit/miss counts are appended to the returned message.
+
+    profile (an ExportProfile) records the time and bytes of every stage
+    (attribute fetch, transforms, packing, writes...) per object; the stage
+    totals are appended to the returned message.
     """
     if not objects:
         return False, "No objects to export"
 
-    ply_properties, error = _build_ply_properties(objects[0].data.attributes)
+    profile = profile or NULL_PROFILE
+    objects = [point_source(obj) for obj in objects]
+    ply_properties, error = _build_ply_properties(objects[0].schema, quantize)
     if error:
         return False, error
 
-    total_vertices = sum(len(obj.data.attributes['position'].data) for obj in objects)
-
     try:
-        with open(filepath, 'wb' if not use_ascii else 'w') as f:
-            # --- Header ---
-            def w(line):
-                f.write(line.encode() if not use_ascii else line)
+        all_buffers, total_vertices = prepare_buffers(objects, voxel_size, voxel_mode, apply_transforms, profile)
+        quantization = _quantization_ranges(
+            (AttributeBuffers(obj, profile) for obj in objects), ply_properties, apply_transforms, chunk_size,
+        )
+        message = f"Exported {total_vertices} points."
 
-            w("ply\n")
-            w(f"format {'ascii' if use_ascii else 'binary_little_endian'} 1.0\n")
-            w(f"element vertex {total_vertices}\n")
-            for prop_name, prop_type, _, _, _ in ply_properties:
-                w(f"property {prop_type} {prop_name}\n")
-            w("end_header\n")
+        with open(filepath, 'w+b' if use_mmap else 'wb') as f:
+            # --- Header ---
+            header = _ply_header(ply_properties, total_vertices, use_ascii, quantization)
+            with profile.stage('write', nbytes=len(header)):
+                f.write(header)
 
             # --- Data ---
-            dtype_list = [
-                (prop_name, _ply_type_to_numpy(prop_type))
-                for prop_name, prop_type, _, _, _ in ply_properties
-            ]
-
-            for obj in objects:
-                count = len(obj.data.attributes['position'].data)
-                if count == 0:
-                    continue
-
-                attrs = obj.data.attributes
-                transformed_cache = {}
-
-                if apply_transforms:
-                    mw = np.array(obj.matrix_world)
-                    R, T = mw[:3, :3], mw[:3, 3]
-
-                    pos_attr = attrs.get('position')
-                    if pos_attr:
-                        arr = np.empty(count * 3, dtype=np.float32)
-                        pos_attr.data.foreach_get('vector', arr)
-                        transformed_cache['position'] = arr.reshape(-1, 3) @ R.T + T
-
-                    norm_attr = attrs.get('normal')
-                    if norm_attr:
-                        arr = np.empty(count * 3, dtype=np.float32)
-                        norm_attr.data.foreach_get('vector', arr)
-                        mat_norm = np.array(
-                            obj.matrix_world.to_3x3().inverted_safe().transposed()
-                        )
-                        n = arr.reshape(-1, 3) @ mat_norm.T
-                        norms = np.linalg.norm(n, axis=1, keepdims=True)
-                        norms[norms == 0] = 1.0
-                        transformed_cache['normal'] = n / norms
-
-                data_columns = []
-                for prop_name, prop_type, _, attr_name, sub_index in ply_properties:
-                    if attr_name in transformed_cache:
-                        data_columns.append(transformed_cache[attr_name][:, sub_index])
-                    else:
-                        attr = attrs.get(attr_name)
-                        if attr is None:
-                            data_columns.append(np.zeros(count, dtype=np.float32))
-                        else:
-                            data_columns.append(
-                                _read_column(attr, count, sub_index, prop_type)
-                            )
-
-                if use_ascii:
-                    np.savetxt(f, np.column_stack(data_columns),
-                               fmt=_get_fmt_string(ply_properties))
-                else:
-                    structured = np.zeros(count, dtype=dtype_list)
-                    for (prop_name, _, _, _, _), col in zip(ply_properties, data_columns):
-                        structured[prop_name] = col
-                    f.write(structured.tobytes())
-
-        return True, f"Exported {total_vertices} points."
+            if use_ascii:
+                encoder = AsciiEncoder(_get_fmt_string(ply_properties))
+                for buffers in release_each(all_buffers):
+                    buffers.reorder(reorder)
+                    chunks = _extract_ply_columns(buffers, ply_properties, apply_transforms, chunk_size)
+                    for count, data_columns in chunks:
+                        with profile.stage('pack', buffers.label):
+                            columns = _ascii_columns(ply_properties, count, data_columns, quantization)
+                        encoder.write(f, columns, profile, buffers.label)
+            else:
+                dtype = _ply_record_dtype(ply_properties)
+                attr_names = list(dict.fromkeys(attr_name for _, _, _, attr_name, _ in ply_properties))
+                session = CacheSession(cache, (
+                    'ply', tuple(ply_properties), apply_transforms, reorder, voxel_size, voxel_mode,
+                    tuple(quantization.items()),
+                ))
+                with record_writer(f, dtype, threads, use_mmap, total_vertices) as writer:
+                    for buffers in release_each(all_buffers):
+                        key, block = session.lookup(buffers, attr_names, apply_transforms=apply_transforms)
+                        if block is not None:
+                            session.write_block(writer, block, profile, buffers.label)
+                            continue
+                        buffers.reorder(reorder)
+                        if buffers.count == 0:
+                            continue
+                        buffers.prefetch(attr_names)
+                        session.submit(writer, key, buffers.count, _write_ply_object,
+                                       buffers, ply_properties, apply_transforms, chunk_size,
+                                       quantization)
+                message += session.report()
+
+        return True, message + profile.report()
 
     except Exception as e:
         return False, str(e)
-
-
-import bpy
-
-PLYFileHandler = None
-
-if hasattr(bpy.types, "FileHandler"):
-    class PLYFileHandler(bpy.types.FileHandler):
-        bl_idname = "ply_pcd_handler"
-        bl_label = "Point Cloud (.ply)"
-        bl_export_operator = "export_mesh.ply_pcd_panel"
-        bl_file_extensions = ".ply"
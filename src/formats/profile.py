@@ -0,0 +1,149 @@
+import json
+import threading
+import time
+
+# Export stages, in report order. Other stage names are reported after these.
+STAGES = ('evaluate', 'fetch', 'fingerprint', 'downsample', 'reorder', 'transform', 'pack', 'write')
+
+
+class _Stage:
+    """Context manager timing one stage; nbytes may be set inside the block."""
+
+    __slots__ = ('profile', 'name', 'label', 'nbytes', 'nested', 'start')
+
+    def __init__(self, profile, name, label, nbytes):
+        self.profile = profile
+        self.name = name
+        self.label = label
+        self.nbytes = nbytes
+
+    def __enter__(self):
+        self.nested = 0.0
+        self.profile._stack().append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        stack = self.profile._stack()
+        stack.pop()
+        if stack:
+            stack[-1].nested += elapsed
+        self.profile.add(self.name, elapsed - self.nested, self.nbytes, self.label)
+
+
+class ExportProfile:
+    """
+    Wall-clock time and bytes spent in each export stage, in total and per
+    object (see STAGES).
+
+    Stages are timed with `with profile.stage(name, label, nbytes):` around
+    the hot-path calls. A stage opened inside another one is subtracted from
+    the outer stage, so each second is counted once per thread. Stages timed
+    on worker threads are summed, so with threads > 1 the stage totals may
+    exceed the wall-clock total.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.elapsed = None
+        self.stages = {}    # stage → [seconds, bytes, calls]
+        self.objects = {}   # object label → {stage → [seconds, bytes]}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def stage(self, name, label=None, nbytes=0):
+        """Returns a context manager timing one stage (of the object called label, if any)."""
+        return _Stage(self, name, label, nbytes)
+
+    def add(self, name, seconds, nbytes=0, label=None):
+        with self._lock:
+            total = self.stages.setdefault(name, [0.0, 0, 0])
+            total[0] += seconds
+            total[1] += nbytes
+            total[2] += 1
+            if label is not None:
+                entry = self.objects.setdefault(label, {}).setdefault(name, [0.0, 0])
+                entry[0] += seconds
+                entry[1] += nbytes
+
+    def finish(self):
+        """Stops the wall-clock total (at the first call)."""
+        if self.elapsed is None:
+            self.elapsed = time.perf_counter() - self.start
+
+    def _ordered(self):
+        return sorted(self.stages, key=lambda name: STAGES.index(name) if name in STAGES else len(STAGES))
+
+    def report(self):
+        """Returns the per-stage totals appended to the export message."""
+        self.finish()
+        parts = []
+        for name in self._ordered():
+            seconds, nbytes, _ = self.stages[name]
+            part = f"{name} {seconds:.3f}s"
+            if nbytes:
+                part += f" ({nbytes / 2**20:.1f} MB)"
+            parts.append(part)
+        return f" Profile: {', '.join(parts)}; total {self.elapsed:.3f}s."
+
+    def as_dict(self):
+        self.finish()
+        return {
+            'total_seconds': self.elapsed,
+            'stages': {
+                name: dict(zip(('seconds', 'bytes', 'calls'), self.stages[name]))
+                for name in self._ordered()
+            },
+            'objects': {
+                label: {name: dict(zip(('seconds', 'bytes'), entry)) for name, entry in stages.items()}
+                for label, stages in self.objects.items()
+            },
+        }
+
+    def dump(self, filepath):
+        """Writes the profile as JSON."""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+
+class _NullStage:
+    nbytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+class _NullProfile:
+    """ExportProfile interface that records nothing: the default when profiling is off."""
+
+    _stage = _NullStage()
+
+    def stage(self, name, label=None, nbytes=0):
+        return self._stage
+
+    def add(self, name, seconds, nbytes=0, label=None):
+        pass
+
+    def finish(self):
+        pass
+
+    def report(self):
+        return ""
+
+
+NULL_PROFILE = _NullProfile()
+
+
+def profile_filepath(filepath):
+    """Returns where the JSON profile of an export to filepath is saved."""
+    return filepath + '.profile.json'
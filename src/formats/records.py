@@ -0,0 +1,203 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+class RecordWriter:
+    """
+    Packs per-object columns into a structured record buffer and writes it
+    straight to a binary file.
+
+    The record layout is computed once per export. A single scratch buffer
+    is grown to the largest object and reused for every object, and records
+    are written from it through the buffer protocol, so no intermediate
+    bytes copy is made.
+    """
+
+    def __init__(self, f, dtype):
+        self.f = f
+        self.dtype = np.dtype(dtype)
+        self._scratch = np.empty(0, dtype=self.dtype)
+
+    def records(self, count):
+        """Returns an uninitialised view of `count` records in the scratch buffer."""
+        if len(self._scratch) < count:
+            self._scratch = np.empty(count, dtype=self.dtype)
+        return self._scratch[:count]
+
+    def write(self, records):
+        """Writes a contiguous run of records without copying it to bytes first."""
+        self.f.write(records.view(np.uint8))
+
+    def submit(self, count, pack, *args):
+        """Packs and writes one object of `count` records: calls pack(self, *args)."""
+        pack(self, *args)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _OffsetWriter:
+    """RecordWriter interface for one object, writing at its own file offset."""
+
+    def __init__(self, parent, offset):
+        self._parent = parent
+        self._offset = offset
+
+    def records(self, count):
+        return self._parent._records(count)
+
+    def write(self, records):
+        data = records.view(np.uint8)
+        self._parent._write_at(data, self._offset)
+        self._offset += len(data)
+
+
+class ParallelRecordWriter:
+    """
+    Thread-pool variant of RecordWriter.
+
+    Since every object's record count is known before it is packed, its byte
+    offset in the file is assigned at submit time, in submission order. Workers
+    then pack objects concurrently, each into its own thread-local scratch
+    buffer, and write them to their offsets with positional writes, so the
+    output is identical to the serial writer.
+
+    The number of objects in flight is bounded to keep the fetched attribute
+    buffers waiting for a worker from piling up.
+    """
+
+    def __init__(self, f, dtype, threads):
+        self.f = f
+        self.dtype = np.dtype(dtype)
+        f.flush()
+        self._offset = f.tell()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=threads) if threads > 1 else None
+        self._pending = []
+        self._max_pending = threads * 2
+
+    def _records(self, count):
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None or len(scratch) < count:
+            scratch = self._local.scratch = np.empty(count, dtype=self.dtype)
+        return scratch[:count]
+
+    def _write_at(self, data, offset):
+        if hasattr(os, 'pwrite'):
+            view = memoryview(data)
+            while view:
+                written = os.pwrite(self.f.fileno(), view, offset)
+                view = view[written:]
+                offset += written
+        else:
+            with self._lock:
+                self.f.seek(offset)
+                self.f.write(data)
+
+    def _object_writer(self, offset):
+        return _OffsetWriter(self, offset)
+
+    def submit(self, count, pack, *args):
+        """Schedules pack(writer, *args) for one object of `count` records."""
+        writer = self._object_writer(self._offset)
+        self._offset += count * self.dtype.itemsize
+        if self._pool is None:
+            pack(writer, *args)
+            return
+        while len(self._pending) >= self._max_pending:
+            self._pending.pop(0).result()
+        self._pending.append(self._pool.submit(pack, writer, *args))
+
+    def close(self):
+        """Waits for all objects to be written; re-raises the first worker error."""
+        try:
+            for future in self._pending:
+                future.result()
+        finally:
+            self._pending = []
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+            self.f.seek(self._offset)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _MappedWriter:
+    """RecordWriter interface for one object, packing straight into its slice of the map."""
+
+    def __init__(self, records, start):
+        self._records = records
+        self._start = start
+
+    def records(self, count):
+        return self._records[self._start:self._start + count]
+
+    def write(self, records):
+        self._start += len(records)
+
+
+class MappedRecordWriter(ParallelRecordWriter):
+    """
+    Memory-mapped variant of ParallelRecordWriter.
+
+    The file is sized up front to the header plus total_count records and
+    mapped as a structured np.memmap, so each object's columns are stored
+    directly into its slice of the mapped file: there is no intermediate
+    record buffer and no write call, and the OS can page data out as the
+    export progresses. The file must be opened for reading and writing.
+    """
+
+    def __init__(self, f, dtype, total_count, threads=1):
+        super().__init__(f, dtype, threads)
+        self._header_size = self._offset
+        f.truncate(self._header_size + total_count * self.dtype.itemsize)
+        self._map = np.memmap(f, dtype=self.dtype, mode='r+',
+                              offset=self._header_size, shape=(total_count,))
+
+    def _object_writer(self, offset):
+        return _MappedWriter(self._map, (offset - self._header_size) // self.dtype.itemsize)
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._map.flush()
+            self._map = None
+
+
+def record_writer(f, dtype, threads=1, use_mmap=False, total_count=0):
+    """
+    Returns the record writer for an export: a MappedRecordWriter if use_mmap
+    is set (and there is anything to map), otherwise a ParallelRecordWriter
+    if threads > 1, otherwise a plain RecordWriter.
+    """
+    if use_mmap and total_count > 0:
+        return MappedRecordWriter(f, dtype, total_count, threads)
+    if threads > 1:
+        return ParallelRecordWriter(f, dtype, threads)
+    return RecordWriter(f, dtype)
+
+
+def iter_chunks(count, chunk_size=0):
+    """
+    Yields (start, stop) point ranges covering `count` points.
+
+    chunk_size <= 0 yields a single range for the whole object.
+    """
+    step = chunk_size if chunk_size > 0 else count
+    for start in range(0, count, max(step, 1)):
+        yield start, min(start + step, count)
@@ -0,0 +1,174 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import analytics
+from .ascii import AsciiEncoder
+from .attributes import AttributeBuffers
+from .ply import (
+    _ascii_columns, _build_ply_properties, _extract_ply_columns, _get_fmt_string, _ply_header,
+    _ply_record_dtype, _quantization_ranges, _write_ply_object,
+)
+from .profile import NULL_PROFILE
+from .records import RecordWriter
+from .sources import point_source
+
+# ---------------------------------------------------------------------------
+# Frame sequences: one PLY file per frame of the scene
+# ---------------------------------------------------------------------------
+
+# Run of '#' in a file name, replaced by the zero-padded frame number
+_FRAME_PLACEHOLDER = re.compile(r'#+')
+
+
+def frame_filepath(filepath, frame):
+    """
+    Returns the path of one frame's file. The last run of '#' in the file name
+    is replaced by the frame number padded to its length (Blender's
+    convention); without one, '_<frame:04d>' is inserted before the extension.
+    """
+    head, name = os.path.split(filepath)
+    matches = list(_FRAME_PLACEHOLDER.finditer(name))
+    if matches:
+        m = matches[-1]
+        name = f"{name[:m.start()]}{frame:0{len(m.group())}d}{name[m.end():]}"
+    else:
+        stem, ext = os.path.splitext(name)
+        name = f"{stem}_{frame:04d}{ext}"
+    return os.path.join(head, name)
+
+
+class _PLYFrameWriter:
+    """
+    Encodes and writes the frames of a PLY sequence with a fixed schema.
+
+    The record scratch buffer and the ASCII encoder are created once and
+    reused for every frame. write() only touches prefetched AttributeBuffers,
+    so it runs on the sequence's worker thread.
+    """
+
+    def __init__(self, ply_properties, use_ascii, apply_transforms, chunk_size, profile=NULL_PROFILE):
+        self.ply_properties = ply_properties
+        self.profile = profile
+        self.use_ascii = use_ascii
+        self.apply_transforms = apply_transforms
+        self.chunk_size = chunk_size
+        self.encoder = AsciiEncoder(_get_fmt_string(ply_properties)) if use_ascii else None
+        self.writer = None if use_ascii else RecordWriter(None, _ply_record_dtype(ply_properties))
+
+    def write(self, filepath, frame_buffers, quantization):
+        """Writes one frame's objects to filepath; returns its point count."""
+        count = sum(buffers.count for buffers in frame_buffers)
+        with open(filepath, 'wb') as f:
+            header = _ply_header(self.ply_properties, count, self.use_ascii, quantization)
+            with self.profile.stage('write', nbytes=len(header)):
+                f.write(header)
+            if self.use_ascii:
+                for buffers in frame_buffers:
+                    chunks = _extract_ply_columns(buffers, self.ply_properties,
+                                                  self.apply_transforms, self.chunk_size)
+                    for chunk_count, data_columns in chunks:
+                        with self.profile.stage('pack', buffers.label):
+                            columns = _ascii_columns(self.ply_properties, chunk_count, data_columns,
+                                                     quantization)
+                        self.encoder.write(f, columns, self.profile, buffers.label)
+            else:
+                self.writer.f = f
+                try:
+                    for buffers in frame_buffers:
+                        if buffers.count:
+                            _write_ply_object(self.writer, buffers, self.ply_properties,
+                                              self.apply_transforms, self.chunk_size, quantization)
+                finally:
+                    self.writer.f = None
+        return count
+
+
+@analytics.track_event(
+    "export_ply_sequence",
+    lambda scene, get_objects, filepath, frames, use_ascii=False, *_, **__: {
+        "format": "ascii" if use_ascii else "binary",
+        "frame_count": len(frames),
+    }
+)
+def export_ply_sequence(scene, get_objects, filepath, frames, use_ascii=False, apply_transforms=False,
+                        chunk_size=0, reorder='NONE', voxel_size=0.0, voxel_mode='FIRST',
+                        quantize='NONE', profile=None):
+    """
+    Export a numbered sequence of PLY files, one per frame in `frames`
+    (file names as in frame_filepath).
+
+    For every frame the scene is stepped and get_objects() returns the
+    evaluated PointCloud objects to write. The property schema is built once
+    from the first frame and reused, together with the record buffer and
+    encoder; attributes missing on a later frame are written as zeros.
+
+    Attributes are fetched on the calling thread. Encoding and writing frame
+    N then runs on a worker thread while frame N+1 is evaluated, so at most
+    two frames are held in memory. Their fetch arrays are double-buffered:
+    frame N+1 reads into the arrays of frame N-1, whose write has finished,
+    as long as each object's attribute sizes do not change.
+
+    The options are those of export_ply except threads, use_mmap and cache,
+    which do not apply: each frame is written serially by the worker thread
+    to a plain file, and frames are not cached. The scene's current frame is
+    restored afterwards.
+
+    profile (an ExportProfile) accumulates the stage timings of all frames,
+    with stepping the scene counted as evaluation.
+    """
+    if not frames:
+        return False, "No frames to export"
+
+    profile = profile or NULL_PROFILE
+
+    original_frame = scene.frame_current
+    frame_writer = None
+    attr_names = None
+    pending = None
+    total_vertices = 0
+    # One scratch dict per object, for even and odd frames (see AttributeBuffers)
+    scratch = ([], [])
+
+    try:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            for index, frame in enumerate(frames):
+                with profile.stage('evaluate'):
+                    scene.frame_set(frame)
+                objects = [point_source(obj) for obj in get_objects()]
+
+                if frame_writer is None:
+                    if not objects:
+                        return False, f"No objects to export at frame {frame}"
+                    ply_properties, error = _build_ply_properties(objects[0].schema, quantize)
+                    if error:
+                        return False, error
+                    attr_names = list(dict.fromkeys(attr_name for _, _, _, attr_name, _ in ply_properties))
+                    frame_writer = _PLYFrameWriter(ply_properties, use_ascii, apply_transforms, chunk_size,
+                                                   profile)
+
+                frame_scratch = scratch[index % 2]
+                frame_scratch.extend({} for _ in range(len(objects) - len(frame_scratch)))
+                frame_buffers = []
+                for obj, obj_scratch in zip(objects, frame_scratch):
+                    buffers = AttributeBuffers(obj, profile, obj_scratch)
+                    buffers.downsample(voxel_size, voxel_mode, apply_transforms)
+                    buffers.reorder(reorder)
+                    buffers.prefetch(attr_names)
+                    frame_buffers.append(buffers)
+                quantization = _quantization_ranges(frame_buffers, ply_properties, apply_transforms, chunk_size)
+
+                if pending is not None:
+                    total_vertices += pending.result()
+                pending = pool.submit(frame_writer.write, frame_filepath(filepath, frame),
+                                      frame_buffers, quantization)
+
+            total_vertices += pending.result()
+
+        return True, f"Exported {len(frames)} frames ({total_vertices} points)." + profile.report()
+
+    except Exception as e:
+        return False, str(e)
+
+    finally:
+        scene.frame_set(original_frame)
@@ -0,0 +1,173 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+# Blender data_type → (foreach_get property, components, numpy dtype)
+# Each dtype is the attribute's native width, so buffers are never widened.
+_ATTRIBUTE_LAYOUT = {
+    'FLOAT':        ('value',  1, np.float32),
+    'INT':          ('value',  1, np.int32),
+    'INT8':         ('value',  1, np.int8),
+    'BOOLEAN':      ('value',  1, np.bool_),
+    'FLOAT_VECTOR': ('vector', 3, np.float32),
+    'FLOAT2':       ('vector', 2, np.float32),
+    'FLOAT_COLOR':  ('color',  4, np.float32),
+    'BYTE_COLOR':   ('color',  4, np.float32),
+    'QUATERNION':   ('value',  4, np.float32),
+}
+
+# Float array width → data_type inferred for ArrayPointCloud
+_FLOAT_TYPES = {1: 'FLOAT', 2: 'FLOAT2', 3: 'FLOAT_VECTOR', 4: 'FLOAT_COLOR'}
+
+
+def read_attribute(attr, count, out=None):
+    """
+    Read a whole Blender attribute with a single foreach_get call.
+
+    Returns a typed array of shape (count,) for scalar types or (count, k)
+    for vector types, or None if the data type is not supported. out, if it
+    is a writable array of that shape and dtype, is filled and returned
+    instead of allocating a new one.
+    """
+    layout = _ATTRIBUTE_LAYOUT.get(attr.data_type)
+    if layout is None:
+        return None
+
+    prop, components, dtype = layout
+    shape = (count,) if components == 1 else (count, components)
+    if out is not None and out.shape == shape and out.dtype == dtype and out.flags.writeable \
+            and out.flags.c_contiguous:
+        attr.data.foreach_get(prop, out.reshape(-1))
+        return out
+    buf = np.empty(count * components, dtype=dtype)
+    attr.data.foreach_get(prop, buf)
+    return buf.reshape(shape)
+
+
+# ---------------------------------------------------------------------------
+# Point sources: what the exporters read points from
+#
+# A source exposes `schema` (attribute name → Blender data_type, in attribute
+# order), `count`, a 4x4 `matrix_world`, a `name` (or None) labelling it in
+# export profiles, read(name, out=None) returning the typed buffer
+# laid out as in _ATTRIBUTE_LAYOUT (or None), and read_float_into(name, out)
+# filling a float32 row from a FLOAT attribute (False if there is none).
+# read() may fill and return `out`, an earlier buffer of the same attribute
+# that the caller no longer uses, instead of allocating.
+# ---------------------------------------------------------------------------
+
+
+class BlenderPointCloud:
+    """Point source over an (evaluated) Blender PointCloud object."""
+
+    def __init__(self, obj):
+        self.name = obj.name
+        self._attributes = obj.data.attributes
+        self.schema = {attr.name: attr.data_type for attr in self._attributes if attr.domain == 'POINT'}
+        position = self._attributes.get('position')
+        self.count = len(position.data) if position is not None else 0
+        self.matrix_world = np.array(obj.matrix_world)
+
+    def read(self, name, out=None):
+        attr = self._attributes.get(name)
+        return read_attribute(attr, self.count, out) if attr is not None else None
+
+    def read_float_into(self, name, out):
+        attr = self._attributes.get(name)
+        if attr is None or attr.data_type != 'FLOAT':
+            return False
+        attr.data.foreach_get('value', out)
+        return True
+
+
+def _infer_data_type(array):
+    if array.dtype == np.bool_:
+        return 'BOOLEAN'
+    if array.dtype == np.int8:
+        return 'INT8'
+    if array.dtype.kind in 'iu' and array.ndim == 1:
+        return 'INT'
+    if array.dtype == np.uint8 and array.ndim == 2 and array.shape[1] == 4:
+        return 'BYTE_COLOR'
+    if array.dtype.kind == 'f':
+        return _FLOAT_TYPES.get(1 if array.ndim == 1 else array.shape[1])
+    return None
+
+
+class ArrayPointCloud:
+    """
+    Point source over plain NumPy arrays, for exporting without Blender.
+
+    arrays maps attribute names to per-point arrays of equal length; a
+    'position' array of shape (N, 3) is required by every exporter. Data
+    types follow Blender's and are inferred from each array:
+
+      bool           → BOOLEAN          int8 → INT8     other integers → INT
+      float (N,)     → FLOAT            float (N, 2)    → FLOAT2
+      float (N, 3)   → FLOAT_VECTOR     float (N, 4)    → FLOAT_COLOR
+      uint8 (N, 4)   → BYTE_COLOR (0-255, read as 0-1 floats like Blender)
+
+    data_types overrides the inferred type of individual names (e.g.
+    'QUATERNION' for (N, 4) rotations). matrix_world is the object-to-world
+    transform used when transforms are applied (identity by default).
+    Arrays already in the layout's dtype are read without a copy. name labels
+    the object in export profiles.
+    """
+
+    def __init__(self, arrays, matrix_world=None, data_types=None, name=None):
+        self.name = name
+        self._arrays = {name: np.asarray(array) for name, array in arrays.items()}
+        data_types = data_types or {}
+        position = self._arrays.get('position')
+        self.count = len(position) if position is not None else 0
+
+        self.schema = {}
+        for name, array in self._arrays.items():
+            data_type = data_types.get(name) or _infer_data_type(array)
+            if data_type not in _ATTRIBUTE_LAYOUT:
+                raise ValueError(f"Unsupported array for attribute '{name}': "
+                                 f"dtype {array.dtype}, shape {array.shape}")
+            if len(array) != self.count:
+                raise ValueError(f"Attribute '{name}' has {len(array)} points, expected {self.count}")
+            self.schema[name] = data_type
+
+        self.matrix_world = (
+            np.eye(4) if matrix_world is None
+            else np.asarray(matrix_world, dtype=np.float64).reshape(4, 4)
+        )
+
+    def read(self, name, out=None):
+        # Arrays are returned without a copy where possible, so `out` is not used
+        array = self._arrays.get(name)
+        if array is None:
+            return None
+        data_type = self.schema[name]
+        _, components, dtype = _ATTRIBUTE_LAYOUT[data_type]
+        if data_type == 'BYTE_COLOR' and array.dtype == np.uint8:
+            array = array * np.float32(1.0 / 255.0)
+        shape = (self.count,) if components == 1 else (self.count, components)
+        buf = np.ascontiguousarray(array, dtype=dtype).reshape(shape)
+        if np.may_share_memory(buf, array):
+            # Caller-owned memory: the exporters never write to their buffers
+            buf = buf.view()
+            buf.flags.writeable = False
+        return buf
+
+    def read_float_into(self, name, out):
+        if self.schema.get(name) != 'FLOAT':
+            return False
+        out[...] = self._arrays[name]
+        return True
+
+
+def point_source(obj):
+    """
+    Returns the point source for an exporter input: point sources are used
+    as-is, a mapping of name → array becomes an ArrayPointCloud, and anything
+    else is taken to be a Blender PointCloud object.
+    """
+    if isinstance(obj, (BlenderPointCloud, ArrayPointCloud)):
+        return obj
+    if isinstance(obj, Mapping):
+        return ArrayPointCloud(obj)
+    return BlenderPointCloud(obj)
@@ -1,6 +1,13 @@
+import re
+
 import numpy as np
-import bpy
 from .. import analytics
+from .ascii import AsciiEncoder
+from .attributes import prepare_buffers, release_each
+from .cache import CacheSession
+from .profile import NULL_PROFILE
+from .records import iter_chunks, record_writer
+from .sources import point_source
 
 # 0th-order spherical harmonic constant: used to recover RGB from f_dc coefficients
 _SH_C0 = 0.28209479177387814
@@ -13,11 +20,26 @@ _SPLAT_BIN_DTYPE = np.dtype([
     ('q0', 'u1'), ('q1', 'u1'), ('q2', 'u1'), ('q3', 'u1'),   # rotation quaternion
 ])
 
+# Higher-order SH coefficient attribute names: f_rest_0, f_rest_1, ...
+_F_REST_RE = re.compile(r'f_rest_(\d+)')
+
+# Higher-order SH coefficients per color channel for degrees 0..3
+_SH_DIMS = (0, 3, 8, 15)
+
 
-def _count_f_rest(attributes) -> int:
-    """Returns the number of f_rest_N scalar attributes present."""
+def _count_f_rest(schema) -> int:
+    """
+    Returns the number of f_rest_N scalar attributes present, i.e. the length
+    of the contiguous run f_rest_0, f_rest_1, ... found in a single pass over
+    the attribute names.
+    """
+    indices = set()
+    for name in schema:
+        match = _F_REST_RE.fullmatch(name)
+        if match:
+            indices.add(int(match.group(1)))
     count = 0
-    while f'f_rest_{count}' in attributes:
+    while count in indices:
         count += 1
     return count
 
@@ -31,121 +53,262 @@ def _build_prop_names(f_rest_count: int) -> list[str]:
     return names
 
 
-def _extract_columns(obj, f_rest_count: int, apply_transforms: bool) -> tuple[int, list]:
-    """Extract numpy column arrays from a single splat object."""
-    attrs = obj.data.attributes
-    count = len(attrs['position'].data)
+def _sh_degree(f_rest_count: int) -> int:
+    """Returns the highest SH degree fully covered by f_rest_count coefficients."""
+    dim = f_rest_count // 3
+    return max(d for d in range(4) if _SH_DIMS[d] <= dim)
+
+
+def _f_rest_names(f_rest_count: int, sh_degree: int = 3) -> list[str]:
+    """
+    Returns the source f_rest attribute names to export, in output order.
+
+    f_rest is channel-major (all R coefficients, then G, then B), so capping
+    the degree keeps the first _SH_DIMS[sh_degree] coefficients of each
+    channel; the kept names are renumbered contiguously on output.
+    """
+    if sh_degree >= _sh_degree(f_rest_count):
+        return [f'f_rest_{i}' for i in range(f_rest_count)]
+    stride = f_rest_count // 3
+    return [f'f_rest_{c * stride + j}' for c in range(3) for j in range(_SH_DIMS[sh_degree])]
+
+
+def _splat_sources(buffers, sh_names: list[str]):
+    """
+    Returns the per-object source data for the non-positional 3DGS properties:
+    (f_dc columns, (len(sh_names), N) SH block, opacity/scale/rot columns).
+    """
+    dc = [buffers.float(f'f_dc_{i}') for i in range(3)]
+    sh = buffers.float_block(sh_names)
+    tail = [buffers.float('opacity', default=0.0)]
+    tail += [buffers.float(f'scale_{i}', default=0.0) for i in range(3)]
+    tail += [buffers.float(f'rot_{i}', default=0.0) for i in range(4)]
+    return dc, sh, tail
+
 
-    def get_float(name, default=0.0):
-        attr = attrs.get(name)
-        if attr and attr.data_type == 'FLOAT':
-            col = np.empty(count, dtype=np.float32)
-            attr.data.foreach_get('value', col)
-            return col
-        return np.full(count, default, dtype=np.float32)
+def _transformed_positions(buffers, apply_transforms, start, stop, out=None):
+    p = buffers.get('position')[start:stop]
+    if apply_transforms:
+        with buffers.profile.stage('transform', buffers.label):
+            return buffers.transform.points(p, out)
+    if out is not None:
+        out[...] = p
+        return out
+    return p
+
+
+def _transformed_splats(buffers, apply_transforms, scale_cols, rot_cols, start, stop):
+    """
+    Returns a chunk's (log-scales (n, 3), rotations (n, 4)) as float32 arrays,
+    with the object's rotation and scale baked in if apply_transforms is set
+    (see transform.Transform.splats).
+    """
+    scales = np.stack([col[start:stop] for col in scale_cols], axis=1)
+    rots = np.stack([col[start:stop] for col in rot_cols], axis=1)
+    if apply_transforms:
+        with buffers.profile.stage('transform', buffers.label):
+            buffers.transform.splats(scales, rots)
+    return scales, rots
 
-    # Position
-    pos_arr = np.empty(count * 3, dtype=np.float32)
-    attrs['position'].data.foreach_get('vector', pos_arr)
-    pos = pos_arr.reshape(-1, 3)
 
+def _transformed_sh(buffers, apply_transforms, sh, start, stop):
+    """
+    Returns a chunk of the (coefficients, N) SH block, rotated by the object's
+    rotation if apply_transforms is set (see transform.Transform.sh).
+    """
+    block = sh[:, start:stop]
     if apply_transforms:
-        mw = np.array(obj.matrix_world)
-        pos = pos @ mw[:3, :3].T + mw[:3, 3]
+        with buffers.profile.stage('transform', buffers.label):
+            block = buffers.transform.sh(block)
+    return block
+
+
+def _extract_columns(buffers, sh_names: list[str], apply_transforms: bool, chunk_size: int = 0):
+    """
+    Yields (count, columns) for each chunk of points of a single splat object.
+
+    Attributes are fetched once per object; the transformed positions, scales
+    and rotations are only computed for the current chunk.
+    """
+    dc, sh, tail = _splat_sources(buffers, sh_names)
+
+    for start, stop in iter_chunks(buffers.count, chunk_size):
+        p = _transformed_positions(buffers, apply_transforms, start, stop)
+
+        zeros = np.zeros(stop - start, dtype=np.float32)
+        columns = [p[:, 0], p[:, 1], p[:, 2]]         # x, y, z
+        columns += [zeros] * 3                         # nx, ny, nz (unused in 3DGS)
+        columns += [col[start:stop] for col in dc]
+        columns += list(_transformed_sh(buffers, apply_transforms, sh, start, stop))
+        if apply_transforms:
+            scales, rots = _transformed_splats(buffers, apply_transforms, tail[1:4], tail[4:8], start, stop)
+            columns += [tail[0][start:stop], *scales.T, *rots.T]
+        else:
+            columns += [col[start:stop] for col in tail]
 
-    columns = [pos[:, 0], pos[:, 1], pos[:, 2]]           # x, y, z
-    columns += [np.zeros(count, dtype=np.float32)] * 3     # nx, ny, nz (unused in 3DGS)
-    columns += [get_float(f'f_dc_{i}') for i in range(3)]
-    columns += [get_float(f'f_rest_{i}') for i in range(f_rest_count)]
-    columns.append(get_float('opacity', default=0.0))
-    columns += [get_float(f'scale_{i}', default=0.0) for i in range(3)]
-    columns += [get_float(f'rot_{i}', default=0.0) for i in range(4)]
+        yield stop - start, columns
 
-    return count, columns
+
+def _write_splat_object(writer, buffers, sh_names, apply_transforms, chunk_size):
+    """
+    Packs a single object into binary 3DGS PLY records and writes them.
+
+    Every property is float32, so the records are filled through a plain
+    (count, properties) float32 view; the SH block lands in its column range
+    with a single transposed copy.
+    """
+    dc, sh, tail = _splat_sources(buffers, sh_names)
+    sh_end = 9 + len(sh_names)
+    profile, label = buffers.profile, buffers.label
+
+    for start, stop in iter_chunks(buffers.count, chunk_size):
+        count = stop - start
+        with profile.stage('pack', label):
+            records = writer.records(count)
+            values = records.view(np.float32).reshape(count, -1)
+
+            _transformed_positions(buffers, apply_transforms, start, stop, out=values[:, 0:3])
+            values[:, 3:6] = 0.0
+            for i, col in enumerate(dc):
+                values[:, 6 + i] = col[start:stop]
+            values[:, 9:sh_end] = _transformed_sh(buffers, apply_transforms, sh, start, stop).T
+            values[:, sh_end] = tail[0][start:stop]
+            if apply_transforms:
+                scales, rots = _transformed_splats(buffers, apply_transforms, tail[1:4], tail[4:8], start, stop)
+                values[:, sh_end + 1:sh_end + 4] = scales
+                values[:, sh_end + 4:sh_end + 8] = rots
+            else:
+                for i, col in enumerate(tail[1:], 1):
+                    values[:, sh_end + i] = col[start:stop]
+
+        with profile.stage('write', label, records.nbytes):
+            writer.write(records)
 
 
 @analytics.track_event(
     "export_splat",
-    lambda objects, filepath, use_ascii=False, apply_transforms=False: {
+    lambda objects, filepath, use_ascii=False, *_, **__: {
         "format": "ascii" if use_ascii else "binary",
         "object_count": len(objects),
     }
 )
-def export_splat_ply(objects, filepath, use_ascii=False, apply_transforms=False):
+def export_splat_ply(objects, filepath, use_ascii=False, apply_transforms=False, chunk_size=0,
+                     threads=1, use_mmap=False, reorder='NONE',
+                     voxel_size=0.0, voxel_mode='FIRST', sh_degree=3, cache=None, profile=None):
     """
-    Export Gaussian Splat objects to a standard 3DGS PLY file.
+    Export Gaussian Splat objects (Blender objects or NumPy point sources,
+    see sources.point_source) to a standard 3DGS PLY file.
 
     All scalar fields (f_dc, f_rest, opacity, scale, rot) are written as float32.
-    apply_transforms only affects splat positions; scale/rotation splat properties
-    are written as-is (they are already expressed in local object space by convention).
+    apply_transforms bakes the object's transform into positions, its
+    rotation and scale into each splat's rotation and log-scales, and its
+    rotation into the f_rest coefficients (see transform.Transform).
+
+    chunk_size > 0 streams each object in ranges of that many splats; the output
+    is identical to the non-streamed export.
+
+    threads > 1 packs and writes objects concurrently (binary output only);
+    the output is identical to the serial export.
+
+    use_mmap packs binary records directly into a memory-mapped output file.
+
+    reorder ('NONE', 'MORTON' or 'HILBERT') sorts each object's splats along a
+    space-filling curve before writing.
+
+    voxel_size > 0 keeps one splat per occupied voxel ('FIRST' or 'RANDOM'
+    representative), or averages every stored property per voxel ('MEAN',
+    with rotations sign-aligned and renormalized).
+
+    sh_degree (0-3) caps the exported spherical harmonics degree. Coefficients
+    above it are never read from Blender.
+
+    cache (an ExportCache) reuses the packed records of unchanged objects
+    (binary output only), and profile (an ExportProfile) times every export
+    stage; see export_ply.
     """
     if not objects:
         return False, "No objects to export"
 
-    ref_attrs = objects[0].data.attributes
-    f_rest_count = _count_f_rest(ref_attrs)
+    profile = profile or NULL_PROFILE
+    objects = [point_source(obj) for obj in objects]
+    sh_names = _f_rest_names(_count_f_rest(objects[0].schema), sh_degree)
+    f_rest_count = len(sh_names)
     prop_names = _build_prop_names(f_rest_count)
-    total_vertices = sum(len(obj.data.attributes['position'].data) for obj in objects)
 
     try:
-        with open(filepath, 'wb' if not use_ascii else 'w') as f:
+        all_buffers, total_vertices = prepare_buffers(objects, voxel_size, voxel_mode, apply_transforms, profile)
+        message = f"Exported {total_vertices} splats."
+
+        with open(filepath, 'w+b' if use_mmap else 'wb') as f:
             # --- Header ---
-            if use_ascii:
-                f.write("ply\n")
-                f.write("format ascii 1.0\n")
-                f.write(f"element vertex {total_vertices}\n")
-                for name in prop_names:
-                    f.write(f"property float {name}\n")
-                f.write("end_header\n")
-            else:
+            with profile.stage('write'):
                 f.write(b"ply\n")
-                f.write(b"format binary_little_endian 1.0\n")
+                f.write(b"format ascii 1.0\n" if use_ascii else b"format binary_little_endian 1.0\n")
                 f.write(f"element vertex {total_vertices}\n".encode())
                 for name in prop_names:
                     f.write(f"property float {name}\n".encode())
                 f.write(b"end_header\n")
 
             # --- Data ---
-            dtype_list = [(name, 'f4') for name in prop_names]
-
-            for obj in objects:
-                count, columns = _extract_columns(obj, f_rest_count, apply_transforms)
-                if count == 0:
-                    continue
-
-                if use_ascii:
-                    stacked = np.column_stack(columns)
-                    np.savetxt(f, stacked, fmt='%.6f')
-                else:
-                    structured = np.zeros(count, dtype=dtype_list)
-                    for name, col in zip(prop_names, columns):
-                        structured[name] = col
-                    f.write(structured.tobytes())
-
-        return True, f"Exported {total_vertices} splats."
+            if use_ascii:
+                encoder = AsciiEncoder(' '.join(['%.6f'] * len(prop_names)))
+                for buffers in release_each(all_buffers):
+                    buffers.reorder(reorder)
+                    for _, columns in _extract_columns(buffers, sh_names, apply_transforms, chunk_size):
+                        encoder.write(f, columns, profile, buffers.label)
+            else:
+                attr_names = ['position'] + prop_names[6:9] + prop_names[9 + f_rest_count:]
+                dtype = [(name, '<f4') for name in prop_names]
+                session = CacheSession(cache, (
+                    'splat_ply', tuple(prop_names), tuple(sh_names), apply_transforms, reorder,
+                    voxel_size, voxel_mode,
+                ))
+                with record_writer(f, dtype, threads, use_mmap, total_vertices) as writer:
+                    for buffers in release_each(all_buffers):
+                        key, block = session.lookup(buffers, attr_names, sh_names, apply_transforms)
+                        if block is not None:
+                            session.write_block(writer, block, profile, buffers.label)
+                            continue
+                        buffers.reorder(reorder)
+                        if buffers.count == 0:
+                            continue
+                        buffers.prefetch(attr_names)
+                        buffers.float_block(sh_names)
+                        session.submit(writer, key, buffers.count, _write_splat_object, buffers,
+                                       sh_names, apply_transforms, chunk_size)
+                message += session.report()
+
+        return True, message + profile.report()
 
     except Exception as e:
         return False, str(e)
 
 
-SplatFileHandler = None
-
-if hasattr(bpy.types, "FileHandler"):
-    class SplatFileHandler(bpy.types.FileHandler):
-        bl_idname = "ply_splat_handler"
-        bl_label = "Gaussian Splat (.ply)"
-        bl_export_operator = "export_mesh.ply_splat_panel"
-        bl_file_extensions = ".ply"
-
-
 # ---------------------------------------------------------------------------
 # .splat binary format (antimatter15 / compact, 32 bytes per splat)
 # ---------------------------------------------------------------------------
 
-def _extract_splat_bin_data(obj, apply_transforms: bool):
+# Splats packed per block by _SplatBinEncoder: bounds its float32 scratch buffers
+_SPLAT_BIN_BLOCK_ROWS = 1 << 16
+
+# Attributes read by the .splat encoder
+_SPLAT_BIN_ATTRS = (
+    ['position', 'opacity']
+    + [f'scale_{i}' for i in range(3)]
+    + [f'f_dc_{i}' for i in range(3)]
+    + [f'rot_{i}' for i in range(4)]
+)
+
+
+class _SplatBinEncoder:
     """
-    Extract and pack a single object into a structured numpy array
-    matching _SPLAT_BIN_DTYPE (32 bytes per splat).
+    Packs one object's splats into _SPLAT_BIN_DTYPE records.
+
+    Work is done in blocks of block_rows splats through float32 scratch rows
+    allocated once per object: every ufunc runs out= on contiguous rows, and
+    each result row is stored with a single strided copy into its record
+    field (strided ufunc output is several times slower). No temporary grows
+    with the chunk or the object.
 
     Conversions applied:
       scale      : exp(log_scale)   — stored linear, not log
@@ -153,102 +316,171 @@ def _extract_splat_bin_data(obj, apply_transforms: bool):
       alpha      : clamp(sigmoid(opacity) * 255, 0, 255)
       rotation   : normalize quaternion, map [-1,1] → [0,255]
     """
-    attrs = obj.data.attributes
-    count = len(attrs['position'].data)
-
-    def get_float(name, default=0.0):
-        attr = attrs.get(name)
-        if attr and attr.data_type == 'FLOAT':
-            col = np.empty(count, dtype=np.float32)
-            attr.data.foreach_get('value', col)
-            return col
-        return np.full(count, default, dtype=np.float32)
-
-    # Position
-    pos_arr = np.empty(count * 3, dtype=np.float32)
-    attrs['position'].data.foreach_get('vector', pos_arr)
-    pos = pos_arr.reshape(-1, 3)
-    if apply_transforms:
-        mw = np.array(obj.matrix_world)
-        pos = pos @ mw[:3, :3].T + mw[:3, 3]
-
-    # Scale: convert from log-space to linear
-    log_scales = np.stack([get_float(f'scale_{i}', 0.0) for i in range(3)], axis=1)
-    scales = np.exp(log_scales)  # (N, 3)
-
-    # Color: bake 0th-order SH to RGB
-    dc = np.stack([get_float(f'f_dc_{i}') for i in range(3)], axis=1)  # (N, 3)
-    rgb = np.clip((0.5 + _SH_C0 * dc) * 255.0, 0, 255).astype(np.uint8)
-
-    # Alpha: sigmoid activation on stored opacity logit
-    opacity = get_float('opacity', 0.0)
-    alpha = np.clip((1.0 / (1.0 + np.exp(-opacity))) * 255.0, 0, 255).astype(np.uint8)
-
-    # Rotation: normalize quaternion, pack into [0, 255]
-    rot = np.stack([get_float(f'rot_{i}', 0.0) for i in range(4)], axis=1)  # (N, 4)
-    norms = np.linalg.norm(rot, axis=1, keepdims=True)
-    norms[norms == 0] = 1.0
-    rot_norm = rot / norms
-    rot_u8 = np.clip((0.5 + rot_norm * 0.5) * 255.0, 0, 255).astype(np.uint8)
-
-    structured = np.zeros(count, dtype=_SPLAT_BIN_DTYPE)
-    structured['x'] = pos[:, 0]
-    structured['y'] = pos[:, 1]
-    structured['z'] = pos[:, 2]
-    structured['sx'] = scales[:, 0]
-    structured['sy'] = scales[:, 1]
-    structured['sz'] = scales[:, 2]
-    structured['r'] = rgb[:, 0]
-    structured['g'] = rgb[:, 1]
-    structured['b'] = rgb[:, 2]
-    structured['a'] = alpha
-    structured['q0'] = rot_u8[:, 0]
-    structured['q1'] = rot_u8[:, 1]
-    structured['q2'] = rot_u8[:, 2]
-    structured['q3'] = rot_u8[:, 3]
-
-    return count, structured
+
+    def __init__(self, buffers, apply_transforms, block_rows=_SPLAT_BIN_BLOCK_ROWS):
+        self.buffers = buffers
+        self.apply_transforms = apply_transforms
+        self.block_rows = block_rows
+        self.scale_cols = [buffers.float(f'scale_{i}', 0.0) for i in range(3)]
+        self.dc_cols = [buffers.float(f'f_dc_{i}') for i in range(3)]
+        self.opacity_col = buffers.float('opacity', 0.0)
+        self.rot_cols = [buffers.float(f'rot_{i}', 0.0) for i in range(4)]
+        rows = min(block_rows, buffers.count)
+        self._work = np.empty((4, rows), dtype=np.float32)
+        self._square = np.empty(rows, dtype=np.float32)
+        self._norm = np.empty(rows, dtype=np.float32)
+
+    def encode(self, records, start):
+        """Fills records with the splats [start, start + len(records)) of the object."""
+        floats = records.view(np.float32).reshape(-1, 8)
+        codes = records.view(np.uint8).reshape(-1, 32)[:, 24:]
+        for lo, hi in iter_chunks(len(records), self.block_rows):
+            self._encode_block(floats[lo:hi], codes[lo:hi], start + lo, start + hi)
+
+    def _encode_block(self, floats, codes, start, stop):
+        count = stop - start
+        work = self._work[:, :count]
+
+        if self.apply_transforms:
+            _transformed_positions(self.buffers, True, start, stop, out=floats[:, 0:3])
+            log_scales, rot = _transformed_splats(self.buffers, True, self.scale_cols, self.rot_cols,
+                                                  start, stop)
+            scale_rows, rot_rows = log_scales.T, rot.T
+        else:
+            pos = self.buffers.get('position')[start:stop]
+            for i in range(3):
+                floats[:, i] = pos[:, i]
+            scale_rows = [col[start:stop] for col in self.scale_cols]
+            rot_rows = [col[start:stop] for col in self.rot_cols]
+
+        # Scale: convert from log-space to linear
+        for i, row in enumerate(scale_rows):
+            np.exp(row, out=work[i])
+            floats[:, 3 + i] = work[i]
+
+        # Color: bake 0th-order SH to RGB; alpha: sigmoid of the opacity logit
+        for i, col in enumerate(self.dc_cols):
+            np.multiply(col[start:stop], _SH_C0, out=work[i])
+        np.add(work[:3], 0.5, out=work[:3])
+        alpha = work[3]
+        np.negative(self.opacity_col[start:stop], out=alpha)
+        np.exp(alpha, out=alpha)
+        np.add(alpha, 1.0, out=alpha)
+        np.divide(1.0, alpha, out=alpha)
+        self._store_codes(work, codes[:, 0:4])
+
+        # Rotation: normalize quaternion, pack into [0, 255]
+        for i, row in enumerate(rot_rows):
+            work[i] = row
+        norm, square = self._norm[:count], self._square[:count]
+        np.multiply(work[0], work[0], out=norm)
+        for row in work[1:]:
+            np.multiply(row, row, out=square)
+            np.add(norm, square, out=norm)
+        np.sqrt(norm, out=norm)
+        norm[norm == 0] = 1.0
+        np.divide(work, norm, out=work)
+        np.multiply(work, 0.5, out=work)
+        np.add(work, 0.5, out=work)
+        self._store_codes(work, codes[:, 4:8])
+
+    @staticmethod
+    def _store_codes(work, codes):
+        """Maps [0, 1] rows to clamped bytes 0-255 and stores them as record columns."""
+        np.multiply(work, 255.0, out=work)
+        np.clip(work, 0, 255, out=work)
+        for i, row in enumerate(work):
+            codes[:, i] = row
+
+
+def _extract_splat_bin_data(buffers, apply_transforms: bool, writer, chunk_size: int = 0):
+    """
+    Extract a single object and yield it packed into structured records
+    matching _SPLAT_BIN_DTYPE (32 bytes per splat), one chunk at a time.
+
+    Records are packed by a _SplatBinEncoder straight into the RecordWriter's
+    reusable scratch buffer (or the mapped file); the encoder's temporaries
+    are sized to its block, not to the chunk or the object.
+    """
+    encoder = _SplatBinEncoder(buffers, apply_transforms)
+    profile, label = buffers.profile, buffers.label
+
+    for start, stop in iter_chunks(buffers.count, chunk_size):
+        with profile.stage('pack', label):
+            structured = writer.records(stop - start)
+            encoder.encode(structured, start)
+
+        yield structured
+
+
+def _write_splat_bin_object(writer, buffers, apply_transforms, chunk_size):
+    """Packs a single object into .splat records and writes them."""
+    for structured in _extract_splat_bin_data(buffers, apply_transforms, writer, chunk_size):
+        with buffers.profile.stage('write', buffers.label, structured.nbytes):
+            writer.write(structured)
 
 
 @analytics.track_event(
     "export_splat_bin",
-    lambda objects, filepath, apply_transforms=False: {
+    lambda objects, filepath, *_, **__: {
         "object_count": len(objects),
     }
 )
-def export_splat_bin(objects, filepath, apply_transforms=False):
+def export_splat_bin(objects, filepath, apply_transforms=False, chunk_size=0, threads=1,
+                     use_mmap=False, reorder='NONE', voxel_size=0.0, voxel_mode='FIRST',
+                     cache=None, profile=None):
     """
-    Export Gaussian Splat objects to the compact .splat binary format.
+    Export Gaussian Splat objects (Blender objects or NumPy point sources,
+    see sources.point_source) to the compact .splat binary format.
 
     The file has no header: it is a flat sequence of 32-byte records,
     one per splat. The number of splats is implicitly file_size / 32.
     Higher-order SH coefficients (f_rest) are discarded; color is baked
     from the 0th-order DC component only (no view-dependent effects).
+
+    chunk_size > 0 streams each object in ranges of that many splats; the output
+    is identical to the non-streamed export.
+
+    threads > 1 packs and writes objects concurrently; the output is identical
+    to the serial export.
+
+    use_mmap sizes the file to total_splats * 32 bytes up front and packs the
+    records directly into a memory-mapped view of it.
+
+    reorder ('NONE', 'MORTON' or 'HILBERT') sorts each object's splats along a
+    space-filling curve before writing.
+
+    voxel_size > 0 keeps one splat per occupied voxel ('FIRST' or 'RANDOM'
+    representative), or averages every stored property per voxel ('MEAN',
+    with rotations sign-aligned and renormalized).
+
+    cache (an ExportCache) reuses the packed records of unchanged objects,
+    and profile (an ExportProfile) times every export stage; see export_ply.
     """
     if not objects:
         return False, "No objects to export"
 
-    total_vertices = sum(len(obj.data.attributes['position'].data) for obj in objects)
+    profile = profile or NULL_PROFILE
+    objects = [point_source(obj) for obj in objects]
+    session = CacheSession(cache, ('splat', apply_transforms, reorder, voxel_size, voxel_mode))
 
     try:
-        with open(filepath, 'wb') as f:
-            for obj in objects:
-                count, structured = _extract_splat_bin_data(obj, apply_transforms)
-                if count == 0:
+        all_buffers, total_vertices = prepare_buffers(objects, voxel_size, voxel_mode, apply_transforms, profile)
+        with open(filepath, 'w+b' if use_mmap else 'wb') as f, \
+                record_writer(f, _SPLAT_BIN_DTYPE, threads, use_mmap, total_vertices) as writer:
+            for buffers in release_each(all_buffers):
+                key, block = session.lookup(buffers, _SPLAT_BIN_ATTRS, apply_transforms=apply_transforms)
+                if block is not None:
+                    session.write_block(writer, block, profile, buffers.label)
+                    continue
+                buffers.reorder(reorder)
+                if buffers.count == 0:
                     continue
-                f.write(structured.tobytes())
+                buffers.prefetch(_SPLAT_BIN_ATTRS)
+                session.submit(writer, key, buffers.count, _write_splat_bin_object,
+                               buffers, apply_transforms, chunk_size)
 
-        return True, f"Exported {total_vertices} splats."
+        return True, f"Exported {total_vertices} splats." + session.report() + profile.report()
 
     except Exception as e:
         return False, str(e)
-
-
-SplatBinFileHandler = None
-
-if hasattr(bpy.types, "FileHandler"):
-    class SplatBinFileHandler(bpy.types.FileHandler):
-        bl_idname = "splat_bin_handler"
-        bl_label = "Gaussian Splat (.splat)"
-        bl_export_operator = "export_mesh.splat_panel"
-        bl_file_extensions = ".splat"
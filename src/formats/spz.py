@@ -0,0 +1,211 @@
+import gzip
+import struct
+
+import numpy as np
+from .. import analytics
+from .attributes import prepare_buffers, release_each
+from .profile import NULL_PROFILE
+from .records import iter_chunks
+from .sources import point_source
+from .splat import (
+    _SH_DIMS, _count_f_rest, _f_rest_names, _sh_degree, _splat_sources, _transformed_positions,
+    _transformed_sh, _transformed_splats,
+)
+
+# ---------------------------------------------------------------------------
+# SPZ (Niantic, version 3): gzip-compressed, quantized Gaussian splats
+#
+# A 16-byte header followed by one plane per attribute, each covering all
+# splats in order: positions, alphas, colors, scales, rotations, SH.
+# ---------------------------------------------------------------------------
+
+_SPZ_MAGIC = 0x5053474e  # 'NGSP'
+_SPZ_VERSION = 3
+_SPZ_HEADER = struct.Struct('<IIIBBBB')
+
+# Positions are 24-bit signed fixed point with this many fractional bits
+_FRACTIONAL_BITS = 12
+
+_COLOR_SCALE = 0.15
+
+# Degree-1 SH values (3 coefficients x RGB) keep 5 bits, higher degrees 4 bits
+_SH1_VALUES = 9
+_SH1_BUCKET = 1 << (8 - 5)
+_SH_REST_BUCKET = 1 << (8 - 4)
+
+# Bytes per splat for each plane (SH excluded)
+_PLANE_WIDTHS = {'positions': 9, 'alphas': 1, 'colors': 3, 'scales': 3, 'rotations': 4}
+
+_SQRT1_2 = np.float32(np.sqrt(0.5))
+
+
+def _round_half_away(values):
+    """Rounds half away from zero (C's round/lround), unlike np.rint."""
+    return np.trunc(values + np.copysign(np.float32(0.5), values))
+
+
+def _to_uint8(values):
+    return np.clip(_round_half_away(values), 0, 255).astype(np.uint8)
+
+
+def _encode_positions(pos):
+    """(N, 3) float32 → (N, 9) bytes: little-endian 24-bit fixed point per component."""
+    fixed = _round_half_away(pos * np.float32(1 << _FRACTIONAL_BITS)).astype(np.int64)
+    return fixed.astype('<i4').view(np.uint8).reshape(-1, 3, 4)[:, :, :3].reshape(-1, 9)
+
+
+def _encode_rotations(rot):
+    """
+    (N, 4) quaternions in (x, y, z, w) order → (N, 4) bytes, smallest-three:
+    a 2-bit index of the largest component, then the other three as a sign
+    bit (relative to the largest) and a 9-bit magnitude scaled from
+    [0, 1/sqrt(2)], packed into a little-endian 32-bit word.
+    """
+    length = np.linalg.norm(rot, axis=1, keepdims=True)
+    degenerate = length[:, 0] == 0
+    q = rot / np.where(length == 0, np.float32(1.0), length)
+    q[degenerate] = (0.0, 0.0, 0.0, 1.0)
+
+    largest = np.argmax(np.abs(q), axis=1)
+    rows = np.arange(len(q))
+    negate = q[rows, largest] < 0
+
+    keep = np.ones(q.shape, dtype=bool)
+    keep[rows, largest] = False
+    others = q[keep].reshape(-1, 3)
+
+    magnitude = np.floor(np.float32(511) * (np.abs(others) / _SQRT1_2) + np.float32(0.5))
+    sign = (others < 0) ^ negate[:, None]
+    fields = (sign.astype(np.uint32) << 9) | magnitude.astype(np.uint32)
+
+    packed = largest.astype(np.uint32) << 30
+    for i in range(3):
+        packed |= fields[:, i] << (20 - 10 * i)
+    return packed.astype('<u4').view(np.uint8).reshape(-1, 4)
+
+
+def _quantize_sh(values, bucket):
+    """Quantizes SH values to bytes: round(x * 128) + 128, snapped to the bucket size."""
+    q = _round_half_away(values * np.float32(128.0)) + 128
+    q = np.trunc((q + bucket // 2) / bucket) * bucket
+    return np.clip(q, 0, 255).astype(np.uint8)
+
+
+class _SpzPlanes:
+    """
+    Preallocated SPZ attribute planes for all splats of an export.
+
+    Every plane spans all splats, so each object is encoded straight into its
+    slice of every plane; only the quantized bytes are kept, not the floats.
+    """
+
+    def __init__(self, count, sh_degree):
+        self.count = count
+        self.sh_dim = _SH_DIMS[sh_degree]
+        self.planes = {
+            name: np.empty((count, width), dtype=np.uint8)
+            for name, width in _PLANE_WIDTHS.items()
+        }
+        self.planes['sh'] = np.empty((count, self.sh_dim * 3), dtype=np.uint8)
+
+    def add(self, buffers, offset, f_rest_count, apply_transforms, chunk_size=0):
+        """Encodes one object into [offset, offset + buffers.count) of every plane."""
+        dc, sh, tail = _splat_sources(buffers, _f_rest_names(f_rest_count))
+        opacity, scales, rots = tail[0], tail[1:4], tail[4:8]
+        # f_rest is channel-major (all R coefficients, then G, then B)
+        channel_stride = f_rest_count // 3
+        sh_rows = [c * channel_stride + j for j in range(self.sh_dim) for c in range(3)]
+
+        for start, stop in iter_chunks(buffers.count, chunk_size):
+            out = slice(offset + start, offset + stop)
+            pos = _transformed_positions(buffers, apply_transforms, start, stop)
+            self.planes['positions'][out] = _encode_positions(pos)
+            log_scales, rot = _transformed_splats(buffers, apply_transforms, scales, rots, start, stop)
+
+            a = opacity[start:stop]
+            self.planes['alphas'][out, 0] = _to_uint8(
+                np.float32(1.0) / (np.float32(1.0) + np.exp(-a)) * np.float32(255.0))
+
+            for i in range(3):
+                self.planes['colors'][out, i] = _to_uint8(
+                    dc[i][start:stop] * np.float32(_COLOR_SCALE * 255.0) + np.float32(0.5 * 255.0))
+                self.planes['scales'][out, i] = _to_uint8(
+                    (log_scales[:, i] + np.float32(10.0)) * np.float32(16.0))
+
+            # Quaternion stored as (w, x, y, z) in rot_0..rot_3, encoded as (x, y, z, w)
+            self.planes['rotations'][out] = _encode_rotations(rot[:, [1, 2, 3, 0]])
+
+            if self.sh_dim:
+                # Coefficient-major, color-minor: spz[j * 3 + c] = f_rest[c * dim + j]
+                values = _transformed_sh(buffers, apply_transforms, sh, start, stop)[sh_rows].T
+                plane = self.planes['sh'][out]
+                plane[:, :_SH1_VALUES] = _quantize_sh(values[:, :_SH1_VALUES], _SH1_BUCKET)
+                plane[:, _SH1_VALUES:] = _quantize_sh(values[:, _SH1_VALUES:], _SH_REST_BUCKET)
+
+    def write(self, f):
+        for name in ('positions', 'alphas', 'colors', 'scales', 'rotations', 'sh'):
+            f.write(self.planes[name].reshape(-1))
+
+
+@analytics.track_event(
+    "export_splat_spz",
+    lambda objects, filepath, *_, **__: {
+        "object_count": len(objects),
+    }
+)
+def export_splat_spz(objects, filepath, apply_transforms=False, chunk_size=0, voxel_size=0.0,
+                     voxel_mode='FIRST', profile=None):
+    """
+    Export Gaussian Splat objects to the SPZ format (version 3).
+
+    Attributes are quantized into per-attribute planes and gzip-compressed:
+      position : 24-bit signed fixed point, 12 fractional bits
+      alpha    : sigmoid(opacity) * 255
+      color    : f_dc * (0.15 * 255) + 127.5
+      scale    : (log_scale + 10) * 16
+      rotation : smallest-three, 2-bit index + 3 x (sign + 9-bit magnitude)
+      SH       : round(x * 128) + 128, 5 bits for degree 1, 4 bits above
+    The SH degree is the highest one fully covered by the f_rest coefficients.
+    Coordinates are written as-is; apply_transforms bakes the object's
+    transform into positions, rotations, scales and SH coefficients.
+
+    chunk_size > 0 encodes each object in ranges of that many splats, bounding
+    the encoder's temporaries; the output is identical either way.
+
+    voxel_size > 0 keeps one splat per occupied voxel ('FIRST' or 'RANDOM'
+    representative), or averages every stored property per voxel ('MEAN',
+    with rotations sign-aligned and renormalized).
+
+    profile (an ExportProfile) times every export stage; see export_ply.
+    """
+    if not objects:
+        return False, "No objects to export"
+
+    profile = profile or NULL_PROFILE
+    objects = [point_source(obj) for obj in objects]
+    f_rest_count = _count_f_rest(objects[0].schema)
+    sh_degree = _sh_degree(f_rest_count)
+
+    try:
+        all_buffers, total_vertices = prepare_buffers(objects, voxel_size, voxel_mode, apply_transforms, profile)
+        planes = _SpzPlanes(total_vertices, sh_degree)
+        offset = 0
+        for buffers in release_each(all_buffers):
+            if buffers.count == 0:
+                continue
+            with profile.stage('pack', buffers.label):
+                planes.add(buffers, offset, f_rest_count, apply_transforms, chunk_size)
+            offset += buffers.count
+
+        # gzip compression runs inside the write stage
+        with open(filepath, 'wb') as raw, profile.stage('write') as stage:
+            with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6, mtime=0) as f:
+                f.write(_SPZ_HEADER.pack(
+                    _SPZ_MAGIC, _SPZ_VERSION, total_vertices, sh_degree, _FRACTIONAL_BITS, 0, 0))
+                planes.write(f)
+            stage.nbytes = raw.tell()
+
+        return True, f"Exported {total_vertices} splats." + profile.report()
+
+    except Exception as e:
+        return False, str(e)
@@ -0,0 +1,228 @@
+import numpy as np
+
+# Splats per block of the covariance path, bounding its (n, 3, 3) float64 temporaries
+_BLOCK = 1 << 16
+
+# Relative spread of singular values under which an object scale counts as uniform
+_UNIFORM_TOLERANCE = 1e-6
+
+# Real SH constants of degrees 1-3, as evaluated by 3DGS renderers
+_SH_C1 = 0.4886025119029199
+_SH_C2 = (1.0925484305920792, -1.0925484305920792, 0.31539156525252005, -1.0925484305920792,
+          0.5462742152960396)
+_SH_C3 = (-0.5900435899266435, 2.890611442640554, -0.4570457994644658, 0.3731763325901154,
+          -0.4570457994644658, 1.445305721320277, -0.5900435899266435)
+
+# Coefficient ranges of SH bands 1-3 within the 15 higher-order coefficients of a channel
+_SH_BANDS = ((0, 3), (3, 8), (8, 15))
+
+
+def _sh_basis(d):
+    """(k, 3) unit directions → (k, 15) real SH basis of degrees 1-3 (3DGS order and signs)."""
+    x, y, z = d[:, 0], d[:, 1], d[:, 2]
+    xx, yy, zz = x * x, y * y, z * z
+    return np.stack([
+        -_SH_C1 * y, _SH_C1 * z, -_SH_C1 * x,
+        _SH_C2[0] * x * y,
+        _SH_C2[1] * y * z,
+        _SH_C2[2] * (2 * zz - xx - yy),
+        _SH_C2[3] * x * z,
+        _SH_C2[4] * (xx - yy),
+        _SH_C3[0] * y * (3 * xx - yy),
+        _SH_C3[1] * x * y * z,
+        _SH_C3[2] * y * (4 * zz - xx - yy),
+        _SH_C3[3] * z * (2 * zz - 3 * xx - 3 * yy),
+        _SH_C3[4] * x * (4 * zz - xx - yy),
+        _SH_C3[5] * z * (xx - yy),
+        _SH_C3[6] * x * (xx - 3 * yy),
+    ], axis=1)
+
+
+def _sphere_directions(count=64):
+    """Evenly spread unit directions (Fibonacci sphere)."""
+    i = np.arange(count) + 0.5
+    z = 1 - 2 * i / count
+    r = np.sqrt(1 - z * z)
+    phi = np.pi * (1 + 5 ** 0.5) * i
+    return np.stack([r * np.cos(phi), r * np.sin(phi), z], axis=1)
+
+
+def sh_rotation_matrix(orthogonal, dim):
+    """
+    Returns the (dim, dim) matrix D rotating one color channel's first dim
+    higher-order SH coefficients by a 3x3 orthogonal matrix O, so that the
+    rotated function at direction d equals the original at O.T @ d.
+
+    Each band's block (its Wigner D-matrix in the 3DGS real basis) is fitted
+    on sample directions: Y(O.T @ d) = Y(d) @ D, exact since every band is
+    closed under rotation. Coefficients of bands not fully covered by dim
+    are left unchanged.
+    """
+    dirs = _sphere_directions()
+    basis = _sh_basis(dirs)
+    rotated = _sh_basis(dirs @ orthogonal)
+    d = np.eye(dim)
+    for lo, hi in _SH_BANDS:
+        if hi > dim:
+            break
+        solution, *_ = np.linalg.lstsq(basis[:, lo:hi], rotated[:, lo:hi], rcond=None)
+        d[lo:hi, lo:hi] = solution
+    return d
+
+
+def _normal_matrix(matrix_world):
+    """Inverse transpose of the 3x3 part of a world matrix (pseudo-inverse if it is singular)."""
+    m = np.asarray(matrix_world, dtype=np.float64)[:3, :3]
+    try:
+        inverse = np.linalg.inv(m)
+    except np.linalg.LinAlgError:
+        inverse = np.linalg.pinv(m)
+    return inverse.T
+
+
+def quaternion_to_matrix(q):
+    """(n, 4) unit quaternions (w, x, y, z) → (n, 3, 3) rotation matrices."""
+    w, x, y, z = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+    r = np.empty((len(q), 3, 3), dtype=q.dtype)
+    r[:, 0, 0] = 1 - 2 * (y * y + z * z)
+    r[:, 0, 1] = 2 * (x * y - w * z)
+    r[:, 0, 2] = 2 * (x * z + w * y)
+    r[:, 1, 0] = 2 * (x * y + w * z)
+    r[:, 1, 1] = 1 - 2 * (x * x + z * z)
+    r[:, 1, 2] = 2 * (y * z - w * x)
+    r[:, 2, 0] = 2 * (x * z - w * y)
+    r[:, 2, 1] = 2 * (y * z + w * x)
+    r[:, 2, 2] = 1 - 2 * (x * x + y * y)
+    return r
+
+
+def matrix_to_quaternion(r):
+    """
+    (n, 3, 3) rotation matrices → (n, 4) unit quaternions (w, x, y, z).
+
+    Row k of the symmetric matrix below is 4 * q_k * q; the row with the
+    largest diagonal entry is normalized, which is stable for every rotation.
+    """
+    r00, r01, r02 = r[:, 0, 0], r[:, 0, 1], r[:, 0, 2]
+    r10, r11, r12 = r[:, 1, 0], r[:, 1, 1], r[:, 1, 2]
+    r20, r21, r22 = r[:, 2, 0], r[:, 2, 1], r[:, 2, 2]
+    k = np.empty((len(r), 4, 4), dtype=r.dtype)
+    k[:, 0, 0] = 1 + r00 + r11 + r22
+    k[:, 1, 1] = 1 + r00 - r11 - r22
+    k[:, 2, 2] = 1 - r00 + r11 - r22
+    k[:, 3, 3] = 1 - r00 - r11 + r22
+    k[:, 0, 1] = k[:, 1, 0] = r21 - r12
+    k[:, 0, 2] = k[:, 2, 0] = r02 - r20
+    k[:, 0, 3] = k[:, 3, 0] = r10 - r01
+    k[:, 1, 2] = k[:, 2, 1] = r01 + r10
+    k[:, 1, 3] = k[:, 3, 1] = r02 + r20
+    k[:, 2, 3] = k[:, 3, 2] = r12 + r21
+    rows = np.arange(len(r))
+    q = k[rows, np.argmax(np.diagonal(k, axis1=1, axis2=2), axis=1)]
+    q /= np.linalg.norm(q, axis=1, keepdims=True)
+    return q
+
+
+def _left_product_matrix(q):
+    """4x4 matrix L with L @ p == q * p (Hamilton product, (w, x, y, z) order)."""
+    w, x, y, z = q
+    return np.array([
+        [w, -x, -y, -z],
+        [x, w, -z, y],
+        [y, z, w, -x],
+        [z, -y, x, w],
+    ])
+
+
+class Transform:
+    """
+    An object's world matrix, prepared for baking into exported attributes.
+
+    Every kernel works on float32 chunks and writes into the caller's arrays
+    (or `out`), so applying transforms never promotes a buffer to float64.
+
+    Splats are baked as covariances: the world covariance of a splat is
+    M @ R @ S @ S @ R.T @ M.T for the 3x3 part M of the world matrix. The
+    rotation factor of M (its polar decomposition, negated for mirrors since
+    ellipsoids are symmetric) is composed into the splat quaternions. When M
+    scales uniformly, its scale is added to the log-scales; otherwise each
+    splat's covariance is diagonalised again. Higher-order SH coefficients
+    are rotated by the orthogonal factor of M, mirrors included.
+    """
+
+    def __init__(self, matrix_world):
+        m = np.asarray(matrix_world, dtype=np.float64).reshape(4, 4)
+        self.matrix = m[:3, :3]
+        self._linear_t = np.ascontiguousarray(self.matrix.T, dtype=np.float32)
+        self._normal_t = np.ascontiguousarray(_normal_matrix(m).T, dtype=np.float32)
+        self.translation = m[:3, 3].astype(np.float32)
+
+        u, s, vt = np.linalg.svd(self.matrix)
+        rotation = self.orthogonal = u @ vt
+        if np.linalg.det(rotation) < 0:
+            rotation = -rotation
+        # Object rotation (polar factor of M, a proper rotation)
+        self.rotation = rotation
+        self.quaternion = matrix_to_quaternion(rotation[None])[0]
+        self._quaternion_t = np.ascontiguousarray(_left_product_matrix(self.quaternion).T, dtype=np.float32)
+        uniform = s.max() - s.min() <= _UNIFORM_TOLERANCE * s.max()
+        self.log_scale = np.float32(np.log(max(s.mean(), np.finfo(np.float32).tiny))) if uniform else None
+        self._sh_matrices = {}
+
+    def points(self, p, out=None):
+        """Returns the (n, 3) points p in world space (written into out if given)."""
+        out = np.matmul(p, self._linear_t, out=out)
+        out += self.translation
+        return out
+
+    def normals(self, n, out=None):
+        """Returns the (n, 3) normals n in world space, renormalized (zero normals stay zero)."""
+        out = np.matmul(n, self._normal_t, out=out)
+        norms = np.sqrt(np.einsum('ij,ij->i', out, out))
+        norms[norms == 0] = 1.0
+        out /= norms[:, None]
+        return out
+
+    def splats(self, log_scales, rotations):
+        """
+        Bakes the transform into (n, 3) float32 log-scales and (n, 4) float32
+        rotations (w, x, y, z), in place.
+        """
+        if self.log_scale is not None:
+            rotations[...] = rotations @ self._quaternion_t
+            log_scales += self.log_scale
+            return
+        for start in range(0, len(log_scales), _BLOCK):
+            block = slice(start, start + _BLOCK)
+            self._bake_covariances(log_scales[block], rotations[block])
+
+    def sh(self, coefficients):
+        """
+        Returns a (3 * dim, n) block of higher-order SH coefficients (channel-
+        major: all R coefficients, then G, then B) rotated into world space,
+        as float32. The rotation matrix is computed once per block height; a
+        block that does not split into three channels is returned unchanged.
+        """
+        dim = len(coefficients) // 3
+        if dim == 0 or len(coefficients) != 3 * dim:
+            return coefficients
+        matrix = self._sh_matrices.get(dim)
+        if matrix is None:
+            matrix = self._sh_matrices[dim] = sh_rotation_matrix(self.orthogonal, dim).astype(np.float32)
+        rotated = np.matmul(matrix, coefficients.reshape(3, dim, -1))
+        return rotated.reshape(3 * dim, -1)
+
+    def _bake_covariances(self, log_scales, rotations):
+        # float64: covariance eigenvalues span the square of the scale range
+        q = rotations.astype(np.float64)
+        norms = np.linalg.norm(q, axis=1, keepdims=True)
+        q[norms[:, 0] == 0] = (1.0, 0.0, 0.0, 0.0)
+        norms[norms == 0] = 1.0
+        q /= norms
+        a = self.matrix @ quaternion_to_matrix(q)
+        a *= np.exp(log_scales.astype(np.float64))[:, None, :]
+        variances, axes = np.linalg.eigh(a @ a.transpose(0, 2, 1))
+        # eigh may return a reflection: flip one axis to get a proper rotation
+        axes[np.linalg.det(axes) < 0, :, 0] *= -1.0
+        log_scales[...] = 0.5 * np.log(np.maximum(variances, np.finfo(np.float64).tiny))
+        rotations[...] = matrix_to_quaternion(axes)
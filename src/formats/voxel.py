@@ -0,0 +1,123 @@
+import numpy as np
+
+VOXEL_MODES = ('FIRST', 'MEAN', 'RANDOM')
+
+# Fixed seed: RANDOM picks the same representatives on every export
+_VOXEL_SEED = 0
+
+
+def voxel_keys(positions, voxel_size):
+    """
+    Returns one int64 key per point identifying its voxel in a grid of
+    voxel_size cells. Integer cell coordinates are offset to start at zero
+    and combined into a single key, so grouping is a plain 1-D sort.
+    """
+    too_small = ValueError(f"Voxel size {voxel_size} is too small for the extent of the point cloud")
+    with np.errstate(over='ignore', invalid='ignore'):
+        cells = np.floor(np.asarray(positions, dtype=np.float64) / voxel_size)
+        cells -= cells.min(axis=0)
+    extent = cells.max(axis=0)
+    if not np.isfinite(extent).all() or np.prod(extent + 1) >= 2.0 ** 62:
+        raise too_small
+    dims = extent.astype(np.int64) + 1
+    if int(dims[0]) * int(dims[1]) * int(dims[2]) >= 2 ** 63:
+        raise too_small
+    cells = cells.astype(np.int64)
+    return (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+
+
+def _unit(vectors):
+    """Scales the rows of a 2-D float array to unit length in place (zero rows stay zero)."""
+    norms = np.sqrt(np.einsum('ij,ij->i', vectors, vectors))
+    norms[norms == 0] = 1.0
+    vectors /= norms[:, None]
+    return vectors
+
+
+class VoxelGroups:
+    """
+    Points grouped by voxel.
+
+    Voxels are listed in order of their first point, so downsampling keeps
+    the original point order. reduce() maps any per-point buffer to one value
+    per voxel: the representative point for FIRST and RANDOM, the average for
+    MEAN (float buffers only; other types take the first point).
+
+    MEAN averages directions as directions: 'normal' buffers are renormalized,
+    and quaternions (q and -q being the same rotation) are sign-aligned to
+    the first rotation of their voxel before averaging, then normalized.
+    A rotation stored as four separate component buffers is aligned once
+    with align_rotations(), after which each component reduces as 'rotation'.
+    """
+
+    def __init__(self, positions, voxel_size, mode):
+        if mode not in VOXEL_MODES:
+            raise ValueError(f"Unknown voxel mode: {mode}")
+        self.mode = mode
+        keys = voxel_keys(positions, voxel_size)
+        self.sort = np.argsort(keys, kind='stable')
+        sorted_keys = keys[self.sort]
+        self.starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        self.counts = np.diff(np.r_[self.starts, len(keys)])
+
+        # Voxel order by first point; the stable sort puts it at each run's start
+        first = self.sort[self.starts]
+        self.voxel_order = np.argsort(first, kind='stable')
+
+        if mode == 'RANDOM':
+            rng = np.random.default_rng(_VOXEL_SEED)
+            picks = self.starts + (rng.random(len(self.starts)) * self.counts).astype(np.int64)
+            self.representative = self.sort[picks][self.voxel_order]
+        else:
+            self.representative = first[self.voxel_order]
+
+        self._rotation_signs = None
+        self._rotation_norms = None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _quaternion_signs(self, grouped):
+        """(n, 4) quaternions in sort order → ±1 per point aligning it with its voxel's first one."""
+        first = np.repeat(grouped[self.starts], self.counts, axis=0)
+        return np.where(np.einsum('ij,ij->i', grouped, first) < 0, -1.0, 1.0)
+
+    def align_rotations(self, quaternions):
+        """
+        Prepares MEAN reduction of the components of (n, 4) per-point
+        quaternions that are stored as separate buffers (kind 'rotation').
+        """
+        if self.mode != 'MEAN':
+            return
+        grouped = np.take(quaternions, self.sort, axis=0).astype(np.float64)
+        self._rotation_signs = self._quaternion_signs(grouped)
+        grouped *= self._rotation_signs[:, None]
+        sums = np.add.reduceat(grouped, self.starts, axis=0)
+        norms = np.sqrt(np.einsum('ij,ij->i', sums, sums))
+        norms[norms == 0] = 1.0
+        self._rotation_norms = norms
+
+    def reduce(self, buf, axis=0, kind=None):
+        """
+        Reduces a per-point buffer along `axis` to one entry per voxel. kind
+        is None for plain values, 'normal' for (n, 3) directions, 'quaternion'
+        for (n, 4) rotations, or 'rotation' for one component of the
+        quaternions passed to align_rotations().
+        """
+        if self.mode != 'MEAN' or buf.dtype.kind != 'f':
+            return np.take(buf, self.representative, axis=axis)
+        grouped = np.take(buf, self.sort, axis=axis).astype(np.float64)
+        shape = [1] * buf.ndim
+        shape[axis] = -1
+        if kind == 'quaternion':
+            grouped *= self._quaternion_signs(grouped)[:, None]
+        elif kind == 'rotation' and self._rotation_signs is not None:
+            grouped *= self._rotation_signs.reshape(shape)
+        sums = np.add.reduceat(grouped, self.starts, axis=axis)
+        if kind in ('normal', 'quaternion'):
+            means = _unit(sums)
+        elif kind == 'rotation' and self._rotation_norms is not None:
+            means = sums / self._rotation_norms.reshape(shape)
+        else:
+            means = sums / self.counts.reshape(shape)
+        return np.take(means, self.voxel_order, axis=axis).astype(buf.dtype)
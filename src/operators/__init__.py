@@ -2,10 +2,18 @@ from .export import (
     ExportPLYMenu, ExportPLYPanel,
     ExportSplatMenu, ExportSplatPanel,
     ExportSplatBinMenu, ExportSplatBinPanel,
+    ExportSplatCompressedMenu, ExportSplatCompressedPanel,
+    ExportSplatSpzMenu, ExportSplatSpzPanel,
+    ExportPLYOctreeMenu, ExportPLYOctreePanel,
 )
+from . import handlers
 
 classes = [
     ExportPLYMenu, ExportPLYPanel,
     ExportSplatMenu, ExportSplatPanel,
     ExportSplatBinMenu, ExportSplatBinPanel,
+    ExportSplatCompressedMenu, ExportSplatCompressedPanel,
+    ExportSplatSpzMenu, ExportSplatSpzPanel,
+    ExportPLYOctreeMenu, ExportPLYOctreePanel,
+    *handlers.classes,
 ]
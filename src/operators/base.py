@@ -1,5 +1,9 @@
-from bpy.props import BoolProperty
+import os
+
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty
 from .. import utils
+from ..formats import ExportProfile, export_cache, profile_filepath
+from ..formats.profile import NULL_PROFILE
 
 
 class ExportPLYBase:
@@ -23,18 +27,113 @@ class ExportPLYBase:
         default=True,
     )
 
+    use_streaming: BoolProperty(
+        name="Stream in Chunks",
+        description="Process each object in fixed-size point ranges so that memory use "
+                    "depends on the chunk size instead of the point count",
+        default=False,
+    )
+
+    chunk_size: IntProperty(
+        name="Chunk Size",
+        description="Number of points processed per chunk when streaming",
+        default=1_000_000,
+        min=1024,
+    )
+
+    threads: IntProperty(
+        name="Threads",
+        description="Number of worker threads that pack and write objects in parallel "
+                    "(binary output only). 1 exports objects one at a time",
+        default=1,
+        min=1,
+        max=64,
+    )
+
+    use_mmap: BoolProperty(
+        name="Memory-Mapped Output",
+        description="Size the output file up front and pack records directly into a "
+                    "memory-mapped view of it (binary output only)",
+        default=False,
+    )
+
+    reorder: EnumProperty(
+        name="Point Order",
+        description="Sort each object's points along a space-filling curve before writing. "
+                    "Improves compression and streaming locality in viewers",
+        items=[
+            ('NONE', "Original", "Keep Blender's point order"),
+            ('MORTON', "Morton", "Z-order curve (fastest to compute)"),
+            ('HILBERT', "Hilbert", "Hilbert curve (best locality)"),
+        ],
+        default='NONE',
+    )
+
+    voxel_size: FloatProperty(
+        name="Voxel Size",
+        description="Downsample to one point per voxel of this size (0 exports every point). "
+                    "Measured in world space when transformations are applied",
+        default=0.0,
+        min=0.0,
+        subtype='DISTANCE',
+    )
+
+    voxel_mode: EnumProperty(
+        name="Voxel Reduction",
+        description="How the points of each voxel are reduced to one",
+        items=[
+            ('FIRST', "First", "Keep the first point of each voxel"),
+            ('MEAN', "Mean", "Average the float attributes of each voxel's points "
+                                 "(normals and rotations stay unit length)"),
+            ('RANDOM', "Random", "Keep a random point of each voxel"),
+        ],
+        default='FIRST',
+    )
+
+    quantize: EnumProperty(
+        name="Quantization",
+        description="Write lossy property types to reduce file size. Positions and ushort "
+                    "fields store their scale and offset in header comments",
+        items=[
+            ('NONE', "None", "Keep 32-bit float properties (lossless)"),
+            ('HALF', "Half Float", "Positions as ushort, normals as char, colors as uchar "
+                                   "and other float fields as 16-bit half floats"),
+            ('USHORT', "Scaled Integers", "Positions and other float fields as ushort, "
+                                          "normals as char and colors as uchar"),
+        ],
+        default='NONE',
+    )
+
+    use_frame_range: BoolProperty(
+        name="Frame Range",
+        description="Export every frame of the scene's frame range to a numbered file "
+                    "sequence ('#' in the file name marks the frame number). Threads, "
+                    "memory-mapped output and the export cache do not apply to sequences",
+        default=False,
+    )
+
     @staticmethod
     def get_non_pointcloud_names(objects):
         return utils.get_non_pointcloud_names(objects)
 
-    def get_objects(self, context, objects, apply_modifiers):
-        depsgraph = context.evaluated_depsgraph_get() if apply_modifiers else None
+    def get_chunk_size(self):
+        return self.chunk_size if self.use_streaming else 0
+
+    @staticmethod
+    def get_frames(scene):
+        return range(scene.frame_start, scene.frame_end + 1, scene.frame_step)
+
+    def get_objects(self, context, objects, apply_modifiers, profile=None):
+        profile = profile or NULL_PROFILE
+        with profile.stage('evaluate'):
+            depsgraph = context.evaluated_depsgraph_get() if apply_modifiers else None
 
         objects_to_export = []
         for obj in objects:
             final_obj = obj
             if apply_modifiers:
-                final_obj = obj.evaluated_get(depsgraph)
+                with profile.stage('evaluate', obj.name):
+                    final_obj = obj.evaluated_get(depsgraph)
 
             if final_obj.type == 'POINTCLOUD':
                 objects_to_export.append(final_obj)
@@ -42,6 +141,64 @@ class ExportPLYBase:
         return objects_to_export
 
 
+class ExportCacheBase:
+    """Shared properties for exporters that reuse unchanged objects across re-exports."""
+
+    use_cache: BoolProperty(
+        name="Reuse Unchanged Objects",
+        description="Keep each object's encoded data between exports and only re-encode "
+                    "objects whose attributes, transform or export settings changed "
+                    "(binary output only)",
+        default=True,
+    )
+
+    cache_size: IntProperty(
+        name="Cache Size (MB)",
+        description="Memory kept for encoded objects; the least recently exported "
+                    "objects are dropped first",
+        default=1024,
+        min=16,
+    )
+
+    def get_cache(self):
+        if not self.use_cache:
+            return None
+        export_cache.resize(self.cache_size * 1024 * 1024)
+        return export_cache
+
+
+class ExportProfileBase:
+    """Shared properties for exporters that can time their stages."""
+
+    use_profile: BoolProperty(
+        name="Profile Export",
+        description="Time each export stage (evaluation, attribute fetch, transforms, packing, "
+                    "writing) and add the totals to the report",
+        default=False,
+    )
+
+    write_profile: BoolProperty(
+        name="Save Profile",
+        description="Also save the per-stage timings of every object as JSON next to the "
+                    "output file (<file>.profile.json)",
+        default=False,
+    )
+
+    def get_profile(self):
+        return ExportProfile() if self.use_profile else None
+
+    def save_profile(self, profile):
+        """Writes the JSON profile if requested; returns the note appended to the report."""
+        if profile is None or not self.write_profile:
+            return ""
+        filepath = profile_filepath(self.filepath)
+        try:
+            profile.dump(filepath)
+        except OSError as e:
+            return f" Could not save profile: {e}"
+        return f" Profile saved to {os.path.basename(filepath)}."
+
+
 class ExportSplatBinBase:
     """Shared properties for .splat binary format exporters."""
 
@@ -53,23 +210,93 @@ class ExportSplatBinBase:
 
     apply_transforms: BoolProperty(
         name="Apply Transformations",
-        description="Apply object location/rotation/scale to splat positions. "
-                    "Splat-specific properties (scale, rotation) are written as-is.",
+        description="Apply object location/rotation/scale to splat positions, and bake the "
+                    "object rotation and scale into each splat's rotation and scale "
+                    "(.splat stores no higher-order SH)",
         default=True,
     )
 
+    use_streaming: BoolProperty(
+        name="Stream in Chunks",
+        description="Process each object in fixed-size point ranges so that memory use "
+                    "depends on the chunk size instead of the point count",
+        default=False,
+    )
+
+    chunk_size: IntProperty(
+        name="Chunk Size",
+        description="Number of points processed per chunk when streaming",
+        default=1_000_000,
+        min=1024,
+    )
+
+    threads: IntProperty(
+        name="Threads",
+        description="Number of worker threads that pack and write objects in parallel. "
+                    "1 exports objects one at a time",
+        default=1,
+        min=1,
+        max=64,
+    )
+
+    use_mmap: BoolProperty(
+        name="Memory-Mapped Output",
+        description="Size the output file up front and pack records directly into a "
+                    "memory-mapped view of it",
+        default=False,
+    )
+
+    reorder: EnumProperty(
+        name="Point Order",
+        description="Sort each object's points along a space-filling curve before writing. "
+                    "Improves compression and streaming locality in viewers",
+        items=[
+            ('NONE', "Original", "Keep Blender's point order"),
+            ('MORTON', "Morton", "Z-order curve (fastest to compute)"),
+            ('HILBERT', "Hilbert", "Hilbert curve (best locality)"),
+        ],
+        default='NONE',
+    )
+
+    voxel_size: FloatProperty(
+        name="Voxel Size",
+        description="Downsample to one point per voxel of this size (0 exports every point). "
+                    "Measured in world space when transformations are applied",
+        default=0.0,
+        min=0.0,
+        subtype='DISTANCE',
+    )
+
+    voxel_mode: EnumProperty(
+        name="Voxel Reduction",
+        description="How the points of each voxel are reduced to one",
+        items=[
+            ('FIRST', "First", "Keep the first point of each voxel"),
+            ('MEAN', "Mean", "Average the float attributes of each voxel's points "
+                                 "(normals and rotations stay unit length)"),
+            ('RANDOM', "Random", "Keep a random point of each voxel"),
+        ],
+        default='FIRST',
+    )
+
     @staticmethod
     def get_non_splat_names(objects):
         return utils.get_non_splat_names(objects)
 
-    def get_objects(self, context, objects, apply_modifiers):
-        depsgraph = context.evaluated_depsgraph_get() if apply_modifiers else None
+    def get_chunk_size(self):
+        return self.chunk_size if self.use_streaming else 0
+
+    def get_objects(self, context, objects, apply_modifiers, profile=None):
+        profile = profile or NULL_PROFILE
+        with profile.stage('evaluate'):
+            depsgraph = context.evaluated_depsgraph_get() if apply_modifiers else None
 
         objects_to_export = []
         for obj in objects:
             final_obj = obj
             if apply_modifiers:
-                final_obj = obj.evaluated_get(depsgraph)
+                with profile.stage('evaluate', obj.name):
+                    final_obj = obj.evaluated_get(depsgraph)
 
             if utils.is_gaussian_splat(final_obj):
                 objects_to_export.append(final_obj)
@@ -94,25 +321,293 @@ class ExportSplatBase:
 
     apply_transforms: BoolProperty(
         name="Apply Transformations",
-        description="Apply object location/rotation/scale to splat positions. "
-                    "Splat-specific properties (scale, rotation) are written as-is.",
+        description="Apply object location/rotation/scale to splat positions, and bake the "
+                    "object rotation and scale into each splat's rotation and scale and "
+                    "rotate its higher-order SH coefficients",
+        default=True,
+    )
+
+    use_streaming: BoolProperty(
+        name="Stream in Chunks",
+        description="Process each object in fixed-size point ranges so that memory use "
+                    "depends on the chunk size instead of the point count",
+        default=False,
+    )
+
+    chunk_size: IntProperty(
+        name="Chunk Size",
+        description="Number of points processed per chunk when streaming",
+        default=1_000_000,
+        min=1024,
+    )
+
+    threads: IntProperty(
+        name="Threads",
+        description="Number of worker threads that pack and write objects in parallel "
+                    "(binary output only). 1 exports objects one at a time",
+        default=1,
+        min=1,
+        max=64,
+    )
+
+    use_mmap: BoolProperty(
+        name="Memory-Mapped Output",
+        description="Size the output file up front and pack records directly into a "
+                    "memory-mapped view of it (binary output only)",
+        default=False,
+    )
+
+    reorder: EnumProperty(
+        name="Point Order",
+        description="Sort each object's points along a space-filling curve before writing. "
+                    "Improves compression and streaming locality in viewers",
+        items=[
+            ('NONE', "Original", "Keep Blender's point order"),
+            ('MORTON', "Morton", "Z-order curve (fastest to compute)"),
+            ('HILBERT', "Hilbert", "Hilbert curve (best locality)"),
+        ],
+        default='NONE',
+    )
+
+    voxel_size: FloatProperty(
+        name="Voxel Size",
+        description="Downsample to one point per voxel of this size (0 exports every point). "
+                    "Measured in world space when transformations are applied",
+        default=0.0,
+        min=0.0,
+        subtype='DISTANCE',
+    )
+
+    voxel_mode: EnumProperty(
+        name="Voxel Reduction",
+        description="How the points of each voxel are reduced to one",
+        items=[
+            ('FIRST', "First", "Keep the first point of each voxel"),
+            ('MEAN', "Mean", "Average the float attributes of each voxel's points "
+                                 "(normals and rotations stay unit length)"),
+            ('RANDOM', "Random", "Keep a random point of each voxel"),
+        ],
+        default='FIRST',
+    )
+
+    sh_degree: IntProperty(
+        name="SH Degree",
+        description="Highest spherical harmonics degree to export. Coefficients of higher "
+                    "degrees are skipped entirely (0 keeps only the base color)",
+        default=3,
+        min=0,
+        max=3,
+    )
+
+    @staticmethod
+    def get_non_splat_names(objects):
+        return utils.get_non_splat_names(objects)
+
+    def get_chunk_size(self):
+        return self.chunk_size if self.use_streaming else 0
+
+    def get_objects(self, context, objects, apply_modifiers, profile=None):
+        profile = profile or NULL_PROFILE
+        with profile.stage('evaluate'):
+            depsgraph = context.evaluated_depsgraph_get() if apply_modifiers else None
+
+        objects_to_export = []
+        for obj in objects:
+            final_obj = obj
+            if apply_modifiers:
+                with profile.stage('evaluate', obj.name):
+                    final_obj = obj.evaluated_get(depsgraph)
+
+            if utils.is_gaussian_splat(final_obj):
+                objects_to_export.append(final_obj)
+
+        return objects_to_export
+
+
+class ExportSplatCompressedBase:
+    """Shared properties for PlayCanvas compressed PLY exporters."""
+
+    apply_modifiers: BoolProperty(
+        name="Apply Modifiers",
+        description="Apply modifiers to the exported objects (e.g. Geometry Nodes)",
+        default=True,
+    )
+
+    apply_transforms: BoolProperty(
+        name="Apply Transformations",
+        description="Apply object location/rotation/scale to splat positions, and bake the "
+                    "object rotation and scale into each splat's rotation and scale and "
+                    "rotate its higher-order SH coefficients",
+        default=True,
+    )
+
+    voxel_size: FloatProperty(
+        name="Voxel Size",
+        description="Downsample to one point per voxel of this size (0 exports every point). "
+                    "Measured in world space when transformations are applied",
+        default=0.0,
+        min=0.0,
+        subtype='DISTANCE',
+    )
+
+    voxel_mode: EnumProperty(
+        name="Voxel Reduction",
+        description="How the points of each voxel are reduced to one",
+        items=[
+            ('FIRST', "First", "Keep the first point of each voxel"),
+            ('MEAN', "Mean", "Average the float attributes of each voxel's points "
+                                 "(normals and rotations stay unit length)"),
+            ('RANDOM', "Random", "Keep a random point of each voxel"),
+        ],
+        default='FIRST',
+    )
+
+    @staticmethod
+    def get_non_splat_names(objects):
+        return utils.get_non_splat_names(objects)
+
+    def get_objects(self, context, objects, apply_modifiers, profile=None):
+        profile = profile or NULL_PROFILE
+        with profile.stage('evaluate'):
+            depsgraph = context.evaluated_depsgraph_get() if apply_modifiers else None
+
+        objects_to_export = []
+        for obj in objects:
+            final_obj = obj
+            if apply_modifiers:
+                with profile.stage('evaluate', obj.name):
+                    final_obj = obj.evaluated_get(depsgraph)
+
+            if utils.is_gaussian_splat(final_obj):
+                objects_to_export.append(final_obj)
+
+        return objects_to_export
+
+
+class ExportSplatSpzBase:
+    """Shared properties for SPZ exporters."""
+
+    apply_modifiers: BoolProperty(
+        name="Apply Modifiers",
+        description="Apply modifiers to the exported objects (e.g. Geometry Nodes)",
+        default=True,
+    )
+
+    apply_transforms: BoolProperty(
+        name="Apply Transformations",
+        description="Apply object location/rotation/scale to splat positions, and bake the "
+                    "object rotation and scale into each splat's rotation and scale and "
+                    "rotate its higher-order SH coefficients",
         default=True,
     )
 
+    use_streaming: BoolProperty(
+        name="Stream in Chunks",
+        description="Encode each object in fixed-size point ranges so that working memory "
+                    "depends on the chunk size instead of the point count",
+        default=False,
+    )
+
+    chunk_size: IntProperty(
+        name="Chunk Size",
+        description="Number of points processed per chunk when streaming",
+        default=1_000_000,
+        min=1024,
+    )
+
+    voxel_size: FloatProperty(
+        name="Voxel Size",
+        description="Downsample to one point per voxel of this size (0 exports every point). "
+                    "Measured in world space when transformations are applied",
+        default=0.0,
+        min=0.0,
+        subtype='DISTANCE',
+    )
+
+    voxel_mode: EnumProperty(
+        name="Voxel Reduction",
+        description="How the points of each voxel are reduced to one",
+        items=[
+            ('FIRST', "First", "Keep the first point of each voxel"),
+            ('MEAN', "Mean", "Average the float attributes of each voxel's points "
+                                 "(normals and rotations stay unit length)"),
+            ('RANDOM', "Random", "Keep a random point of each voxel"),
+        ],
+        default='FIRST',
+    )
+
     @staticmethod
     def get_non_splat_names(objects):
         return utils.get_non_splat_names(objects)
 
-    def get_objects(self, context, objects, apply_modifiers):
-        depsgraph = context.evaluated_depsgraph_get() if apply_modifiers else None
+    def get_chunk_size(self):
+        return self.chunk_size if self.use_streaming else 0
+
+    def get_objects(self, context, objects, apply_modifiers, profile=None):
+        profile = profile or NULL_PROFILE
+        with profile.stage('evaluate'):
+            depsgraph = context.evaluated_depsgraph_get() if apply_modifiers else None
 
         objects_to_export = []
         for obj in objects:
             final_obj = obj
             if apply_modifiers:
-                final_obj = obj.evaluated_get(depsgraph)
+                with profile.stage('evaluate', obj.name):
+                    final_obj = obj.evaluated_get(depsgraph)
 
             if utils.is_gaussian_splat(final_obj):
                 objects_to_export.append(final_obj)
 
         return objects_to_export
+
+
+class ExportPLYOctreeBase:
+    """Shared properties for octree LOD tile exporters."""
+
+    apply_modifiers: BoolProperty(
+        name="Apply Modifiers",
+        description="Apply modifiers to the exported objects (e.g. Geometry Nodes)",
+        default=True,
+    )
+
+    apply_transforms: BoolProperty(
+        name="Apply Transformations",
+        description="Apply object transformations (Location, Rotation, Scale) to the exported data",
+        default=True,
+    )
+
+    node_points: IntProperty(
+        name="Points per Node",
+        description="Target average number of points per octree tile; sets the octree depth",
+        default=100_000,
+        min=1000,
+    )
+
+    batch_size: IntProperty(
+        name="Batch Size",
+        description="Number of points bucketed into tiles at a time. Bounds the memory of "
+                    "tile construction; each object's attributes are still read whole",
+        default=1_000_000,
+        min=1024,
+    )
+
+    @staticmethod
+    def get_non_pointcloud_names(objects):
+        return utils.get_non_pointcloud_names(objects)
+
+    def get_objects(self, context, objects, apply_modifiers, profile=None):
+        profile = profile or NULL_PROFILE
+        with profile.stage('evaluate'):
+            depsgraph = context.evaluated_depsgraph_get() if apply_modifiers else None
+
+        objects_to_export = []
+        for obj in objects:
+            final_obj = obj
+            if apply_modifiers:
+                with profile.stage('evaluate', obj.name):
+                    final_obj = obj.evaluated_get(depsgraph)
+
+            if final_obj.type == 'POINTCLOUD':
+                objects_to_export.append(final_obj)
+
+        return objects_to_export
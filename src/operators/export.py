@@ -1,12 +1,18 @@
 from bpy.props import BoolProperty, StringProperty
 from bpy.types import Operator
 from bpy_extras.io_utils import ExportHelper
-from .base import ExportPLYBase, ExportSplatBase, ExportSplatBinBase
-from ..formats import export_ply, export_splat_ply, export_splat_bin
+from .base import (
+    ExportCacheBase, ExportPLYBase, ExportProfileBase, ExportSplatBase, ExportSplatBinBase,
+    ExportSplatCompressedBase, ExportSplatSpzBase, ExportPLYOctreeBase,
+)
+from ..formats import (
+    export_ply, export_ply_sequence, export_splat_ply, export_splat_bin, export_splat_compressed,
+    export_splat_spz, export_ply_octree,
+)
 from ..ui.prompt_manager import check_prompts
 
 
-class ExportPLYMenu(Operator, ExportHelper, ExportPLYBase):
+class ExportPLYMenu(Operator, ExportHelper, ExportPLYBase, ExportProfileBase):
     """Export Point Cloud Data to PLY (Menu)"""
     bl_idname = "export_mesh.ply_pcd"
     bl_label = "Point Cloud (.ply)"
@@ -29,6 +35,21 @@ class ExportPLYMenu(Operator, ExportHelper, ExportPLYBase):
         layout.prop(self, "use_ascii")
         layout.prop(self, "apply_modifiers")
         layout.prop(self, "apply_transforms")
+        layout.prop(self, "use_streaming")
+        if self.use_streaming:
+            layout.prop(self, "chunk_size")
+        if not self.use_frame_range:
+            layout.prop(self, "threads")
+            layout.prop(self, "use_mmap")
+        layout.prop(self, "reorder")
+        layout.prop(self, "voxel_size")
+        if self.voxel_size > 0:
+            layout.prop(self, "voxel_mode")
+        layout.prop(self, "quantize")
+        layout.prop(self, "use_frame_range")
+        layout.prop(self, "use_profile")
+        if self.use_profile:
+            layout.prop(self, "write_profile")
         layout.prop(self, "selection_only")
 
         source = context.selected_objects if self.selection_only else list(context.scene.objects)
@@ -41,12 +62,29 @@ class ExportPLYMenu(Operator, ExportHelper, ExportPLYBase):
 
     def execute(self, context):
         source_objects = context.selected_objects if self.selection_only else context.scene.objects
-        objects = self.get_objects(context, source_objects, self.apply_modifiers)
+        profile = self.get_profile()
+        if self.use_frame_range:
+            success, message = export_ply_sequence(
+                context.scene,
+                lambda: self.get_objects(context, source_objects, self.apply_modifiers, profile),
+                self.filepath, self.get_frames(context.scene), self.use_ascii, self.apply_transforms,
+                chunk_size=self.get_chunk_size(), reorder=self.reorder,
+                voxel_size=self.voxel_size, voxel_mode=self.voxel_mode, quantize=self.quantize,
+                profile=profile,
+            )
+        else:
+            objects = self.get_objects(context, source_objects, self.apply_modifiers, profile)
 
-        success, message = export_ply(objects, self.filepath, self.use_ascii, self.apply_transforms)
+            success, message = export_ply(
+                objects, self.filepath, self.use_ascii, self.apply_transforms,
+                chunk_size=self.get_chunk_size(), threads=self.threads, use_mmap=self.use_mmap,
+                reorder=self.reorder, voxel_size=self.voxel_size, voxel_mode=self.voxel_mode,
+                quantize=self.quantize,
+                profile=profile,
+            )
 
         if success:
-            self.report({'INFO'}, message)
+            self.report({'INFO'}, message + self.save_profile(profile))
             check_prompts()
             return {'FINISHED'}
         else:
@@ -54,7 +92,7 @@ class ExportPLYMenu(Operator, ExportHelper, ExportPLYBase):
             return {'CANCELLED'}
 
 
-class ExportPLYPanel(Operator, ExportPLYBase):
+class ExportPLYPanel(Operator, ExportPLYBase, ExportCacheBase, ExportProfileBase):
     """Export Point Cloud Data to PLY (Panel)"""
     bl_idname = "export_mesh.ply_pcd_panel"
     bl_label = "Point Cloud (.ply)"
@@ -73,6 +111,25 @@ class ExportPLYPanel(Operator, ExportPLYBase):
         layout.prop(self, "use_ascii")
         layout.prop(self, "apply_modifiers")
         layout.prop(self, "apply_transforms")
+        layout.prop(self, "use_streaming")
+        if self.use_streaming:
+            layout.prop(self, "chunk_size")
+        if not self.use_frame_range:
+            layout.prop(self, "threads")
+            layout.prop(self, "use_mmap")
+        layout.prop(self, "reorder")
+        layout.prop(self, "voxel_size")
+        if self.voxel_size > 0:
+            layout.prop(self, "voxel_mode")
+        layout.prop(self, "quantize")
+        layout.prop(self, "use_frame_range")
+        layout.prop(self, "use_profile")
+        if self.use_profile:
+            layout.prop(self, "write_profile")
+        if not self.use_frame_range:
+            layout.prop(self, "use_cache")
+            if self.use_cache:
+                layout.prop(self, "cache_size")
 
         candidates = []
         if hasattr(context, "collection") and context.collection:
@@ -98,16 +155,33 @@ class ExportPLYPanel(Operator, ExportPLYBase):
             self.report({'WARNING'}, "No objects found to export (checked Collection and Selection).")
             return {'CANCELLED'}
 
-        objects = self.get_objects(context, candidates, self.apply_modifiers)
+        profile = self.get_profile()
+        if self.use_frame_range:
+            success, message = export_ply_sequence(
+                context.scene, lambda: self.get_objects(context, candidates, self.apply_modifiers, profile),
+                self.filepath, self.get_frames(context.scene), self.use_ascii, self.apply_transforms,
+                chunk_size=self.get_chunk_size(), reorder=self.reorder,
+                voxel_size=self.voxel_size, voxel_mode=self.voxel_mode, quantize=self.quantize,
+                profile=profile,
+            )
+        else:
+            objects = self.get_objects(context, candidates, self.apply_modifiers, profile)
 
-        if not objects:
-            self.report({'WARNING'}, "No Point Cloud objects found in the target collection/selection.")
-            return {'CANCELLED'}
+            if not objects:
+                self.report({'WARNING'}, "No Point Cloud objects found in the target collection/selection.")
+                return {'CANCELLED'}
 
-        success, message = export_ply(objects, self.filepath, self.use_ascii, self.apply_transforms)
+            success, message = export_ply(
+                objects, self.filepath, self.use_ascii, self.apply_transforms,
+                chunk_size=self.get_chunk_size(), threads=self.threads, use_mmap=self.use_mmap,
+                reorder=self.reorder, voxel_size=self.voxel_size, voxel_mode=self.voxel_mode,
+                quantize=self.quantize,
+                cache=self.get_cache(),
+                profile=profile,
+            )
 
         if success:
-            self.report({'INFO'}, message)
+            self.report({'INFO'}, message + self.save_profile(profile))
             check_prompts()
             return {'FINISHED'}
         else:
@@ -115,7 +189,7 @@ class ExportPLYPanel(Operator, ExportPLYBase):
             return {'CANCELLED'}
 
 
-class ExportSplatMenu(Operator, ExportHelper, ExportSplatBase):
+class ExportSplatMenu(Operator, ExportHelper, ExportSplatBase, ExportProfileBase):
     """Export Gaussian Splat Data to PLY (Menu)"""
     bl_idname = "export_mesh.ply_splat"
     bl_label = "Gaussian Splat (.ply)"
@@ -138,6 +212,19 @@ class ExportSplatMenu(Operator, ExportHelper, ExportSplatBase):
         layout.prop(self, "use_ascii")
         layout.prop(self, "apply_modifiers")
         layout.prop(self, "apply_transforms")
+        layout.prop(self, "use_streaming")
+        if self.use_streaming:
+            layout.prop(self, "chunk_size")
+        layout.prop(self, "threads")
+        layout.prop(self, "use_mmap")
+        layout.prop(self, "reorder")
+        layout.prop(self, "voxel_size")
+        if self.voxel_size > 0:
+            layout.prop(self, "voxel_mode")
+        layout.prop(self, "sh_degree")
+        layout.prop(self, "use_profile")
+        if self.use_profile:
+            layout.prop(self, "write_profile")
         layout.prop(self, "selection_only")
 
         source = context.selected_objects if self.selection_only else list(context.scene.objects)
@@ -150,12 +237,19 @@ class ExportSplatMenu(Operator, ExportHelper, ExportSplatBase):
 
     def execute(self, context):
         source_objects = context.selected_objects if self.selection_only else context.scene.objects
-        objects = self.get_objects(context, source_objects, self.apply_modifiers)
+        profile = self.get_profile()
+        objects = self.get_objects(context, source_objects, self.apply_modifiers, profile)
 
-        success, message = export_splat_ply(objects, self.filepath, self.use_ascii, self.apply_transforms)
+        success, message = export_splat_ply(
+            objects, self.filepath, self.use_ascii, self.apply_transforms,
+            chunk_size=self.get_chunk_size(), threads=self.threads, use_mmap=self.use_mmap,
+            reorder=self.reorder, voxel_size=self.voxel_size, voxel_mode=self.voxel_mode,
+            sh_degree=self.sh_degree,
+            profile=profile,
+        )
 
         if success:
-            self.report({'INFO'}, message)
+            self.report({'INFO'}, message + self.save_profile(profile))
             check_prompts()
             return {'FINISHED'}
         else:
@@ -163,7 +257,7 @@ class ExportSplatMenu(Operator, ExportHelper, ExportSplatBase):
             return {'CANCELLED'}
 
 
-class ExportSplatPanel(Operator, ExportSplatBase):
+class ExportSplatPanel(Operator, ExportSplatBase, ExportCacheBase, ExportProfileBase):
     """Export Gaussian Splat Data to PLY (Panel)"""
     bl_idname = "export_mesh.ply_splat_panel"
     bl_label = "Gaussian Splat (.ply)"
@@ -182,6 +276,22 @@ class ExportSplatPanel(Operator, ExportSplatBase):
         layout.prop(self, "use_ascii")
         layout.prop(self, "apply_modifiers")
         layout.prop(self, "apply_transforms")
+        layout.prop(self, "use_streaming")
+        if self.use_streaming:
+            layout.prop(self, "chunk_size")
+        layout.prop(self, "threads")
+        layout.prop(self, "use_mmap")
+        layout.prop(self, "reorder")
+        layout.prop(self, "voxel_size")
+        if self.voxel_size > 0:
+            layout.prop(self, "voxel_mode")
+        layout.prop(self, "sh_degree")
+        layout.prop(self, "use_profile")
+        if self.use_profile:
+            layout.prop(self, "write_profile")
+        layout.prop(self, "use_cache")
+        if self.use_cache:
+            layout.prop(self, "cache_size")
 
         candidates = []
         if hasattr(context, "collection") and context.collection:
@@ -207,16 +317,24 @@ class ExportSplatPanel(Operator, ExportSplatBase):
             self.report({'WARNING'}, "No objects found to export (checked Collection and Selection).")
             return {'CANCELLED'}
 
-        objects = self.get_objects(context, candidates, self.apply_modifiers)
+        profile = self.get_profile()
+        objects = self.get_objects(context, candidates, self.apply_modifiers, profile)
 
         if not objects:
             self.report({'WARNING'}, "No Gaussian Splat objects found in the target collection/selection.")
             return {'CANCELLED'}
 
-        success, message = export_splat_ply(objects, self.filepath, self.use_ascii, self.apply_transforms)
+        success, message = export_splat_ply(
+            objects, self.filepath, self.use_ascii, self.apply_transforms,
+            chunk_size=self.get_chunk_size(), threads=self.threads, use_mmap=self.use_mmap,
+            reorder=self.reorder, voxel_size=self.voxel_size, voxel_mode=self.voxel_mode,
+            sh_degree=self.sh_degree,
+            cache=self.get_cache(),
+            profile=profile,
+        )
 
         if success:
-            self.report({'INFO'}, message)
+            self.report({'INFO'}, message + self.save_profile(profile))
             check_prompts()
             return {'FINISHED'}
         else:
@@ -224,7 +342,7 @@ class ExportSplatPanel(Operator, ExportSplatBase):
             return {'CANCELLED'}
 
 
-class ExportSplatBinMenu(Operator, ExportHelper, ExportSplatBinBase):
+class ExportSplatBinMenu(Operator, ExportHelper, ExportSplatBinBase, ExportProfileBase):
     """Export Gaussian Splat to compact .splat binary format (Menu)"""
     bl_idname = "export_mesh.splat"
     bl_label = "Gaussian Splat (.splat)"
@@ -246,6 +364,18 @@ class ExportSplatBinMenu(Operator, ExportHelper, ExportSplatBinBase):
         layout = self.layout
         layout.prop(self, "apply_modifiers")
         layout.prop(self, "apply_transforms")
+        layout.prop(self, "use_streaming")
+        if self.use_streaming:
+            layout.prop(self, "chunk_size")
+        layout.prop(self, "threads")
+        layout.prop(self, "use_mmap")
+        layout.prop(self, "reorder")
+        layout.prop(self, "voxel_size")
+        if self.voxel_size > 0:
+            layout.prop(self, "voxel_mode")
+        layout.prop(self, "use_profile")
+        if self.use_profile:
+            layout.prop(self, "write_profile")
         layout.prop(self, "selection_only")
 
         source = context.selected_objects if self.selection_only else list(context.scene.objects)
@@ -258,12 +388,18 @@ class ExportSplatBinMenu(Operator, ExportHelper, ExportSplatBinBase):
 
     def execute(self, context):
         source_objects = context.selected_objects if self.selection_only else context.scene.objects
-        objects = self.get_objects(context, source_objects, self.apply_modifiers)
+        profile = self.get_profile()
+        objects = self.get_objects(context, source_objects, self.apply_modifiers, profile)
 
-        success, message = export_splat_bin(objects, self.filepath, self.apply_transforms)
+        success, message = export_splat_bin(
+            objects, self.filepath, self.apply_transforms,
+            chunk_size=self.get_chunk_size(), threads=self.threads, use_mmap=self.use_mmap,
+            reorder=self.reorder, voxel_size=self.voxel_size, voxel_mode=self.voxel_mode,
+            profile=profile,
+        )
 
         if success:
-            self.report({'INFO'}, message)
+            self.report({'INFO'}, message + self.save_profile(profile))
             check_prompts()
             return {'FINISHED'}
         else:
@@ -271,7 +407,7 @@ class ExportSplatBinMenu(Operator, ExportHelper, ExportSplatBinBase):
             return {'CANCELLED'}
 
 
-class ExportSplatBinPanel(Operator, ExportSplatBinBase):
+class ExportSplatBinPanel(Operator, ExportSplatBinBase, ExportCacheBase, ExportProfileBase):
     """Export Gaussian Splat to compact .splat binary format (Panel)"""
     bl_idname = "export_mesh.splat_panel"
     bl_label = "Gaussian Splat (.splat)"
@@ -289,6 +425,152 @@ class ExportSplatBinPanel(Operator, ExportSplatBinBase):
         layout = self.layout
         layout.prop(self, "apply_modifiers")
         layout.prop(self, "apply_transforms")
+        layout.prop(self, "use_streaming")
+        if self.use_streaming:
+            layout.prop(self, "chunk_size")
+        layout.prop(self, "threads")
+        layout.prop(self, "use_mmap")
+        layout.prop(self, "reorder")
+        layout.prop(self, "voxel_size")
+        if self.voxel_size > 0:
+            layout.prop(self, "voxel_mode")
+        layout.prop(self, "use_profile")
+        if self.use_profile:
+            layout.prop(self, "write_profile")
+        layout.prop(self, "use_cache")
+        if self.use_cache:
+            layout.prop(self, "cache_size")
+
+        candidates = []
+        if hasattr(context, "collection") and context.collection:
+            candidates = list(context.collection.all_objects)
+        if not candidates:
+            candidates = list(context.selected_objects)
+
+        skipped = self.get_non_splat_names(candidates)
+        if skipped:
+            box = layout.box()
+            box.label(text=f"{len(skipped)} non-Splat object(s) will be skipped:", icon='ERROR')
+            for name in skipped:
+                box.label(text=f"  \u2022 {name}", icon='BLANK1')
+
+    def execute(self, context):
+        candidates = []
+        if hasattr(context, "collection") and context.collection:
+            candidates = list(context.collection.all_objects)
+        if not candidates:
+            candidates = list(context.selected_objects)
+
+        if not candidates:
+            self.report({'WARNING'}, "No objects found to export (checked Collection and Selection).")
+            return {'CANCELLED'}
+
+        profile = self.get_profile()
+        objects = self.get_objects(context, candidates, self.apply_modifiers, profile)
+
+        if not objects:
+            self.report({'WARNING'}, "No Gaussian Splat objects found in the target collection/selection.")
+            return {'CANCELLED'}
+
+        success, message = export_splat_bin(
+            objects, self.filepath, self.apply_transforms,
+            chunk_size=self.get_chunk_size(), threads=self.threads, use_mmap=self.use_mmap,
+            reorder=self.reorder, voxel_size=self.voxel_size, voxel_mode=self.voxel_mode,
+            cache=self.get_cache(),
+            profile=profile,
+        )
+
+        if success:
+            self.report({'INFO'}, message + self.save_profile(profile))
+            check_prompts()
+            return {'FINISHED'}
+        else:
+            self.report({'ERROR'}, message)
+            return {'CANCELLED'}
+
+
+class ExportSplatCompressedMenu(Operator, ExportHelper, ExportSplatCompressedBase, ExportProfileBase):
+    """Export Gaussian Splat to PlayCanvas compressed PLY (Menu)"""
+    bl_idname = "export_mesh.splat_compressed"
+    bl_label = "Gaussian Splat (.compressed.ply)"
+    bl_options = {'PRESET', 'UNDO'}
+
+    filename_ext = ".compressed.ply"
+    filter_glob: StringProperty(
+        default="*.ply",
+        options={'HIDDEN'},
+    )
+
+    selection_only: BoolProperty(
+        name="Selection Only",
+        description="Export only selected objects",
+        default=True,
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "apply_modifiers")
+        layout.prop(self, "apply_transforms")
+        layout.prop(self, "voxel_size")
+        if self.voxel_size > 0:
+            layout.prop(self, "voxel_mode")
+        layout.prop(self, "use_profile")
+        if self.use_profile:
+            layout.prop(self, "write_profile")
+        layout.prop(self, "selection_only")
+
+        source = context.selected_objects if self.selection_only else list(context.scene.objects)
+        skipped = self.get_non_splat_names(source)
+        if skipped:
+            box = layout.box()
+            box.label(text=f"{len(skipped)} non-Splat object(s) will be skipped:", icon='ERROR')
+            for name in skipped:
+                box.label(text=f"  \u2022 {name}", icon='BLANK1')
+
+    def execute(self, context):
+        source_objects = context.selected_objects if self.selection_only else context.scene.objects
+        profile = self.get_profile()
+        objects = self.get_objects(context, source_objects, self.apply_modifiers, profile)
+
+        success, message = export_splat_compressed(
+            objects, self.filepath, self.apply_transforms,
+            voxel_size=self.voxel_size, voxel_mode=self.voxel_mode,
+            profile=profile,
+        )
+
+        if success:
+            self.report({'INFO'}, message + self.save_profile(profile))
+            check_prompts()
+            return {'FINISHED'}
+        else:
+            self.report({'ERROR'}, message)
+            return {'CANCELLED'}
+
+
+class ExportSplatCompressedPanel(Operator, ExportSplatCompressedBase, ExportProfileBase):
+    """Export Gaussian Splat to PlayCanvas compressed PLY (Panel)"""
+    bl_idname = "export_mesh.splat_compressed_panel"
+    bl_label = "Gaussian Splat (.compressed.ply)"
+    bl_options = {'PRESET', 'UNDO'}
+
+    filepath: StringProperty(
+        name="File Path",
+        description="Filepath used for exporting the file",
+        maxlen=1024,
+        subtype='FILE_PATH',
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "apply_modifiers")
+        layout.prop(self, "apply_transforms")
+        layout.prop(self, "voxel_size")
+        if self.voxel_size > 0:
+            layout.prop(self, "voxel_mode")
+        layout.prop(self, "use_profile")
+        if self.use_profile:
+            layout.prop(self, "write_profile")
 
         candidates = []
         if hasattr(context, "collection") and context.collection:
@@ -314,16 +596,283 @@ class ExportSplatBinPanel(Operator, ExportSplatBinBase):
             self.report({'WARNING'}, "No objects found to export (checked Collection and Selection).")
             return {'CANCELLED'}
 
-        objects = self.get_objects(context, candidates, self.apply_modifiers)
+        profile = self.get_profile()
+        objects = self.get_objects(context, candidates, self.apply_modifiers, profile)
 
         if not objects:
             self.report({'WARNING'}, "No Gaussian Splat objects found in the target collection/selection.")
             return {'CANCELLED'}
 
-        success, message = export_splat_bin(objects, self.filepath, self.apply_transforms)
+        success, message = export_splat_compressed(
+            objects, self.filepath, self.apply_transforms,
+            voxel_size=self.voxel_size, voxel_mode=self.voxel_mode,
+            profile=profile,
+        )
+
+        if success:
+            self.report({'INFO'}, message + self.save_profile(profile))
+            check_prompts()
+            return {'FINISHED'}
+        else:
+            self.report({'ERROR'}, message)
+            return {'CANCELLED'}
+
+
+class ExportSplatSpzMenu(Operator, ExportHelper, ExportSplatSpzBase, ExportProfileBase):
+    """Export Gaussian Splat to SPZ (gzip-compressed, quantized) (Menu)"""
+    bl_idname = "export_mesh.splat_spz"
+    bl_label = "Gaussian Splat (.spz)"
+    bl_options = {'PRESET', 'UNDO'}
+
+    filename_ext = ".spz"
+    filter_glob: StringProperty(
+        default="*.spz",
+        options={'HIDDEN'},
+    )
+
+    selection_only: BoolProperty(
+        name="Selection Only",
+        description="Export only selected objects",
+        default=True,
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "apply_modifiers")
+        layout.prop(self, "apply_transforms")
+        layout.prop(self, "use_streaming")
+        if self.use_streaming:
+            layout.prop(self, "chunk_size")
+        layout.prop(self, "voxel_size")
+        if self.voxel_size > 0:
+            layout.prop(self, "voxel_mode")
+        layout.prop(self, "use_profile")
+        if self.use_profile:
+            layout.prop(self, "write_profile")
+        layout.prop(self, "selection_only")
+
+        source = context.selected_objects if self.selection_only else list(context.scene.objects)
+        skipped = self.get_non_splat_names(source)
+        if skipped:
+            box = layout.box()
+            box.label(text=f"{len(skipped)} non-Splat object(s) will be skipped:", icon='ERROR')
+            for name in skipped:
+                box.label(text=f"  \u2022 {name}", icon='BLANK1')
+
+    def execute(self, context):
+        source_objects = context.selected_objects if self.selection_only else context.scene.objects
+        profile = self.get_profile()
+        objects = self.get_objects(context, source_objects, self.apply_modifiers, profile)
+
+        success, message = export_splat_spz(
+            objects, self.filepath, self.apply_transforms, chunk_size=self.get_chunk_size(),
+            voxel_size=self.voxel_size, voxel_mode=self.voxel_mode,
+            profile=profile,
+        )
+
+        if success:
+            self.report({'INFO'}, message + self.save_profile(profile))
+            check_prompts()
+            return {'FINISHED'}
+        else:
+            self.report({'ERROR'}, message)
+            return {'CANCELLED'}
+
+
+class ExportSplatSpzPanel(Operator, ExportSplatSpzBase, ExportProfileBase):
+    """Export Gaussian Splat to SPZ (gzip-compressed, quantized) (Panel)"""
+    bl_idname = "export_mesh.splat_spz_panel"
+    bl_label = "Gaussian Splat (.spz)"
+    bl_options = {'PRESET', 'UNDO'}
+
+    filepath: StringProperty(
+        name="File Path",
+        description="Filepath used for exporting the file",
+        maxlen=1024,
+        subtype='FILE_PATH',
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "apply_modifiers")
+        layout.prop(self, "apply_transforms")
+        layout.prop(self, "use_streaming")
+        if self.use_streaming:
+            layout.prop(self, "chunk_size")
+        layout.prop(self, "voxel_size")
+        if self.voxel_size > 0:
+            layout.prop(self, "voxel_mode")
+        layout.prop(self, "use_profile")
+        if self.use_profile:
+            layout.prop(self, "write_profile")
+
+        candidates = []
+        if hasattr(context, "collection") and context.collection:
+            candidates = list(context.collection.all_objects)
+        if not candidates:
+            candidates = list(context.selected_objects)
+
+        skipped = self.get_non_splat_names(candidates)
+        if skipped:
+            box = layout.box()
+            box.label(text=f"{len(skipped)} non-Splat object(s) will be skipped:", icon='ERROR')
+            for name in skipped:
+                box.label(text=f"  \u2022 {name}", icon='BLANK1')
+
+    def execute(self, context):
+        candidates = []
+        if hasattr(context, "collection") and context.collection:
+            candidates = list(context.collection.all_objects)
+        if not candidates:
+            candidates = list(context.selected_objects)
+
+        if not candidates:
+            self.report({'WARNING'}, "No objects found to export (checked Collection and Selection).")
+            return {'CANCELLED'}
+
+        profile = self.get_profile()
+        objects = self.get_objects(context, candidates, self.apply_modifiers, profile)
+
+        if not objects:
+            self.report({'WARNING'}, "No Gaussian Splat objects found in the target collection/selection.")
+            return {'CANCELLED'}
+
+        success, message = export_splat_spz(
+            objects, self.filepath, self.apply_transforms, chunk_size=self.get_chunk_size(),
+            voxel_size=self.voxel_size, voxel_mode=self.voxel_mode,
+            profile=profile,
+        )
+
+        if success:
+            self.report({'INFO'}, message + self.save_profile(profile))
+            check_prompts()
+            return {'FINISHED'}
+        else:
+            self.report({'ERROR'}, message)
+            return {'CANCELLED'}
+
+
+class ExportPLYOctreeMenu(Operator, ExportHelper, ExportPLYOctreeBase, ExportProfileBase):
+    """Export Point Cloud Data as octree LOD tiles (Menu)"""
+    bl_idname = "export_mesh.ply_octree"
+    bl_label = "Point Cloud Octree (.json)"
+    bl_options = {'PRESET', 'UNDO'}
+
+    filename_ext = ".json"
+    filter_glob: StringProperty(
+        default="*.json",
+        options={'HIDDEN'},
+    )
+
+    selection_only: BoolProperty(
+        name="Selection Only",
+        description="Export only selected objects",
+        default=True,
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "apply_modifiers")
+        layout.prop(self, "apply_transforms")
+        layout.prop(self, "node_points")
+        layout.prop(self, "batch_size")
+        layout.prop(self, "use_profile")
+        if self.use_profile:
+            layout.prop(self, "write_profile")
+        layout.prop(self, "selection_only")
+
+        source = context.selected_objects if self.selection_only else list(context.scene.objects)
+        skipped = self.get_non_pointcloud_names(source)
+        if skipped:
+            box = layout.box()
+            box.label(text=f"{len(skipped)} non-PointCloud object(s) will be skipped:", icon='ERROR')
+            for name in skipped:
+                box.label(text=f"  \u2022 {name}", icon='BLANK1')
+
+    def execute(self, context):
+        source_objects = context.selected_objects if self.selection_only else context.scene.objects
+        profile = self.get_profile()
+        objects = self.get_objects(context, source_objects, self.apply_modifiers, profile)
+
+        success, message = export_ply_octree(
+            objects, self.filepath, self.apply_transforms,
+            node_points=self.node_points, batch_size=self.batch_size,
+            profile=profile,
+        )
+
+        if success:
+            self.report({'INFO'}, message + self.save_profile(profile))
+            check_prompts()
+            return {'FINISHED'}
+        else:
+            self.report({'ERROR'}, message)
+            return {'CANCELLED'}
+
+
+class ExportPLYOctreePanel(Operator, ExportPLYOctreeBase, ExportProfileBase):
+    """Export Point Cloud Data as octree LOD tiles (Panel)"""
+    bl_idname = "export_mesh.ply_octree_panel"
+    bl_label = "Point Cloud Octree (.json)"
+    bl_options = {'PRESET', 'UNDO'}
+
+    filepath: StringProperty(
+        name="File Path",
+        description="Filepath used for exporting the file",
+        maxlen=1024,
+        subtype='FILE_PATH',
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "apply_modifiers")
+        layout.prop(self, "apply_transforms")
+        layout.prop(self, "node_points")
+        layout.prop(self, "batch_size")
+        layout.prop(self, "use_profile")
+        if self.use_profile:
+            layout.prop(self, "write_profile")
+
+        candidates = []
+        if hasattr(context, "collection") and context.collection:
+            candidates = list(context.collection.all_objects)
+        if not candidates:
+            candidates = list(context.selected_objects)
+
+        skipped = self.get_non_pointcloud_names(candidates)
+        if skipped:
+            box = layout.box()
+            box.label(text=f"{len(skipped)} non-PointCloud object(s) will be skipped:", icon='ERROR')
+            for name in skipped:
+                box.label(text=f"  \u2022 {name}", icon='BLANK1')
+
+    def execute(self, context):
+        candidates = []
+        if hasattr(context, "collection") and context.collection:
+            candidates = list(context.collection.all_objects)
+        if not candidates:
+            candidates = list(context.selected_objects)
+
+        if not candidates:
+            self.report({'WARNING'}, "No objects found to export (checked Collection and Selection).")
+            return {'CANCELLED'}
+
+        profile = self.get_profile()
+        objects = self.get_objects(context, candidates, self.apply_modifiers, profile)
+
+        if not objects:
+            self.report({'WARNING'}, "No Point Cloud objects found in the target collection/selection.")
+            return {'CANCELLED'}
+
+        success, message = export_ply_octree(
+            objects, self.filepath, self.apply_transforms,
+            node_points=self.node_points, batch_size=self.batch_size,
+            profile=profile,
+        )
 
         if success:
-            self.report({'INFO'}, message)
+            self.report({'INFO'}, message + self.save_profile(profile))
             check_prompts()
             return {'FINISHED'}
         else:
@@ -0,0 +1,47 @@
+import bpy
+
+# Exporters Panel file handlers (Blender 4.2+), one per Panel export operator
+
+classes = []
+
+if hasattr(bpy.types, "FileHandler"):
+    class PLYFileHandler(bpy.types.FileHandler):
+        bl_idname = "ply_pcd_handler"
+        bl_label = "Point Cloud (.ply)"
+        bl_export_operator = "export_mesh.ply_pcd_panel"
+        bl_file_extensions = ".ply"
+
+    class SplatFileHandler(bpy.types.FileHandler):
+        bl_idname = "ply_splat_handler"
+        bl_label = "Gaussian Splat (.ply)"
+        bl_export_operator = "export_mesh.ply_splat_panel"
+        bl_file_extensions = ".ply"
+
+    class SplatBinFileHandler(bpy.types.FileHandler):
+        bl_idname = "splat_bin_handler"
+        bl_label = "Gaussian Splat (.splat)"
+        bl_export_operator = "export_mesh.splat_panel"
+        bl_file_extensions = ".splat"
+
+    class SplatCompressedFileHandler(bpy.types.FileHandler):
+        bl_idname = "splat_compressed_handler"
+        bl_label = "Gaussian Splat (.compressed.ply)"
+        bl_export_operator = "export_mesh.splat_compressed_panel"
+        bl_file_extensions = ".ply"
+
+    class SpzFileHandler(bpy.types.FileHandler):
+        bl_idname = "splat_spz_handler"
+        bl_label = "Gaussian Splat (.spz)"
+        bl_export_operator = "export_mesh.splat_spz_panel"
+        bl_file_extensions = ".spz"
+
+    class PLYOctreeFileHandler(bpy.types.FileHandler):
+        bl_idname = "ply_octree_handler"
+        bl_label = "Point Cloud Octree (.json)"
+        bl_export_operator = "export_mesh.ply_octree_panel"
+        bl_file_extensions = ".json"
+
+    classes = [
+        PLYFileHandler, SplatFileHandler, SplatBinFileHandler, SplatCompressedFileHandler,
+        SpzFileHandler, PLYOctreeFileHandler,
+    ]
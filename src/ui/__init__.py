@@ -18,3 +18,18 @@ def menu_func_export_splat(self, context):
 def menu_func_export_splat_bin(self, context):
     from ..operators.export import ExportSplatBinMenu
     self.layout.operator(ExportSplatBinMenu.bl_idname, text="Gaussian Splat (.splat)")
+
+
+def menu_func_export_splat_compressed(self, context):
+    from ..operators.export import ExportSplatCompressedMenu
+    self.layout.operator(ExportSplatCompressedMenu.bl_idname, text="Gaussian Splat (.compressed.ply)")
+
+
+def menu_func_export_splat_spz(self, context):
+    from ..operators.export import ExportSplatSpzMenu
+    self.layout.operator(ExportSplatSpzMenu.bl_idname, text="Gaussian Splat (.spz)")
+
+
+def menu_func_export_octree(self, context):
+    from ..operators.export import ExportPLYOctreeMenu
+    self.layout.operator(ExportPLYOctreeMenu.bl_idname, text="Point Cloud Octree (.json)")
@@ -1,6 +1,15 @@
 # Minimum set of attributes that identifies a Gaussian Splat (vs a plain point cloud)
 _SPLAT_REQUIRED_ATTRS = frozenset({'scale_0', 'rot_0', 'opacity', 'f_dc_0'})
 
+# Splat classification of original objects, for the export dialogs' draw():
+# object pointer → (data pointer, update counters when classified, is_splat).
+# An entry is reused until the depsgraph reports an update of the object or
+# of its data, or the object is given other data.
+_splat_cache = {}
+
+# ID pointer → number of depsgraph updates seen for it (see on_depsgraph_update)
+_update_counts = {}
+
 
 def get_non_pointcloud_names(objects):
     """Returns names of objects whose base type is not POINTCLOUD."""
@@ -11,10 +20,42 @@ def is_gaussian_splat(obj) -> bool:
     """Returns True if the object is a PointCloud with Gaussian Splat attributes."""
     if obj.type != 'POINTCLOUD':
         return False
-    attr_names = {a.name for a in obj.data.attributes}
-    return _SPLAT_REQUIRED_ATTRS.issubset(attr_names)
+    attributes = obj.data.attributes
+    return all(attributes.get(name) is not None for name in _SPLAT_REQUIRED_ATTRS)
+
+
+def is_gaussian_splat_cached(obj) -> bool:
+    """
+    is_gaussian_splat() of an original (not evaluated) object, remembered
+    between calls so redraws cost a few lookups per object whatever its
+    attribute count.
+    """
+    if obj.type != 'POINTCLOUD':
+        return False
+    obj_ptr = obj.as_pointer()
+    data_ptr = obj.data.as_pointer()
+    stamp = (_update_counts.get(obj_ptr, 0), _update_counts.get(data_ptr, 0))
+    entry = _splat_cache.get(obj_ptr)
+    if entry is not None and entry[0] == data_ptr and entry[1] == stamp:
+        return entry[2]
+    result = is_gaussian_splat(obj)
+    _splat_cache[obj_ptr] = (data_ptr, stamp, result)
+    return result
 
 
 def get_non_splat_names(objects) -> list:
     """Returns names of objects that are not Gaussian Splats."""
-    return [obj.name for obj in objects if not is_gaussian_splat(obj)]
+    return [obj.name for obj in objects if not is_gaussian_splat_cached(obj)]
+
+
+def on_depsgraph_update(scene, depsgraph):
+    """depsgraph_update_post handler: invalidates the classification of updated objects and data."""
+    for update in depsgraph.updates:
+        ptr = update.id.original.as_pointer()
+        _update_counts[ptr] = _update_counts.get(ptr, 0) + 1
+
+
+def clear_classification_cache(*_):
+    """load_post / undo_post / redo_post handler: IDs may have been freed or reloaded."""
+    _splat_cache.clear()
+    _update_counts.clear()